@@ -1,24 +1,38 @@
-import copy
+from __future__ import annotations
+
+import itertools
+from collections import deque
 
 from .initial_world_context import create_initial_world_context
-from .baml_client.types import (
-    NPC, Arc, Choice, PlayerAttribute, PlayerProfile, PlayerStats, 
-    WorldSeed, District, Faction, Technology, WorldContext, PlayerState, 
-    Situation, ArcSeed, StatRequirement, ActionAndReasoning, ShortActionAndReasoning,
-    CreateNPC, CreateFaction, CreateTechnology, CreateSituation, CreateMultipleSituations, CreateChoices, 
-    CreateArc, GoToSituation, UpOneLevel, DownOneLevel, GoToArcRoot, 
-    GoToWorldRoot, GetSituationById, FindMissingSituations, IdentifyNarrativeGaps
-)
-from .baml_client.async_client import b
+from .graph_layout import GraphLayout
+from .entity_index import WorldEntityIndex
+from .prompt_cache import ContextOrder, PromptCacheStats
+from .speculation import SpeculativeSituationCache
+from .step_memo import StepInputMemo
+from .resilience import CallFailed, DeadLetterQueue, ResilientClient
+from .run_metrics import RunMetrics
+from .memory_profile import MemoryProfiler, unique_contexts, walk_tree, with_world_memory_profiler
+from .span_trace import SpanTracer, mark_step, traced, with_world_tracer
+from .step_profile import StepProfiler, with_world_profiler
+from .serialization import export_situation, write_json
+from .trusted_models import fork_context
+from .lazy_baml import baml_types
 import logging
-from typing import List, Dict, Optional, Set, Tuple, Union
-from dataclasses import dataclass
-import json
+from typing import TYPE_CHECKING, Any, List, Dict, Optional, Set, Tuple, Union
+from dataclasses import dataclass, field
 import os
 from datetime import datetime
 from tqdm import tqdm
 from enum import Enum
 
+if TYPE_CHECKING:
+    from .baml_client.types import (
+        Arc, Choice, WorldSeed, WorldContext, PlayerState, Situation, ActionAndReasoning,
+        CreateNPC, CreateFaction, CreateTechnology, CreateSituation, CreateMultipleSituations, CreateChoices, 
+        CreateArc, GoToSituation, UpOneLevel, DownOneLevel, GoToArcRoot, 
+        GoToWorldRoot, GetSituationById, FindMissingSituations, IdentifyNarrativeGaps, ShortActionAndReasoning
+    )
+
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s_%(name)s]:  %(message)s")
 logger = logging.getLogger("agent_worldgen")
 
@@ -34,26 +48,48 @@ class AgentAction(Enum):
     NAVIGATE_DOWN = "Navigate down to child situation"
     COMPLETE_GENERATION = "Complete the generation process"
 
-@dataclass
+# Agent actions that only move the cursor through the tree
+NAVIGATION_ACTIONS = {"GoToSituation", "UpOneLevel", "DownOneLevel", "GoToArcRoot"}
+# Agent actions that leave the world unchanged
+READ_ONLY_ACTIONS = NAVIGATION_ACTIONS | {"GetSituationById", "FindMissingSituations", "IdentifyNarrativeGaps"}
+
+_node_ids = itertools.count()
+
+
+@dataclass(slots=True, eq=False)
 class AgentWorldStateNode:
-    """A node in the world state tree with additional tracking for agentic generation."""
+    """A node in the world state tree with additional tracking for agentic generation.
+
+    Children are kept in two parallel lists (choice ids and nodes), and each node
+    records the choice that led to it. Contexts are copy-on-write (see
+    trusted_models.py), so a new node shares the current context instead of
+    deep-copying it.
+    """
     context: WorldContext
     current_situation: Optional[Situation] = None
     current_arc: Optional[Arc] = None
-    parent: Optional['AgentWorldStateNode'] = None
-    children: Optional[Dict[str, 'AgentWorldStateNode']] = None  # choice_id -> child node
+    parent: Optional[AgentWorldStateNode] = None
     generation_step: int = 0
+    incoming_choice_id: Optional[str] = None
+    node_id: int = field(default_factory=lambda: next(_node_ids))
+    child_choice_ids: List[str] = field(default_factory=list)
+    child_nodes: List[AgentWorldStateNode] = field(default_factory=list)
     
-    def __post_init__(self):
-        if self.children is None:
-            self.children = {}
-    
-    def add_child(self, choice_id: str, child: 'AgentWorldStateNode') -> None:
+    def add_child(self, choice_id: str, child: AgentWorldStateNode) -> None:
         """Add a child node resulting from a specific choice."""
-        if self.children is None:
-            self.children = {}
-        self.children[choice_id] = child
+        if choice_id in self.child_choice_ids:
+            self.child_nodes[self.child_choice_ids.index(choice_id)] = child
+        else:
+            self.child_choice_ids.append(choice_id)
+            self.child_nodes.append(child)
         child.parent = self
+        child.incoming_choice_id = choice_id
+
+    def get_child(self, choice_id: str) -> Optional[AgentWorldStateNode]:
+        """Get the child reached by a choice, or None."""
+        if choice_id not in self.child_choice_ids:
+            return None
+        return self.child_nodes[self.child_choice_ids.index(choice_id)]
 
     def distance_to_complete_situation(self) -> int:
         """Calculate distance to nearest situation where all choices lead to situations."""
@@ -74,12 +110,11 @@ class AgentWorldStateNode:
                 return 1 if has_incomplete_choices else 0  # Distance is 1 if situation is incomplete, 0 if complete
             
         # BFS to find nearest complete situation
-        queue = []  # List of (node, distance) tuples
-        queue.append((self, 0))
-        visited = {id(self)}
+        queue = deque([(self, 0)])  # (node, distance) pairs
+        visited = {self.node_id}
         
         while queue:
-            node, distance = queue.pop(0)
+            node, distance = queue.popleft()
             
             if (node.current_situation and 
                 node.current_situation.choices and 
@@ -87,19 +122,19 @@ class AgentWorldStateNode:
                 return distance
                 
             # Add parent if exists
-            if node.parent and id(node.parent) not in visited:
-                visited.add(id(node.parent))
+            if node.parent and node.parent.node_id not in visited:
+                visited.add(node.parent.node_id)
                 queue.append((node.parent, distance + 1))
                 
             # Add children
-            if node.children:
-                for child in node.children.values():
-                    if id(child) not in visited:
-                        visited.add(id(child))
-                        queue.append((child, distance + 1))
+            for child in node.child_nodes:
+                if child.node_id not in visited:
+                    visited.add(child.node_id)
+                    queue.append((child, distance + 1))
         
         return 999999  # No complete situation found (large number instead of infinity)
 
+
 class AgentWorld:
     """Agentic version of the world generator where an AI agent makes decisions about generation."""
     
@@ -114,6 +149,10 @@ class AgentWorld:
         
         # Initialize the same world context as the original implementation
         self.initial_world_context: WorldContext = create_initial_world_context(seed)
+        # Merges near-duplicate NPCs, factions and technologies as they are created
+        self.entity_index = WorldEntityIndex.from_context(self.initial_world_context)
+        # Keeps entity lists in first-seen order across branches so prompts share a stable prefix
+        self.context_order = ContextOrder.from_context(self.initial_world_context)
         
         # Initialize player state
         self.player_state: PlayerState = self._create_initial_player_state()
@@ -128,9 +167,40 @@ class AgentWorld:
         
         # Generation tracking
         self._generation_step = 0
+        # Viewer layout, kept across steps so existing nodes don't move
+        self._graph_layout = GraphLayout()
+        # Step files are compact unless pretty_saves is set
+        self.pretty_saves = False
         
         # Track previous actions and reasoning for the new approach
         self.previous_actions_and_reasoning: List[ShortActionAndReasoning] = []
+
+        # Token usage of every BAML call, used to measure provider prompt cache hits
+        from baml_py import Collector
+        self.collector = Collector(name=f"agent_worldgen_{seed.name}")
+        self.prompt_cache_stats = PromptCacheStats()
+        # LLM calls retry per function and fail over between clients; failed actions are retried per step
+        self.llm = ResilientClient(collector=self.collector)
+        self.dead_letters = DeadLetterQueue()
+        self.max_consecutive_agent_failures = 3
+        # One folder per generation run; metrics.jsonl gets a record per saved step
+        self.run_folder = f"saves/{self.seed.name}_agent_{self.generation_run_started_at.strftime('%Y%m%d_%H%M%S')}"
+        self.metrics = RunMetrics(self.run_folder, self.collector)
+        # Set to a MemoryProfiler to add memory growth and structure sizes to every metrics record
+        self.memory_profiler: Optional[MemoryProfiler] = None
+        # Set to a SpanTracer to write a Chrome trace of the run to trace.json
+        self.tracer: Optional[SpanTracer] = None
+        # Set to a StepProfiler to write a cProfile per step and sampled stacks of the run
+        self.profiler: Optional[StepProfiler] = None
+
+        # Generates situations for open choices while the agent is deciding (see speculation.py)
+        self.speculate = True
+        self.speculative_situations = SpeculativeSituationCache()
+
+        # Caches open choices, distances and context ordering until the world changes (see step_memo.py)
+        self.step_memo = StepInputMemo()
+        # Navigation that lands on a finished situation moves on to the nearest open one without asking the agent
+        self.resolve_navigation = True
         
         # Create saves directory if it doesn't exist
         os.makedirs("saves", exist_ok=True)
@@ -139,21 +209,21 @@ class AgentWorld:
 
     def _create_initial_player_state(self) -> PlayerState:
         """Create the initial player state."""
-        return PlayerState(
+        return baml_types.PlayerState(
             name="Sierra Violet",
-            stats=PlayerStats(
+            stats=baml_types.PlayerStats(
                 might=10, insight=10, nimbleness=10, destiny=10,
                 savvy=10, expertise=10, tenacity=10, station=10,
                 opulence=10, celebrity=10, integrity=10, allure=10, lineage=10,
             ),
             attributes=[
-                PlayerAttribute(
+                baml_types.PlayerAttribute(
                     id="grudge",
                     type="status",
                     description="A grudge against Vextros.",
                 ),
             ],
-            profile=PlayerProfile(
+            profile=baml_types.PlayerProfile(
                 narrative_summary="A grungy, 27 year old woman with a grudge against Vextros.",
                 key_traits=["grungy", "27 year old", "woman", "grudge against Vextros"],
                 background_hints=[],
@@ -182,18 +252,11 @@ class AgentWorld:
 
     def get_incomplete_situations(self) -> List[Situation]:
         """Get all situations that have choices without next_situation_id."""
-        incomplete = []
-        for situation in self.all_situations.values():
-            if any(choice.next_situation_id is None for choice in situation.choices):
-                incomplete.append(situation)
-        return incomplete
+        return [situation for situation, _ in self.get_all_incomplete_situations_with_choices()]
 
     def get_dead_end_count(self) -> int:
         """Count the number of dead-end choices (choices without next_situation_id)."""
-        count = 0
-        for situation in self.all_situations.values():
-            count += sum(1 for choice in situation.choices if choice.next_situation_id is None)
-        return count
+        return sum(len(choices) for _, choices in self.get_all_incomplete_situations_with_choices())
 
     def get_incomplete_choices_at_current_situation(self) -> List[Choice]:
         """Get all choices at the current situation that don't have a next_situation_id."""
@@ -203,17 +266,36 @@ class AgentWorld:
 
     def get_all_incomplete_situations_with_choices(self) -> List[Tuple[Situation, List[Choice]]]:
         """Get all situations that have incomplete choices, with the incomplete choices listed."""
-        incomplete_situations = []
-        for situation in self.all_situations.values():
-            incomplete_choices = [choice for choice in situation.choices if choice.next_situation_id is None]
-            if incomplete_choices:
-                incomplete_situations.append((situation, incomplete_choices))
-        return incomplete_situations
+        def scan() -> List[Tuple[Situation, List[Choice]]]:
+            incomplete_situations = []
+            for situation in self.all_situations.values():
+                incomplete_choices = [choice for choice in situation.choices if choice.next_situation_id is None]
+                if incomplete_choices:
+                    incomplete_situations.append((situation, incomplete_choices))
+            return incomplete_situations
+        return self.step_memo.get("incomplete_situations", None, scan)
+
+    def get_situation_neighbours(self) -> Dict[str, List[str]]:
+        """Situation id -> ids of situations linked to it by a choice, in either direction."""
+        def build() -> Dict[str, List[str]]:
+            neighbours: Dict[str, List[str]] = {situation_id: [] for situation_id in self.all_situations}
+            for situation in self.all_situations.values():
+                for choice in situation.choices:
+                    if choice.next_situation_id in neighbours:
+                        neighbours[situation.id].append(choice.next_situation_id)
+                        neighbours[choice.next_situation_id].append(situation.id)
+            return neighbours
+        return self.step_memo.get("situation_neighbours", None, build)
+
+    def get_distance_to_complete(self) -> int:
+        """Distance from the current node to the nearest complete situation."""
+        node = self._current_node
+        return self.step_memo.get("distance_to_complete", node.node_id, node.distance_to_complete_situation)
 
     async def ask_agent_for_action(self) -> ActionAndReasoning:
         """Ask the agent to select the next action to take using the new approach."""
         # Get context about current state
-        distance_to_complete = self._current_node.distance_to_complete_situation()
+        distance_to_complete = self.get_distance_to_complete()
         
         # Get incomplete choices at current situation
         incomplete_choices = self.get_incomplete_choices_at_current_situation()
@@ -233,9 +315,15 @@ class AgentWorld:
         logger.info(f"Distance to complete: {distance_to_complete}")
         
         # Use the new BAML function that returns ActionAndReasoning
-        action_and_reasoning = await b.SelectGenerationToolAndGenerate(
+        # The node's context is shared with other nodes, so the prompt gets a canonically ordered fork
+        context = self.world_context
+        prompt_context = self.step_memo.get(
+            "canonical_context", (self._current_node.node_id, id(context)),
+            lambda: self.context_order.canonicalize(fork_context(context))
+        )
+        action_and_reasoning = await self.llm.SelectGenerationToolAndGenerate(
             previous_actions_and_reasoning=self.previous_actions_and_reasoning,
-            world_context=self.world_context,
+            world_context=prompt_context,
             player_state=self.player_state,
             current_situation=self.current_situation,
             arcs_at_this_situation=arcs_at_this_situation,
@@ -244,6 +332,7 @@ class AgentWorld:
         
         return action_and_reasoning
 
+    @traced("execute_agent_action", "agent")
     async def execute_agent_action(self, action_and_reasoning: ActionAndReasoning) -> bool:
         """Execute the selected agent action. Returns True if world state was modified."""
         action = action_and_reasoning.action
@@ -254,50 +343,58 @@ class AgentWorld:
         logger.info(f"Reasoning: {reasoning}")
         logger.info(f"Generated description: {generated_description}")
         
-        try:
-            # Handle different action types
-            if isinstance(action, CreateNPC):
-                return await self._handle_create_npc(action)
-            elif isinstance(action, CreateFaction):
-                return await self._handle_create_faction(action)
-            elif isinstance(action, CreateTechnology):
-                return await self._handle_create_technology(action)
-            elif isinstance(action, CreateSituation):
-                return await self._handle_create_situation(action)
-            elif isinstance(action, CreateMultipleSituations):
-                return await self._handle_create_multiple_situations(action)
-            elif isinstance(action, CreateChoices):
-                return await self._handle_create_choices(action)
-            elif isinstance(action, CreateArc):
-                return await self._handle_create_arc(action)
-            elif isinstance(action, GoToSituation):
-                return await self._handle_go_to_situation(action)
-            elif isinstance(action, UpOneLevel):
-                return self._handle_up_one_level(action)
-            elif isinstance(action, DownOneLevel):
-                return self._handle_down_one_level(action)
-            elif isinstance(action, GoToArcRoot):
-                return self._handle_go_to_arc_root(action)
-            elif isinstance(action, GoToWorldRoot):
-                return self._handle_go_to_world_root(action)
-            elif isinstance(action, GetSituationById):
-                return await self._handle_get_situation_by_id(action)
-            elif isinstance(action, FindMissingSituations):
-                return await self._handle_find_missing_situations(action)
-            elif isinstance(action, IdentifyNarrativeGaps):
-                return await self._handle_identify_narrative_gaps(action)
-            else:
-                logger.warning(f"Unknown action type: {type(action)}")
-                return False
-        except Exception as e:
-            logger.error(f"Error executing action {type(action).__name__}: {e}")
+        # A failing action is queued and retried at the end of the step
+        result = await self.dead_letters.run(
+            f"agent action {type(action).__name__}",
+            lambda: self._dispatch_agent_action(action)
+        )
+        if type(action).__name__ not in READ_ONLY_ACTIONS:
+            self.step_memo.bump()
+        return bool(result)
+
+    async def _dispatch_agent_action(self, action) -> bool:
+        """Run the handler for an agent action."""
+        # Handle different action types
+        if isinstance(action, baml_types.CreateNPC):
+            return await self._handle_create_npc(action)
+        elif isinstance(action, baml_types.CreateFaction):
+            return await self._handle_create_faction(action)
+        elif isinstance(action, baml_types.CreateTechnology):
+            return await self._handle_create_technology(action)
+        elif isinstance(action, baml_types.CreateSituation):
+            return await self._handle_create_situation(action)
+        elif isinstance(action, baml_types.CreateMultipleSituations):
+            return await self._handle_create_multiple_situations(action)
+        elif isinstance(action, baml_types.CreateChoices):
+            return await self._handle_create_choices(action)
+        elif isinstance(action, baml_types.CreateArc):
+            return await self._handle_create_arc(action)
+        elif isinstance(action, baml_types.GoToSituation):
+            return await self._handle_go_to_situation(action)
+        elif isinstance(action, baml_types.UpOneLevel):
+            return self._handle_up_one_level(action)
+        elif isinstance(action, baml_types.DownOneLevel):
+            return self._handle_down_one_level(action)
+        elif isinstance(action, baml_types.GoToArcRoot):
+            return self._handle_go_to_arc_root(action)
+        elif isinstance(action, baml_types.GoToWorldRoot):
+            return self._handle_go_to_world_root(action)
+        elif isinstance(action, baml_types.GetSituationById):
+            return await self._handle_get_situation_by_id(action)
+        elif isinstance(action, baml_types.FindMissingSituations):
+            return await self._handle_find_missing_situations(action)
+        elif isinstance(action, baml_types.IdentifyNarrativeGaps):
+            return await self._handle_identify_narrative_gaps(action)
+        else:
+            logger.warning(f"Unknown action type: {type(action)}")
             return False
 
     async def _handle_create_npc(self, action: CreateNPC) -> bool:
         """Handle CreateNPC action."""
         new_npc = action.generated_npc
-        new_context = copy.deepcopy(self.world_context)
-        new_context.npcs.append(new_npc)
+        new_context = fork_context(self.world_context)
+        if not self.entity_index.merge_into(new_context, "npcs", [new_npc]):
+            return False
         self._current_node.context = new_context
         logger.info(f"Created new NPC: {new_npc.name}")
         return True
@@ -305,8 +402,9 @@ class AgentWorld:
     async def _handle_create_faction(self, action: CreateFaction) -> bool:
         """Handle CreateFaction action."""
         new_faction = action.generated_faction
-        new_context = copy.deepcopy(self.world_context)
-        new_context.factions.append(new_faction)
+        new_context = fork_context(self.world_context)
+        if not self.entity_index.merge_into(new_context, "factions", [new_faction]):
+            return False
         self._current_node.context = new_context
         logger.info(f"Created new faction: {new_faction.name}")
         return True
@@ -314,8 +412,9 @@ class AgentWorld:
     async def _handle_create_technology(self, action: CreateTechnology) -> bool:
         """Handle CreateTechnology action."""
         new_technology = action.generated_technology
-        new_context = copy.deepcopy(self.world_context)
-        new_context.technologies.append(new_technology)
+        new_context = fork_context(self.world_context)
+        if not self.entity_index.merge_into(new_context, "technologies", [new_technology]):
+            return False
         self._current_node.context = new_context
         logger.info(f"Created new technology: {new_technology.name}")
         return True
@@ -323,6 +422,10 @@ class AgentWorld:
     async def _handle_create_situation(self, action: CreateSituation) -> bool:
         """Handle CreateSituation action."""
         new_situation = action.generated_situation
+        if new_situation.id in self.all_situations:
+            # Already added, e.g. by this action's first run before a later call failed (see DeadLetterQueue)
+            logger.warning(f"Situation {new_situation.id} already exists, skipping")
+            return False
         
         # Add the situation to the current arc and global tracking
         if self.current_arc:
@@ -335,7 +438,7 @@ class AgentWorld:
         
         # Create a new child node for this situation
         new_node = AgentWorldStateNode(
-            context=copy.deepcopy(self.world_context),
+            context=self.world_context,
             current_situation=new_situation,
             current_arc=self.current_arc,
             generation_step=self._generation_step + 1
@@ -359,15 +462,19 @@ class AgentWorld:
             logger.info(f"Created standalone situation: {new_situation.id}")
         
         logger.info(f"Created new situation: {new_situation.id}")
+        await self._fill_open_choices_from_speculation()
         return True
 
     async def _handle_create_multiple_situations(self, action: CreateMultipleSituations) -> bool:
         """Handle CreateMultipleSituations action."""
-        new_situations = action.generated_situations
-        
-        if not new_situations:
+        if not action.generated_situations:
             logger.warning("No situations provided in CreateMultipleSituations action")
             return False
+        # Situations already added by an earlier run of this action are skipped (see DeadLetterQueue)
+        new_situations = [situation for situation in action.generated_situations if situation.id not in self.all_situations]
+        if not new_situations:
+            logger.warning("All situations of the CreateMultipleSituations action already exist")
+            return False
         
         # Get incomplete choices at current situation
         incomplete_choices = self.get_incomplete_choices_at_current_situation()
@@ -387,7 +494,7 @@ class AgentWorld:
             
             # Create a new child node for this situation
             new_node = AgentWorldStateNode(
-                context=copy.deepcopy(self.world_context),
+                context=self.world_context,
                 current_situation=new_situation,
                 current_arc=self.current_arc,
                 generation_step=self._generation_step + 1
@@ -407,8 +514,58 @@ class AgentWorld:
             
             logger.info(f"Created situation {i+1}/{len(new_situations)}: {new_situation.id}")
         
+        await self._fill_open_choices_from_speculation()
         return True
 
+    def _start_speculation(self) -> None:
+        """Start generating situations for the open choices at the current situation."""
+        if not self.speculate or self.current_arc is None:
+            return
+        situation, arc = self.current_situation, self.current_arc
+        world_context, player_state = self.world_context, self.player_state
+        for choice in self.get_incomplete_choices_at_current_situation():
+            self.speculative_situations.start(
+                (situation.id, choice.id),
+                self._generation_step,
+                lambda choice=choice: self.llm.GenerateSituationForChoice(
+                    world_context=world_context,
+                    player_state=player_state,
+                    arc=arc,
+                    choice=choice
+                ),
+            )
+
+    async def _fill_open_choices_from_speculation(self) -> int:
+        """Connect speculatively generated situations to choices the agent left open here.
+
+        Returns:
+            Number of choices filled
+        """
+        filled = 0
+        for choice in self.get_incomplete_choices_at_current_situation():
+            new_situation = await self.speculative_situations.take((self.current_situation.id, choice.id))
+            if new_situation is None:
+                continue
+            if new_situation.id in self.all_situations:
+                logger.warning(f"Speculative situation {new_situation.id} clashes with an existing situation, skipping")
+                continue
+            if self.current_arc:
+                self.current_arc.situations.append(new_situation)
+            self.all_situations[new_situation.id] = new_situation
+            for new_choice in new_situation.choices:
+                await self.apply_choice_diffs(new_choice)
+            new_node = AgentWorldStateNode(
+                context=self.world_context,
+                current_situation=new_situation,
+                current_arc=self.current_arc,
+                generation_step=self._generation_step + 1
+            )
+            choice.next_situation_id = new_situation.id
+            self._current_node.add_child(choice.id, new_node)
+            filled += 1
+            logger.info(f"Connected speculative situation {new_situation.id} to choice {choice.id}")
+        return filled
+
     async def _handle_create_choices(self, action: CreateChoices) -> bool:
         """Handle CreateChoices action."""
         new_choices = action.generated_choices
@@ -417,7 +574,11 @@ class AgentWorld:
             logger.warning("Cannot create choices without current situation")
             return False
         
-        # Add new choices to the current situation
+        # Add new choices to the current situation, skipping any it already has (see DeadLetterQueue)
+        existing_ids = {choice.id for choice in self.current_situation.choices}
+        new_choices = [choice for choice in new_choices if choice.id not in existing_ids]
+        if not new_choices:
+            return False
         self.current_situation.choices.extend(new_choices)
         
         # Apply choice diffs for any new choices
@@ -430,6 +591,10 @@ class AgentWorld:
     async def _handle_create_arc(self, action: CreateArc) -> bool:
         """Handle CreateArc action."""
         new_arc = action.generated_arc
+        if any(arc is new_arc for arc in self.arcs):
+            # Already added by an earlier run of this action (see DeadLetterQueue)
+            return False
+        new_arc.seed.factions_involved = [self.entity_index.resolve_faction(f) for f in new_arc.seed.factions_involved]
         
         # Add to global tracking
         self.arcs.append(new_arc)
@@ -467,7 +632,7 @@ class AgentWorld:
             else:
                 # Create a new node for this situation
                 new_node = AgentWorldStateNode(
-                    context=copy.deepcopy(self.world_context),
+                    context=self.world_context,
                     current_situation=target_situation,
                     current_arc=self.current_arc,
                     generation_step=self._generation_step
@@ -491,7 +656,7 @@ class AgentWorld:
 
     def _handle_down_one_level(self, action: DownOneLevel) -> bool:
         """Handle DownOneLevel action."""
-        if not self._current_node.children:
+        if not self._current_node.child_nodes:
             # If no children in tree, check if current situation has choices that lead to situations
             if self.current_situation and self.current_situation.choices:
                 for choice in self.current_situation.choices:
@@ -499,21 +664,19 @@ class AgentWorld:
                         target_situation = self.all_situations[choice.next_situation_id]
                         
                         # Create a new child node for this situation if it doesn't exist
-                        if self._current_node.children is None:
-                            self._current_node.children = {}
-                        
-                        if choice.id not in self._current_node.children:
+                        if self._current_node.get_child(choice.id) is None:
                             new_node = AgentWorldStateNode(
-                                context=copy.deepcopy(self.world_context),
+                                context=self.world_context,
                                 current_situation=target_situation,
                                 current_arc=self.current_arc,
                                 generation_step=self._generation_step
                             )
                             self._current_node.add_child(choice.id, new_node)
+                            # The tree grew, so cached distances are stale
+                            self.step_memo.bump()
                         
                         # Navigate to the child
-                        if self._current_node.children:
-                            self._current_node = self._current_node.children[choice.id]
+                        self._current_node = self._current_node.get_child(choice.id)
                         logger.info(f"Navigated down via choice: {choice.id} to situation: {target_situation.id}")
                         return True
             
@@ -521,8 +684,8 @@ class AgentWorld:
             return False
         
         # Navigate to the first available child
-        choice_id = next(iter(self._current_node.children.keys()))
-        self._current_node = self._current_node.children[choice_id]
+        choice_id = self._current_node.child_choice_ids[0]
+        self._current_node = self._current_node.child_nodes[0]
         logger.info(f"Navigated down via choice: {choice_id}")
         return True
 
@@ -542,7 +705,7 @@ class AgentWorld:
         else:
             # Create a new node for the root situation
             new_node = AgentWorldStateNode(
-                context=copy.deepcopy(self.world_context),
+                context=self.world_context,
                 current_situation=root_situation,
                 current_arc=self.current_arc,
                 generation_step=self._generation_step
@@ -579,41 +742,73 @@ class AgentWorld:
         logger.info(f"Identified {len(narrative_gaps)} narrative gaps")
         return True
 
+    def _nearest_open_situation_id(self) -> Optional[str]:
+        """The closest situation (by choice links) to the current one that has open choices."""
+        open_ids = {situation.id for situation in self.get_incomplete_situations()}
+        neighbours = self.get_situation_neighbours()
+        queue = deque([self.current_situation.id])
+        visited = {self.current_situation.id}
+        while queue:
+            situation_id = queue.popleft()
+            if situation_id in open_ids:
+                return situation_id
+            for neighbour_id in neighbours.get(situation_id, []):
+                if neighbour_id not in visited:
+                    visited.add(neighbour_id)
+                    queue.append(neighbour_id)
+        return None
+
+    async def _resolve_navigation(self) -> None:
+        """Move on from a finished situation to the nearest one with open choices.
+
+        The agent would only navigate again from here, so this saves it the calls.
+        """
+        if self.get_incomplete_choices_at_current_situation():
+            return
+        target_id = self._nearest_open_situation_id()
+        if target_id is None:
+            return
+        go_to = baml_types.GoToSituation(tool_name="go_to_situation", reason="Nearest open situation", situation_id=target_id)
+        if not await self._handle_go_to_situation(go_to):
+            return
+        self.step_memo.navigation_resolved += 1
+        self.previous_actions_and_reasoning.append(baml_types.ShortActionAndReasoning(
+            action="GoToSituation",
+            generated_description=f"Moved to {target_id}, the nearest situation with open choices",
+            reasoning="Resolved without the agent: the situation reached had no open choices left"
+        ))
+        logger.info(f"Resolved navigation to situation with open choices: {target_id}")
+
     def _find_node_with_situation(self, situation_id: str) -> Optional[AgentWorldStateNode]:
-        """Find the node that contains the given situation."""
-        def search_node(node: AgentWorldStateNode) -> Optional[AgentWorldStateNode]:
+        """Find the node that contains the given situation (depth-first, pre-order)."""
+        stack = [self._root_node]
+        while stack:
+            node = stack.pop()
             if node.current_situation and node.current_situation.id == situation_id:
                 return node
-            
-            if node.children:
-                for child in node.children.values():
-                    result = search_node(child)
-                    if result:
-                        return result
-            
-            return None
-        
-        return search_node(self._root_node)
+            stack.extend(reversed(node.child_nodes))
+        return None
 
+    @traced("apply_choice_diffs", "context")
     async def apply_choice_diffs(self, new_choice: Choice):
         """Apply new_npcs, new_factions, new_technologies to the world context whenever a new Choice is created."""
-        new_context = copy.deepcopy(self.world_context)
+        new_context = fork_context(self.world_context)
         context_changed = False
         
-        if new_choice.new_npcs:
-            new_context.npcs.extend(new_choice.new_npcs)
-            context_changed = True
-            logger.info(f"Added {len(new_choice.new_npcs)} new NPCs to world context")
-            
         if new_choice.new_factions:
-            new_context.factions.extend(new_choice.new_factions)
-            context_changed = True
-            logger.info(f"Added {len(new_choice.new_factions)} new factions to world context")
+            added = self.entity_index.merge_into(new_context, "factions", new_choice.new_factions)
+            context_changed = context_changed or added > 0
+            logger.info(f"Added {added} new factions to world context")
+
+        if new_choice.new_npcs:
+            added = self.entity_index.merge_into(new_context, "npcs", new_choice.new_npcs)
+            context_changed = context_changed or added > 0
+            logger.info(f"Added {added} new NPCs to world context")
             
         if new_choice.new_technologies:
-            new_context.technologies.extend(new_choice.new_technologies)
-            context_changed = True
-            logger.info(f"Added {len(new_choice.new_technologies)} new technologies to world context")
+            added = self.entity_index.merge_into(new_context, "technologies", new_choice.new_technologies)
+            context_changed = context_changed or added > 0
+            logger.info(f"Added {added} new technologies to world context")
         
         if context_changed:
             # Update the current node's context
@@ -622,7 +817,7 @@ class AgentWorld:
     async def _create_initial_arc(self) -> bool:
         """Create an initial arc for the world."""
         # Generate arc title
-        arc_titles = await b.GenerateArcTitles(
+        arc_titles = await self.llm.GenerateArcTitles(
             world_context=self.world_context,
             player_state=self.player_state,
             count=1
@@ -633,21 +828,22 @@ class AgentWorld:
             return False
         
         # Generate arc seed
-        arc_seed = await b.GenerateArcSeed(
+        arc_seed = await self.llm.GenerateArcSeed(
             world_context=self.world_context,
             player_state=self.player_state,
             title=arc_titles[0]
         )
+        arc_seed.factions_involved = [self.entity_index.resolve_faction(f) for f in arc_seed.factions_involved]
         
         # Generate root situation
-        root_situation = await b.GenerateRootSituation(
+        root_situation = await self.llm.GenerateRootSituation(
             world_context=self.world_context,
             player_state=self.player_state,
             arc_seed=arc_seed
         )
         
         # Create the arc
-        new_arc = Arc(
+        new_arc = baml_types.Arc(
             seed=arc_seed,
             situations=[root_situation],
             outcomes=[]
@@ -668,6 +864,15 @@ class AgentWorld:
         logger.info(f"Created initial arc: {arc_seed.title}")
         return True
 
+    def _begin_step(self, name: str) -> None:
+        """Start the next step's span and profile."""
+        mark_step(name)
+        if self.profiler is not None:
+            self.profiler.step(name)
+
+    @with_world_tracer
+    @with_world_profiler
+    @with_world_memory_profiler
     async def generate(self) -> None:
         """Run the agentic generation process."""
         logger.info(f"Starting agentic generation process for world {self.seed.name}")
@@ -676,42 +881,67 @@ class AgentWorld:
         # Start with creating an initial arc if none exists
         if not self.arcs:
             logger.info("Creating initial arc...")
+            self._begin_step("initial_arc")
             await self._create_initial_arc()
+            self.step_memo.bump()
             self._generation_step += 1
             self._save_world_state("initial_arc")
             logger.info(f"Initial arc created and saved as step {self._generation_step}")
         
         # Main generation loop
+        consecutive_agent_failures = 0
         while self._generation_step < self.max_generation_steps:
             logger.info(f"Generation step {self._generation_step}/{self.max_generation_steps}")
+            self._begin_step(f"step_{self._generation_step + 1:02d}")
             
-            # Ask the agent what to do next
-            action_and_reasoning = await self.ask_agent_for_action()
+            # Ask the agent what to do next, pre-generating the likely next situations meanwhile
+            self._start_speculation()
+            try:
+                action_and_reasoning = await self.ask_agent_for_action()
+            except CallFailed as e:
+                # Don't spend a step on a call that never returned an action
+                consecutive_agent_failures += 1
+                logger.error(f"Agent call failed ({consecutive_agent_failures}/{self.max_consecutive_agent_failures}): {e}")
+                if consecutive_agent_failures >= self.max_consecutive_agent_failures:
+                    logger.error("Agent keeps failing, stopping generation early")
+                    break
+                continue
+            consecutive_agent_failures = 0
             
             # Execute the action
             state_changed = await self.execute_agent_action(action_and_reasoning)
             
             # Store the action and reasoning for future steps
-            short_action = ShortActionAndReasoning(
+            short_action = baml_types.ShortActionAndReasoning(
                 action=type(action_and_reasoning.action).__name__,
                 generated_description=action_and_reasoning.generated_description,
                 reasoning=action_and_reasoning.reasoning
             )
             self.previous_actions_and_reasoning.append(short_action)
+            if self.resolve_navigation and type(action_and_reasoning.action).__name__ in NAVIGATION_ACTIONS:
+                await self._resolve_navigation()
             
             # If the agent chose to complete generation, break
-            if isinstance(action_and_reasoning.action, GoToWorldRoot):
+            if isinstance(action_and_reasoning.action, baml_types.GoToWorldRoot):
                 break
             
             # Always advance the generation step and save (regardless of state change)
+            if self.dead_letters.pending:
+                await self.dead_letters.retry_pending()
+                self.step_memo.bump()
             self._generation_step += 1
+            self.speculative_situations.expire(self._generation_step, (
+                (situation.id, choice.id)
+                for situation, choices in self.get_all_incomplete_situations_with_choices()
+                for choice in choices
+            ))
             step_name = f"agent_action_{type(action_and_reasoning.action).__name__.lower()}"
             self._save_world_state(step_name)
             
             # Log current state
             incomplete_count = len(self.get_incomplete_situations())
             dead_end_count = self.get_dead_end_count()
-            distance = self._current_node.distance_to_complete_situation()
+            distance = self.get_distance_to_complete()
             
             logger.info(f"State after step {self._generation_step}:")
             logger.info(f"- Action executed: {type(action_and_reasoning.action).__name__}")
@@ -725,46 +955,52 @@ class AgentWorld:
             logger.info("-" * 40)
         
         # Final save
+        self._begin_step("final_state")
+        self.speculative_situations.cancel_all()
         self._generation_step += 1
         self._save_world_state("final_state")
         
         logger.info("Agentic generation complete!")
         logger.info(f"Generated {len(self.arcs)} arcs with {len(self.all_situations)} situations")
         logger.info(f"Final dead-end count: {self.get_dead_end_count()}")
+        self.prompt_cache_stats.log_summary()
+        speculation = self.speculative_situations.stats
+        logger.info(f"Speculative situations: {speculation.hits}/{speculation.started} used, "
+                    f"{speculation.discarded} discarded, {speculation.failed} failed")
         logger.info("=" * 80)
 
+    @traced("save", "io")
     def _save_world_state(self, step_name: str) -> None:
         """Save the current world state to a JSON file."""
-        timestamp = self.generation_run_started_at.strftime("%Y%m%d_%H%M%S")
-        run_folder = f"saves/{self.seed.name}_agent_{timestamp}"
+        # Measure before building the export, so it doesn't count
+        memory = {"memory": self._measure_memory()} if self.memory_profiler is not None else {}
+        run_folder = self.run_folder
         os.makedirs(run_folder, exist_ok=True)
         
         filename = f"{run_folder}/step_{self._generation_step:02d}_{step_name}.json"
+        self.prompt_cache_stats.observe(self.collector)
         
         # Create the export package
         export_data = {
-            "world_context": self.world_context.dict(),
-            "player_state": self.player_state.dict(),
+            "world_context": self.world_context.model_dump(),
+            "player_state": self.player_state.model_dump(),
+            "entity_aliases": self.entity_index.aliases,
+            "prompt_cache": self.prompt_cache_stats.to_dict(),
+            "speculation": self.speculative_situations.stats.to_dict(),
+            "step_input_memo": self.step_memo.to_dict(),
+            "llm_calls": self.llm.to_dict(),
+            "failed_work": self.dead_letters.to_dict(),
             "generation_step": self._generation_step,
             "step_name": step_name,
             "current_situation_id": self.current_situation.id if self.current_situation else None,
             "current_arc_title": self.current_arc.seed.title if self.current_arc else None,
             "incomplete_situations_count": len(self.get_incomplete_situations()),
             "dead_end_choices_count": self.get_dead_end_count(),
-            "distance_to_complete": self._current_node.distance_to_complete_situation(),
+            "distance_to_complete": self.get_distance_to_complete(),
             "arcs": [{
                 "id": arc.seed.title,
                 "situations": {
-                    situation.id: {
-                        "id": situation.id,
-                        "title": situation.description,
-                        "description": situation.description,
-                        "choices": [choice.dict() for choice in situation.choices],
-                        "stat_requirements": [stat_requirement.dict() for stat_requirement in situation.stat_requirements],
-                        "is_bridge_node": situation.bridgeable,
-                        "next_situations": [choice.next_situation_id for choice in situation.choices if choice.next_situation_id],
-                        "choice_to_situation_mapping": {choice.id: choice.next_situation_id for choice in situation.choices if choice.next_situation_id}
-                    } for situation in arc.situations
+                    situation.id: export_situation(situation) for situation in arc.situations
                 },
                 "bridge_nodes": [
                     situation.id for situation in arc.situations 
@@ -774,6 +1010,25 @@ class AgentWorld:
         }
         
         # Save to file
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2)
-        logger.info(f"Saved agent world state to {filename}")
\ No newline at end of file
+        bytes_written = write_json(filename, export_data, indent=self.pretty_saves)
+        logger.info(f"Saved agent world state to {filename}")
+        layout_file = self._graph_layout.write(filename, export_data["arcs"])
+        self.metrics.record(
+            step=self._generation_step,
+            action=step_name,
+            bytes_saved=os.path.getsize(layout_file) + bytes_written,
+            situations=len(self.all_situations),
+            choices=sum(len(situation.choices) for situation in self.all_situations.values()),
+            npcs=len(self.world_context.npcs),
+            dead_ends=export_data["dead_end_choices_count"],
+            **memory,
+        )
+
+    def _measure_memory(self) -> Dict[str, Any]:
+        nodes = walk_tree(self._root_node)
+        return self.memory_profiler.step([
+            ("situations", list(self.all_situations.values())),
+            ("contexts", unique_contexts(nodes)),
+            ("history", self.previous_actions_and_reasoning),
+            ("tree_nodes", nodes),
+        ])
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""
+Batched choice augmentation.
+
+``AugmentSituationChoices`` resends the world context, player state and the
+whole arc for every situation. ``AugmentSituationsChoices`` takes a group of
+situations from one arc instead; groups are sized by a rough token budget so a
+single call never grows unbounded, and results are split back per situation.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from .baml_client.types import Choice, Situation, SituationChoices
+
+logger = logging.getLogger("worldgen")
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(situation: Situation) -> int:
+    """Rough prompt size of a rendered situation."""
+    return len(json.dumps(situation.model_dump(), ensure_ascii=False)) // CHARS_PER_TOKEN
+
+
+def group_situations(situations: List[Situation], max_group_size: int, token_budget: int) -> List[List[Situation]]:
+    """Split situations into consecutive groups within a size and token budget.
+
+    A situation larger than the budget on its own still gets a group of one.
+    """
+    groups: List[List[Situation]] = []
+    current: List[Situation] = []
+    current_tokens = 0
+    for situation in situations:
+        tokens = estimate_tokens(situation)
+        if current and (len(current) >= max_group_size or current_tokens + tokens > token_budget):
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(situation)
+        current_tokens += tokens
+    if current:
+        groups.append(current)
+    return groups
+
+
+def split_results(group: List[Situation], results: List[SituationChoices]) -> Tuple[Dict[str, List[Choice]], List[Situation]]:
+    """Assign batched results back to their situations.
+
+    Returns:
+        (situation_id -> new choices, situations the model returned nothing for)
+    """
+    group_ids = {situation.id for situation in group}
+    choices_by_situation: Dict[str, List[Choice]] = {}
+    for result in results:
+        if result.situation_id not in group_ids:
+            logger.warning(f"Batched augmentation returned choices for unknown situation {result.situation_id}")
+            continue
+        choices_by_situation.setdefault(result.situation_id, []).extend(result.choices)
+    missing = [situation for situation in group if situation.id not in choices_by_situation]
+    return choices_by_situation, missing
@@ -58,6 +58,34 @@ class AsyncHttpRequest:
         False,
       )
     
+    async def AugmentSituationsChoices(
+        self,
+        world_context: _baml.types.WorldContext,player_state: _baml.types.PlayerState,arc: _baml.types.Arc,situations: List[_baml.types.Situation],
+        baml_options: _baml.BamlCallOptionsModApi = {},
+    ) -> baml_py.HTTPRequest:
+      __tb__ = baml_options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = baml_options.get("client_registry", None)
+      env = _baml.env_vars_to_dict(baml_options.get("env", {}))
+
+      return await self.__runtime.build_request(
+        "AugmentSituationsChoices",
+        {
+          "world_context": world_context,
+          "player_state": player_state,
+          "arc": arc,
+          "situations": situations,
+        },
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        env,
+        False,
+      )
+    
     async def CheckChoiceAttributeNeeds(
         self,
         choice: _baml.types.Choice,world_context: _baml.types.WorldContext,
@@ -428,7 +456,7 @@ class AsyncHttpRequest:
     
     async def GenerateJoinChoices(
         self,
-        world_context: _baml.types.WorldContext,arcs: List[_baml.types.Arc],
+        world_context: _baml.types.WorldContext,arcs: List[_baml.types.Arc],pairs: List[_baml.types.BridgePair],
         baml_options: _baml.BamlCallOptionsModApi = {},
     ) -> baml_py.HTTPRequest:
       __tb__ = baml_options.get("tb", None)
@@ -444,6 +472,7 @@ class AsyncHttpRequest:
         {
           "world_context": world_context,
           "arcs": arcs,
+          "pairs": pairs,
         },
         self.__ctx_manager.get(),
         tb,
@@ -863,6 +892,34 @@ class AsyncHttpStreamRequest:
         True,
       )
     
+    async def AugmentSituationsChoices(
+        self,
+        world_context: _baml.types.WorldContext,player_state: _baml.types.PlayerState,arc: _baml.types.Arc,situations: List[_baml.types.Situation],
+        baml_options: _baml.BamlCallOptionsModApi = {},
+    ) -> baml_py.HTTPRequest:
+      __tb__ = baml_options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = baml_options.get("client_registry", None)
+      env = _baml.env_vars_to_dict(baml_options.get("env", {}))
+
+      return await self.__runtime.build_request(
+        "AugmentSituationsChoices",
+        {
+          "world_context": world_context,
+          "player_state": player_state,
+          "arc": arc,
+          "situations": situations,
+        },
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        env,
+        True,
+      )
+    
     async def CheckChoiceAttributeNeeds(
         self,
         choice: _baml.types.Choice,world_context: _baml.types.WorldContext,
@@ -1233,7 +1290,7 @@ class AsyncHttpStreamRequest:
     
     async def GenerateJoinChoices(
         self,
-        world_context: _baml.types.WorldContext,arcs: List[_baml.types.Arc],
+        world_context: _baml.types.WorldContext,arcs: List[_baml.types.Arc],pairs: List[_baml.types.BridgePair],
         baml_options: _baml.BamlCallOptionsModApi = {},
     ) -> baml_py.HTTPRequest:
       __tb__ = baml_options.get("tb", None)
@@ -1249,6 +1306,7 @@ class AsyncHttpStreamRequest:
         {
           "world_context": world_context,
           "arcs": arcs,
+          "pairs": pairs,
         },
         self.__ctx_manager.get(),
         tb,
@@ -60,6 +60,35 @@ class LlmResponseParser:
 
       return cast(List[_baml.types.Choice], parsed)
     
+    def AugmentSituationsChoices(
+        self,
+        llm_response: str,
+        baml_options: _baml.BamlCallOptionsModApi = {},
+    ) -> List[_baml.types.SituationChoices]:
+      __tb__ = baml_options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = baml_options.get("client_registry", None)
+
+      env = _baml.env_vars_to_dict(baml_options.get("env", {}))
+
+      parsed = self.__runtime.parse_llm_response(
+        "AugmentSituationsChoices",
+        llm_response,
+        _baml.types,
+        _baml.types,
+        _baml.partial_types,
+        False,
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        env,
+      )
+
+      return cast(List[_baml.types.SituationChoices], parsed)
+    
     def CheckChoiceAttributeNeeds(
         self,
         llm_response: str,
@@ -941,6 +970,35 @@ class LlmStreamParser:
 
       return cast(List[_baml.partial_types.Choice], parsed)
     
+    def AugmentSituationsChoices(
+        self,
+        llm_response: str,
+        baml_options: _baml.BamlCallOptionsModApi = {},
+    ) -> List[_baml.partial_types.SituationChoices]:
+      __tb__ = baml_options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = baml_options.get("client_registry", None)
+
+      env = _baml.env_vars_to_dict(baml_options.get("env", {}))
+
+      parsed = self.__runtime.parse_llm_response(
+        "AugmentSituationsChoices",
+        llm_response,
+        _baml.types,
+        _baml.types,
+        _baml.partial_types,
+        True,
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        env,
+      )
+
+      return cast(List[_baml.partial_types.SituationChoices], parsed)
+    
     def CheckChoiceAttributeNeeds(
         self,
         llm_response: str,
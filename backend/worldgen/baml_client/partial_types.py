@@ -64,6 +64,10 @@ class ArcSeed(BaseModel):
     internal_hint: Optional[str] = None
     internal_justification: Optional[str] = None
 
+class BridgePair(BaseModel):
+    from_situation_id: Optional[str] = None
+    to_situation_id: Optional[str] = None
+
 class Choice(BaseModel):
     id: Optional[str] = None
     text: Optional[str] = None
@@ -295,6 +299,10 @@ class Situation(BaseModel):
     internal_hint: Optional[str] = None
     internal_justification: Optional[str] = None
 
+class SituationChoices(BaseModel):
+    situation_id: Optional[str] = None
+    choices: List["Choice"]
+
 class StatDescriptors(BaseModel):
     might_descriptors: Dict[str, Optional[str]]
     insight_descriptors: Dict[str, Optional[str]]
@@ -331,12 +339,12 @@ class UpOneLevel(BaseModel):
 
 class WorldContext(BaseModel):
     seed: Optional["WorldSeed"] = None
+    world_root: Optional["Situation"] = None
+    tension_sliders: Dict[str, Optional[int]]
+    districts: List["District"]
     technologies: List["Technology"]
     factions: List["Faction"]
-    districts: List["District"]
     npcs: List["NPC"]
-    tension_sliders: Dict[str, Optional[int]]
-    world_root: Optional["Situation"] = None
 
 class WorldSeed(BaseModel):
     name: Optional[str] = None
@@ -122,6 +122,34 @@ class BamlSyncClient:
       )
       return cast(List[_baml.types.Choice], raw.cast_to(_baml.types, _baml.types, _baml.partial_types, False))
     
+    def AugmentSituationsChoices(
+        self,
+        world_context: _baml.types.WorldContext,player_state: _baml.types.PlayerState,arc: _baml.types.Arc,situations: List[_baml.types.Situation],
+        baml_options: _baml.BamlCallOptions = {},
+    ) -> List[_baml.types.SituationChoices]:
+      options: _baml.BamlCallOptions = {**self.__baml_options, **(baml_options or {})}
+      __tb__ = options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = options.get("client_registry", None)
+      collector = options.get("collector", None)
+      collectors = collector if isinstance(collector, list) else [collector] if collector is not None else []
+      env = _baml.env_vars_to_dict(options.get("env", {}))
+      raw = self.__runtime.call_function_sync(
+        "AugmentSituationsChoices",
+        {
+          "world_context": world_context,"player_state": player_state,"arc": arc,"situations": situations,
+        },
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        collectors,
+        env,
+      )
+      return cast(List[_baml.types.SituationChoices], raw.cast_to(_baml.types, _baml.types, _baml.partial_types, False))
+    
     def CheckChoiceAttributeNeeds(
         self,
         choice: _baml.types.Choice,world_context: _baml.types.WorldContext,
@@ -516,7 +544,7 @@ class BamlSyncClient:
     
     def GenerateJoinChoices(
         self,
-        world_context: _baml.types.WorldContext,arcs: List[_baml.types.Arc],
+        world_context: _baml.types.WorldContext,arcs: List[_baml.types.Arc],pairs: List[_baml.types.BridgePair],
         baml_options: _baml.BamlCallOptions = {},
     ) -> List[_baml.types.JoinSituationOutput]:
       options: _baml.BamlCallOptions = {**self.__baml_options, **(baml_options or {})}
@@ -532,7 +560,7 @@ class BamlSyncClient:
       raw = self.__runtime.call_function_sync(
         "GenerateJoinChoices",
         {
-          "world_context": world_context,"arcs": arcs,
+          "world_context": world_context,"arcs": arcs,"pairs": pairs,
         },
         self.__ctx_manager.get(),
         tb,
@@ -985,6 +1013,44 @@ class BamlStreamClient:
         self.__ctx_manager.get(),
       )
     
+    def AugmentSituationsChoices(
+        self,
+        world_context: _baml.types.WorldContext,player_state: _baml.types.PlayerState,arc: _baml.types.Arc,situations: List[_baml.types.Situation],
+        baml_options: _baml.BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[List[_baml.partial_types.SituationChoices], List[_baml.types.SituationChoices]]:
+      options: _baml.BamlCallOptions = {**self.__baml_options, **(baml_options or {})}
+      __tb__ = options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = options.get("client_registry", None)
+      collector = options.get("collector", None)
+      collectors = collector if isinstance(collector, list) else [collector] if collector is not None else []
+      env = _baml.env_vars_to_dict(options.get("env", {}))
+      raw = self.__runtime.stream_function_sync(
+        "AugmentSituationsChoices",
+        {
+          "world_context": world_context,
+          "player_state": player_state,
+          "arc": arc,
+          "situations": situations,
+        },
+        None,
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        collectors,
+        env,
+      )
+
+      return baml_py.BamlSyncStream[List[_baml.partial_types.SituationChoices], List[_baml.types.SituationChoices]](
+        raw,
+        lambda x: cast(List[_baml.partial_types.SituationChoices], x.cast_to(_baml.types, _baml.types, _baml.partial_types, True)),
+        lambda x: cast(List[_baml.types.SituationChoices], x.cast_to(_baml.types, _baml.types, _baml.partial_types, False)),
+        self.__ctx_manager.get(),
+      )
+    
     def CheckChoiceAttributeNeeds(
         self,
         choice: _baml.types.Choice,world_context: _baml.types.WorldContext,
@@ -1495,7 +1561,7 @@ class BamlStreamClient:
     
     def GenerateJoinChoices(
         self,
-        world_context: _baml.types.WorldContext,arcs: List[_baml.types.Arc],
+        world_context: _baml.types.WorldContext,arcs: List[_baml.types.Arc],pairs: List[_baml.types.BridgePair],
         baml_options: _baml.BamlCallOptions = {},
     ) -> baml_py.BamlSyncStream[List[_baml.partial_types.JoinSituationOutput], List[_baml.types.JoinSituationOutput]]:
       options: _baml.BamlCallOptions = {**self.__baml_options, **(baml_options or {})}
@@ -1513,6 +1579,7 @@ class BamlStreamClient:
         {
           "world_context": world_context,
           "arcs": arcs,
+          "pairs": pairs,
         },
         None,
         self.__ctx_manager.get(),
@@ -55,6 +55,31 @@ class HttpRequest:
         False,
       )
     
+    def AugmentSituationsChoices(
+        self,
+        world_context: _baml.types.WorldContext,player_state: _baml.types.PlayerState,arc: _baml.types.Arc,situations: List[_baml.types.Situation],
+        baml_options: _baml.BamlCallOptionsModApi = {},
+    ) -> baml_py.HTTPRequest:
+      __tb__ = baml_options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = baml_options.get("client_registry", None)
+      env = _baml.env_vars_to_dict(baml_options.get("env", {}))
+
+      return self.__runtime.build_request_sync(
+        "AugmentSituationsChoices",
+        {
+          "world_context": world_context,"player_state": player_state,"arc": arc,"situations": situations,
+        },
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        env,
+        False,
+      )
+    
     def CheckChoiceAttributeNeeds(
         self,
         choice: _baml.types.Choice,world_context: _baml.types.WorldContext,
@@ -407,7 +432,7 @@ class HttpRequest:
     
     def GenerateJoinChoices(
         self,
-        world_context: _baml.types.WorldContext,arcs: List[_baml.types.Arc],
+        world_context: _baml.types.WorldContext,arcs: List[_baml.types.Arc],pairs: List[_baml.types.BridgePair],
         baml_options: _baml.BamlCallOptionsModApi = {},
     ) -> baml_py.HTTPRequest:
       __tb__ = baml_options.get("tb", None)
@@ -421,7 +446,7 @@ class HttpRequest:
       return self.__runtime.build_request_sync(
         "GenerateJoinChoices",
         {
-          "world_context": world_context,"arcs": arcs,
+          "world_context": world_context,"arcs": arcs,"pairs": pairs,
         },
         self.__ctx_manager.get(),
         tb,
@@ -816,6 +841,31 @@ class HttpStreamRequest:
         True,
       )
     
+    def AugmentSituationsChoices(
+        self,
+        world_context: _baml.types.WorldContext,player_state: _baml.types.PlayerState,arc: _baml.types.Arc,situations: List[_baml.types.Situation],
+        baml_options: _baml.BamlCallOptionsModApi = {},
+    ) -> baml_py.HTTPRequest:
+      __tb__ = baml_options.get("tb", None)
+      if __tb__ is not None:
+        tb = __tb__._tb # type: ignore (we know how to use this private attribute)
+      else:
+        tb = None
+      __cr__ = baml_options.get("client_registry", None)
+      env = _baml.env_vars_to_dict(baml_options.get("env", {}))
+
+      return self.__runtime.build_request_sync(
+        "AugmentSituationsChoices",
+        {
+          "world_context": world_context,"player_state": player_state,"arc": arc,"situations": situations,
+        },
+        self.__ctx_manager.get(),
+        tb,
+        __cr__,
+        env,
+        True,
+      )
+    
     def CheckChoiceAttributeNeeds(
         self,
         choice: _baml.types.Choice,world_context: _baml.types.WorldContext,
@@ -1168,7 +1218,7 @@ class HttpStreamRequest:
     
     def GenerateJoinChoices(
         self,
-        world_context: _baml.types.WorldContext,arcs: List[_baml.types.Arc],
+        world_context: _baml.types.WorldContext,arcs: List[_baml.types.Arc],pairs: List[_baml.types.BridgePair],
         baml_options: _baml.BamlCallOptionsModApi = {},
     ) -> baml_py.HTTPRequest:
       __tb__ = baml_options.get("tb", None)
@@ -1182,7 +1232,7 @@ class HttpStreamRequest:
       return self.__runtime.build_request_sync(
         "GenerateJoinChoices",
         {
-          "world_context": world_context,"arcs": arcs,
+          "world_context": world_context,"arcs": arcs,"pairs": pairs,
         },
         self.__ctx_manager.get(),
         tb,
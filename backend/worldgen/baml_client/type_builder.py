@@ -22,7 +22,7 @@ from .globals import DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIM
 class TypeBuilder(_TypeBuilder):
     def __init__(self):
         super().__init__(classes=set(
-          ["ActionAndReasoning","Arc","ArcOutcome","ArcSeed","Choice","CreateArc","CreateArcOutcome","CreateChoices","CreateFaction","CreateMultipleSituations","CreateNPC","CreateSituation","CreateTechnology","District","DownOneLevel","Event","Faction","FindMissingSituations","GetSituationById","GoToArcRoot","GoToSituation","GoToWorldRoot","IdentifyNarrativeGaps","Item","JoinSituationOutput","Location","NPC","PlayerAttribute","PlayerProfile","PlayerState","PlayerStats","Quest","Resume","ShortActionAndReasoning","Situation","StatDescriptors","StatRequirement","Technology","UpOneLevel","WorldContext","WorldSeed",]
+          ["ActionAndReasoning","Arc","ArcOutcome","ArcSeed","BridgePair","Choice","CreateArc","CreateArcOutcome","CreateChoices","CreateFaction","CreateMultipleSituations","CreateNPC","CreateSituation","CreateTechnology","District","DownOneLevel","Event","Faction","FindMissingSituations","GetSituationById","GoToArcRoot","GoToSituation","GoToWorldRoot","IdentifyNarrativeGaps","Item","JoinSituationOutput","Location","NPC","PlayerAttribute","PlayerProfile","PlayerState","PlayerStats","Quest","Resume","ShortActionAndReasoning","Situation","SituationChoices","StatDescriptors","StatRequirement","Technology","UpOneLevel","WorldContext","WorldSeed",]
         ), enums=set(
           []
         ), runtime=DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIME)
@@ -44,6 +44,10 @@ class TypeBuilder(_TypeBuilder):
     def ArcSeed(self) -> "ArcSeedAst":
         return ArcSeedAst(self)
 
+    @property
+    def BridgePair(self) -> "BridgePairAst":
+        return BridgePairAst(self)
+
     @property
     def Choice(self) -> "ChoiceAst":
         return ChoiceAst(self)
@@ -168,6 +172,10 @@ class TypeBuilder(_TypeBuilder):
     def Situation(self) -> "SituationAst":
         return SituationAst(self)
 
+    @property
+    def SituationChoices(self) -> "SituationChoicesAst":
+        return SituationChoicesAst(self)
+
     @property
     def StatDescriptors(self) -> "StatDescriptorsAst":
         return StatDescriptorsAst(self)
@@ -408,6 +416,48 @@ class ArcSeedProperties:
 
     
 
+class BridgePairAst:
+    def __init__(self, tb: _TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("BridgePair")
+        self._properties: typing.Set[str] = set([ "from_situation_id",  "to_situation_id", ])
+        self._props = BridgePairProperties(self._bldr, self._properties)
+
+    def type(self) -> FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "BridgePairProperties":
+        return self._props
+
+
+class BridgePairViewer(BridgePairAst):
+    def __init__(self, tb: _TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_properties(self) -> typing.List[typing.Tuple[str, ClassPropertyViewer]]:
+        return [(name, ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+
+
+
+class BridgePairProperties:
+    def __init__(self, bldr: ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties
+
+    
+
+    @property
+    def from_situation_id(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("from_situation_id"))
+
+    @property
+    def to_situation_id(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("to_situation_id"))
+
+    
+
 class ChoiceAst:
     def __init__(self, tb: _TypeBuilder):
         _tb = tb._tb # type: ignore (we know how to use this private attribute)
@@ -2138,6 +2188,48 @@ class SituationProperties:
 
     
 
+class SituationChoicesAst:
+    def __init__(self, tb: _TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("SituationChoices")
+        self._properties: typing.Set[str] = set([ "situation_id",  "choices", ])
+        self._props = SituationChoicesProperties(self._bldr, self._properties)
+
+    def type(self) -> FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "SituationChoicesProperties":
+        return self._props
+
+
+class SituationChoicesViewer(SituationChoicesAst):
+    def __init__(self, tb: _TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_properties(self) -> typing.List[typing.Tuple[str, ClassPropertyViewer]]:
+        return [(name, ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+
+
+
+class SituationChoicesProperties:
+    def __init__(self, bldr: ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties
+
+    
+
+    @property
+    def situation_id(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("situation_id"))
+
+    @property
+    def choices(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("choices"))
+
+    
+
 class StatDescriptorsAst:
     def __init__(self, tb: _TypeBuilder):
         _tb = tb._tb # type: ignore (we know how to use this private attribute)
@@ -2382,7 +2474,7 @@ class WorldContextAst:
     def __init__(self, tb: _TypeBuilder):
         _tb = tb._tb # type: ignore (we know how to use this private attribute)
         self._bldr = _tb.class_("WorldContext")
-        self._properties: typing.Set[str] = set([ "seed",  "technologies",  "factions",  "districts",  "npcs",  "tension_sliders",  "world_root", ])
+        self._properties: typing.Set[str] = set([ "seed",  "world_root",  "tension_sliders",  "districts",  "technologies",  "factions",  "npcs", ])
         self._props = WorldContextProperties(self._bldr, self._properties)
 
     def type(self) -> FieldType:
@@ -2415,28 +2507,28 @@ class WorldContextProperties:
         return ClassPropertyViewer(self.__bldr.property("seed"))
 
     @property
-    def technologies(self) -> ClassPropertyViewer:
-        return ClassPropertyViewer(self.__bldr.property("technologies"))
+    def world_root(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("world_root"))
 
     @property
-    def factions(self) -> ClassPropertyViewer:
-        return ClassPropertyViewer(self.__bldr.property("factions"))
+    def tension_sliders(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("tension_sliders"))
 
     @property
     def districts(self) -> ClassPropertyViewer:
         return ClassPropertyViewer(self.__bldr.property("districts"))
 
     @property
-    def npcs(self) -> ClassPropertyViewer:
-        return ClassPropertyViewer(self.__bldr.property("npcs"))
+    def technologies(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("technologies"))
 
     @property
-    def tension_sliders(self) -> ClassPropertyViewer:
-        return ClassPropertyViewer(self.__bldr.property("tension_sliders"))
+    def factions(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("factions"))
 
     @property
-    def world_root(self) -> ClassPropertyViewer:
-        return ClassPropertyViewer(self.__bldr.property("world_root"))
+    def npcs(self) -> ClassPropertyViewer:
+        return ClassPropertyViewer(self.__bldr.property("npcs"))
 
     
 
@@ -68,6 +68,10 @@ class ArcSeed(BaseModel):
     internal_hint: str
     internal_justification: str
 
+class BridgePair(BaseModel):
+    from_situation_id: str
+    to_situation_id: str
+
 class Choice(BaseModel):
     id: str
     text: str
@@ -299,6 +303,10 @@ class Situation(BaseModel):
     internal_hint: str
     internal_justification: str
 
+class SituationChoices(BaseModel):
+    situation_id: str
+    choices: List["Choice"]
+
 class StatDescriptors(BaseModel):
     might_descriptors: Dict[str, str]
     insight_descriptors: Dict[str, str]
@@ -335,12 +343,12 @@ class UpOneLevel(BaseModel):
 
 class WorldContext(BaseModel):
     seed: "WorldSeed"
+    world_root: "Situation"
+    tension_sliders: Dict[str, int]
+    districts: List["District"]
     technologies: List["Technology"]
     factions: List["Faction"]
-    districts: List["District"]
     npcs: List["NPC"]
-    tension_sliders: Dict[str, int]
-    world_root: "Situation"
 
 class WorldSeed(BaseModel):
     name: str
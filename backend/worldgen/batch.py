@@ -0,0 +1,320 @@
+"""
+Batch jobs for latency-insensitive generation steps.
+
+Augmentation and missing-situation filling fire hundreds of independent
+requests whose answers nobody waits on interactively. In batch mode
+``BatchRunner`` renders each request with ``b.request`` (the exact HTTP body
+BAML would send to the first client of the function's route), writes them to
+one JSONL file in the OpenAI Batch API format, submits it to a
+``BatchEndpoint``, polls until the job finishes and parses each answer back
+into BAML types with ``b.parse``. Endpoint calls run in a worker thread, so
+other generation keeps going while a batch is submitted, polled and fetched.
+
+``OpenAIBatchEndpoint`` uses the OpenAI Batch API. ``LocalBatchEndpoint``
+answers a batch in-process with a callable, for tests and offline runs.
+"""
+import abc
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+from urllib.parse import urlparse
+
+from .lazy_baml import b
+
+logger = logging.getLogger("worldgen")
+
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+@dataclass
+class BatchRequest:
+    """One BAML function call to run as part of a batch."""
+    custom_id: str
+    function_name: str
+    kwargs: Dict[str, Any]
+
+
+@dataclass
+class BatchStats:
+    batches: int = 0
+    requests: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    wait_seconds: float = 0.0
+
+    @property
+    def tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "wait_seconds": round(self.wait_seconds, 1),
+        }
+
+
+class BatchEndpoint(abc.ABC):
+    """Somewhere a JSONL batch file can be submitted and its results fetched.
+
+    Methods may block; BatchRunner calls them from a worker thread.
+    """
+
+    @abc.abstractmethod
+    def submit(self, input_path: str) -> str:
+        """Submit a batch file; returns the job id."""
+
+    @abc.abstractmethod
+    def status(self, job_id: str) -> str:
+        """One of "validating", "in_progress", "finalizing", "completed", "failed", "expired", "cancelled"."""
+
+    @abc.abstractmethod
+    def download(self, job_id: str, output_path: str) -> None:
+        """Write a finished job's output JSONL to output_path."""
+
+    @abc.abstractmethod
+    def cancel(self, job_id: str) -> None:
+        """Stop a job that is no longer waited on."""
+
+
+class OpenAIBatchEndpoint(BatchEndpoint):
+    """The OpenAI Batch API (24 hour completion window, half the price of direct calls)."""
+
+    def __init__(self, client: Any = None):
+        if client is None:
+            from openai import OpenAI
+            client = OpenAI()
+        self.client = client
+
+    def submit(self, input_path: str) -> str:
+        with open(input_path, 'rb') as f:
+            input_file = self.client.files.create(file=f, purpose="batch")
+        job = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return job.id
+
+    def status(self, job_id: str) -> str:
+        return self.client.batches.retrieve(job_id).status
+
+    def download(self, job_id: str, output_path: str) -> None:
+        job = self.client.batches.retrieve(job_id)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            if job.output_file_id:
+                f.write(self.client.files.content(job.output_file_id).text)
+            if job.error_file_id:
+                f.write(self.client.files.content(job.error_file_id).text)
+
+    def cancel(self, job_id: str) -> None:
+        self.client.batches.cancel(job_id)
+
+
+class LocalBatchEndpoint(BatchEndpoint):
+    """Answers batches in a background thread with a callable.
+
+    Args:
+        respond: Takes a batch input line (custom_id, method, url, body) and
+            returns the assistant message text; raising marks that request as failed
+    """
+
+    def __init__(self, respond: Callable[[Dict[str, Any]], str]):
+        self.respond = respond
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+
+    def submit(self, input_path: str) -> str:
+        job_id = f"local_batch_{uuid.uuid4().hex[:12]}"
+        self._jobs[job_id] = {"status": "in_progress", "output": []}
+        threading.Thread(target=self._process, args=(job_id, input_path), daemon=True).start()
+        return job_id
+
+    def _process(self, job_id: str, input_path: str) -> None:
+        output = []
+        with open(input_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if self._jobs[job_id]["status"] == "cancelled":
+                    return
+                request = json.loads(line)
+                try:
+                    content = self.respond(request)
+                except Exception as e:
+                    output.append({"custom_id": request["custom_id"], "response": None, "error": {"message": str(e)}})
+                    continue
+                output.append({
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": 200, "body": {
+                        "choices": [{"message": {"role": "assistant", "content": content}}],
+                        "usage": {"prompt_tokens": 0, "completion_tokens": 0},
+                    }},
+                    "error": None,
+                })
+        if self._jobs[job_id]["status"] != "cancelled":
+            self._jobs[job_id] = {"status": "completed", "output": output}
+
+    def status(self, job_id: str) -> str:
+        return self._jobs[job_id]["status"]
+
+    def download(self, job_id: str, output_path: str) -> None:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for line in self._jobs[job_id]["output"]:
+                f.write(json.dumps(line) + "\n")
+
+    def cancel(self, job_id: str) -> None:
+        self._jobs[job_id]["status"] = "cancelled"
+
+
+@dataclass
+class BatchResult:
+    """Parsed results by custom_id, and the error for each request that failed."""
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+class BatchRunner:
+    """Renders, submits, polls and parses one batch per call to run()."""
+
+    def __init__(self, endpoint: BatchEndpoint, folder: str, client: Any = None,
+                 poll_interval: float = 30.0, timeout: float = 24 * 3600):
+        """
+        Args:
+            endpoint: Where batches are sent
+            folder: Where batch input and output files are kept
+            client: ResilientClient whose routing picks the client (and so the
+                model) each function's requests are rendered for; without it
+                BAML renders each function's default client
+            poll_interval: Seconds between status checks
+            timeout: Seconds to wait for a batch before giving up on it
+        """
+        self.endpoint = endpoint
+        self.folder = folder
+        self.client = client
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.stats = BatchStats()
+
+    async def _render(self, request: BatchRequest) -> Dict[str, Any]:
+        options = {}
+        if self.client is not None:
+            options["client_registry"] = self.client.registry_for(request.function_name)
+        http_request = await getattr(b.request, request.function_name)(**request.kwargs, baml_options=options)
+        body = http_request.body.json()
+        return {
+            "custom_id": request.custom_id,
+            "method": http_request.method,
+            "url": urlparse(http_request.url).path,
+            "body": body,
+        }
+
+    async def _wait(self, job_id: str) -> str:
+        started = time.monotonic()
+        status = await asyncio.to_thread(self.endpoint.status, job_id)
+        while status not in TERMINAL_STATUSES:
+            if time.monotonic() - started > self.timeout:
+                logger.error(f"Batch {job_id} still {status} after {self.timeout:.0f}s, cancelling it")
+                try:
+                    await asyncio.to_thread(self.endpoint.cancel, job_id)
+                except Exception as e:
+                    logger.warning(f"Could not cancel batch {job_id}: {e}")
+                status = "timed_out"
+                break
+            await asyncio.sleep(self.poll_interval)
+            status = await asyncio.to_thread(self.endpoint.status, job_id)
+        self.stats.wait_seconds += time.monotonic() - started
+        return status
+
+    def _parse(self, function_name: str, line: Dict[str, Any]) -> Any:
+        if line.get("error"):
+            raise ValueError(line["error"].get("message", "batch request failed"))
+        response = line["response"]
+        if response["status_code"] != 200:
+            raise ValueError(f"status {response['status_code']}: {response['body']}")
+        usage = response["body"].get("usage") or {}
+        self.stats.input_tokens += usage.get("prompt_tokens") or 0
+        self.stats.output_tokens += usage.get("completion_tokens") or 0
+        content = response["body"]["choices"][0]["message"]["content"]
+        return getattr(b.parse, function_name)(content)
+
+    async def _execute(self, lines: List[Dict[str, Any]], input_path: str, output_path: str) -> Tuple[str, List[str]]:
+        """Submit rendered lines and wait for the job.
+
+        Returns:
+            The job's final status and, if it completed, its raw output lines
+        """
+        with open(input_path, 'w', encoding='utf-8') as f:
+            for line in lines:
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+        job_id = await asyncio.to_thread(self.endpoint.submit, input_path)
+        logger.info(f"Submitted batch {job_id} with {len(lines)} requests")
+        status = await self._wait(job_id)
+        logger.info(f"Batch {job_id} finished with status {status}")
+        if status != "completed":
+            return status, []
+        await asyncio.to_thread(self.endpoint.download, job_id, output_path)
+        with open(output_path, 'r', encoding='utf-8') as f:
+            return status, [raw for raw in f if raw.strip()]
+
+    async def run(self, requests: List[BatchRequest]) -> BatchResult:
+        """Run the requests as one batch.
+
+        Requests that fail (when rendering, at the endpoint or when parsing)
+        are reported in BatchResult.errors rather than raised, so callers can
+        fall back to direct calls for just those.
+        """
+        result = BatchResult()
+        if not requests:
+            return result
+        os.makedirs(self.folder, exist_ok=True)
+        batch_number = self.stats.batches + 1
+        input_path = os.path.join(self.folder, f"batch_{batch_number:03d}_input.jsonl")
+        output_path = os.path.join(self.folder, f"batch_{batch_number:03d}_output.jsonl")
+        functions = {request.custom_id: request.function_name for request in requests}
+        self.stats.batches += 1
+        self.stats.requests += len(requests)
+
+        lines = []
+        for request in requests:
+            try:
+                lines.append(await self._render(request))
+            except Exception as e:
+                logger.warning(f"Could not render batch request {request.custom_id}: {e}")
+                result.errors[request.custom_id] = f"not rendered: {e}"
+        status = "not submitted"
+        output = []
+        if lines:
+            try:
+                status, output = await self._execute(lines, input_path, output_path)
+            except Exception as e:
+                logger.error(f"Batch {batch_number} failed: {e}", exc_info=True)
+                status = f"error: {e}"
+        for raw in output:
+            try:
+                line = json.loads(raw)
+                custom_id = line["custom_id"]
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping unreadable batch output line: {e}")
+                continue
+            if custom_id not in functions:
+                continue
+            try:
+                result.results[custom_id] = self._parse(functions[custom_id], line)
+            except Exception as e:
+                result.errors[custom_id] = str(e)
+        for custom_id in functions:
+            if custom_id not in result.results and custom_id not in result.errors:
+                result.errors[custom_id] = f"no result (batch {status})"
+        self.stats.succeeded += len(result.results)
+        self.stats.failed += len(result.errors)
+        return result
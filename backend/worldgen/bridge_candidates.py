@@ -0,0 +1,172 @@
+"""
+Local ranking of cross-arc bridge candidates.
+
+Instead of handing the whole world to ``GenerateJoinChoices`` and letting the
+model find joins, situation pairs from different arcs are scored here and only
+the best ones are sent, in small batches: trimmed arcs for context and the
+pairs themselves as the only joins the model may make.
+"""
+from __future__ import annotations
+
+import logging
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from heapq import nlargest
+from typing import TYPE_CHECKING, Dict, List, Set
+
+from .lazy_baml import baml_types
+
+if TYPE_CHECKING:
+    from .baml_client.types import Arc, BridgePair, Situation, WorldContext
+
+logger = logging.getLogger("worldgen")
+
+BRIDGEABLE_WEIGHT = 2.0
+TAG_WEIGHT = 3.0
+FACTION_WEIGHT = 1.5
+DISTANCE_WEIGHT = 1.0
+
+
+@dataclass
+class BridgeCandidate:
+    """A scored pair of situations in different arcs that could be joined."""
+    from_arc: Arc
+    from_situation: Situation
+    to_arc: Arc
+    to_situation: Situation
+    score: float
+
+
+def situation_depths(arc: Arc) -> Dict[str, int]:
+    """Distance of each situation from the arc root, following choices within the arc."""
+    if not arc.situations:
+        return {}
+    by_id = {situation.id: situation for situation in arc.situations}
+    root = arc.situations[0].id
+    depths = {root: 0}
+    queue = deque([root])
+    while queue:
+        situation_id = queue.popleft()
+        for choice in by_id[situation_id].choices:
+            if choice.next_situation_id in by_id and choice.next_situation_id not in depths:
+                depths[choice.next_situation_id] = depths[situation_id] + 1
+                queue.append(choice.next_situation_id)
+    return depths
+
+
+def situation_factions(situation: Situation, arc: Arc, faction_names: List[str]) -> Set[str]:
+    """Factions a situation mentions, falling back to the factions of its arc."""
+    text = f"{situation.description} {situation.player_perspective_description}".lower()
+    mentioned = {name for name in faction_names if name.lower() in text}
+    return mentioned or set(arc.seed.factions_involved)
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def rank_bridge_candidates(arcs: List[Arc], world_context: WorldContext, top_k: int = 12) -> List[BridgeCandidate]:
+    """Score cross-arc situation pairs and return the top_k.
+
+    The score combines whether both ends are bridgeable, shared context tags,
+    shared factions, and how close the two situations are in narrative depth.
+    Pairs already joined by a choice are skipped. Only pairs with a bridgeable
+    end, a shared tag or a shared faction are scored, found through inverted
+    indexes rather than by trying every pair; the rest score on depth alone
+    (at most DISTANCE_WEIGHT), so every pair is only tried when there are
+    fewer than top_k related ones.
+
+    Args:
+        arcs: All arcs in the world
+        world_context: Used for the list of known faction names
+        top_k: Number of candidates to return
+
+    Returns:
+        Candidates sorted by descending score
+    """
+    faction_names = [faction.name for faction in world_context.factions]
+    features = []  # (arc, situation, tags, factions, depth)
+    for arc in arcs:
+        depths = situation_depths(arc)
+        for situation in arc.situations:
+            features.append((
+                arc,
+                situation,
+                {tag.lower() for tag in situation.context_tags},
+                situation_factions(situation, arc, faction_names),
+                depths.get(situation.id),
+            ))
+
+    everyone = range(len(features))
+    bridgeable = [i for i, feature in enumerate(features) if feature[1].bridgeable]
+    by_tag: Dict[str, List[int]] = defaultdict(list)
+    by_faction: Dict[str, List[int]] = defaultdict(list)
+    for i, (_, _, tags, factions, _) in enumerate(features):
+        for tag in tags:
+            by_tag[tag].append(i)
+        for faction in factions:
+            by_faction[faction].append(i)
+
+    def related(from_index: int):
+        _, from_situation, from_tags, from_factions, _ = features[from_index]
+        if from_situation.bridgeable:
+            return everyone
+        found = set(bridgeable)
+        for tag in from_tags:
+            found.update(by_tag[tag])
+        for faction in from_factions:
+            found.update(by_faction[faction])
+        return sorted(found)
+
+    def candidates(partners):
+        for from_index, (from_arc, from_situation, from_tags, from_factions, from_depth) in enumerate(features):
+            existing_targets = {choice.next_situation_id for choice in from_situation.choices}
+            for to_index in partners(from_index):
+                to_arc, to_situation, to_tags, to_factions, to_depth = features[to_index]
+                if to_arc is from_arc or to_situation.id in existing_targets:
+                    continue
+                score = BRIDGEABLE_WEIGHT * (from_situation.bridgeable + to_situation.bridgeable)
+                score += TAG_WEIGHT * _jaccard(from_tags, to_tags)
+                score += FACTION_WEIGHT * _jaccard(from_factions, to_factions)
+                if from_depth is not None and to_depth is not None:
+                    score += DISTANCE_WEIGHT / (1 + abs(from_depth + 1 - to_depth))
+                yield BridgeCandidate(from_arc, from_situation, to_arc, to_situation, score)
+
+    ranked = nlargest(top_k, candidates(related), key=lambda candidate: candidate.score)
+    if len(ranked) < top_k:
+        ranked = nlargest(top_k, candidates(lambda from_index: everyone), key=lambda candidate: candidate.score)
+    return ranked
+
+
+def candidate_arcs(candidates: List[BridgeCandidate]) -> List[Arc]:
+    """Trim arcs down to the situations involved in a batch of candidates."""
+    arcs: Dict[str, Arc] = {}
+    keep: Dict[str, Set[str]] = {}
+    for candidate in candidates:
+        for arc, situation in ((candidate.from_arc, candidate.from_situation), (candidate.to_arc, candidate.to_situation)):
+            arcs.setdefault(arc.seed.title, arc)
+            keep.setdefault(arc.seed.title, set()).add(situation.id)
+    return [
+        arc.model_copy(update={"situations": [s for s in arc.situations if s.id in keep[title]]})
+        for title, arc in arcs.items()
+    ]
+
+
+def candidate_pairs(candidates: List[BridgeCandidate]) -> List[BridgePair]:
+    """The joins a batch of candidates allows, in the form GenerateJoinChoices takes them."""
+    return [
+        baml_types.BridgePair(from_situation_id=candidate.from_situation.id, to_situation_id=candidate.to_situation.id)
+        for candidate in candidates
+    ]
+
+
+def batch_candidates(candidates: List[BridgeCandidate], batch_size: int) -> List[List[BridgeCandidate]]:
+    """Split ranked candidates into batches for parallel LLM calls."""
+    return [candidates[i:i + batch_size] for i in range(0, len(candidates), batch_size)]
+
+
+def build_situation_index(arcs: List[Arc]) -> Dict[str, Situation]:
+    """Map situation id -> situation across all arcs."""
+    return {situation.id: situation for arc in arcs for situation in arc.situations}
@@ -0,0 +1,154 @@
+"""
+Local deduplication of generated NPCs, factions and technologies.
+
+Choices often carry entities the world already has under a slightly different
+name ("The Open Blocks" vs "Open Blocks", "Vextros Corp." vs "Vextros Corp").
+Names are normalized and compared with a character n-gram TF-IDF cosine
+similarity; near-duplicates are merged into the existing entity at insert time
+and recorded in an alias table, so later references (NPC
+``faction_affiliations``, arc ``factions_involved``) still resolve.
+"""
+import logging
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger("worldgen")
+
+NGRAM_SIZE = 3
+SIMILARITY_THRESHOLD = 0.8
+_LEADING_ARTICLE = re.compile(r"^(the|a|an)\s+")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip punctuation and leading articles, collapse whitespace."""
+    name = _NON_WORD.sub(" ", name.lower()).strip()
+    return _LEADING_ARTICLE.sub("", name)
+
+
+def char_ngrams(text: str, n: int = NGRAM_SIZE) -> Counter:
+    """Character n-gram counts of a normalized name, padded at word boundaries."""
+    padded = f" {text} "
+    return Counter(padded[i:i + n] for i in range(max(len(padded) - n + 1, 1)))
+
+
+class EntityIndex:
+    """Name index for one kind of entity, with TF-IDF similarity lookup."""
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.canonical: Dict[str, str] = {}  # normalized name -> canonical name
+        self.grams: Dict[str, Counter] = {}  # normalized name -> n-gram counts
+        self.postings: Dict[str, Set[str]] = defaultdict(set)  # n-gram -> normalized names
+        self.document_frequency: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self.canonical)
+
+    def add(self, name: str) -> None:
+        normalized = normalize_name(name)
+        if normalized in self.canonical:
+            return
+        grams = char_ngrams(normalized)
+        self.canonical[normalized] = name
+        self.grams[normalized] = grams
+        for gram in grams:
+            self.postings[gram].add(normalized)
+            self.document_frequency[gram] += 1
+
+    def _weights(self, grams: Counter) -> Dict[str, float]:
+        total = len(self.canonical) + 1
+        return {
+            gram: count * (math.log(total / (1 + self.document_frequency[gram])) + 1)
+            for gram, count in grams.items()
+        }
+
+    def match(self, name: str) -> Optional[str]:
+        """Find the canonical name of an existing entity this name duplicates."""
+        normalized = normalize_name(name)
+        if normalized in self.canonical:
+            return self.canonical[normalized]
+        query = self._weights(char_ngrams(normalized))
+        query_norm = math.sqrt(sum(w * w for w in query.values()))
+        candidates = set()
+        for gram in query:
+            candidates.update(self.postings.get(gram, ()))
+        best, best_score = None, 0.0
+        for candidate in candidates:
+            weights = self._weights(self.grams[candidate])
+            dot = sum(w * weights.get(gram, 0.0) for gram, w in query.items())
+            norm = math.sqrt(sum(w * w for w in weights.values()))
+            score = dot / (query_norm * norm) if query_norm and norm else 0.0
+            if score > best_score:
+                best, best_score = candidate, score
+        if best is not None and best_score >= self.threshold:
+            return self.canonical[best]
+        return None
+
+
+class WorldEntityIndex:
+    """Dedup indexes for NPCs, factions and technologies plus their alias table."""
+
+    KINDS = ("npcs", "factions", "technologies")
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD):
+        self.indexes = {kind: EntityIndex(threshold) for kind in self.KINDS}
+        self.aliases: Dict[str, Dict[str, str]] = {kind: {} for kind in self.KINDS}  # alias -> canonical name
+
+    @classmethod
+    def from_context(cls, context: Any, threshold: float = SIMILARITY_THRESHOLD) -> 'WorldEntityIndex':
+        """Index every entity already present in a WorldContext."""
+        index = cls(threshold)
+        for kind in cls.KINDS:
+            for entity in getattr(context, kind):
+                index.indexes[kind].add(entity.name)
+        return index
+
+    def resolve(self, kind: str, name: str) -> str:
+        """Map a name to its canonical entity name (unchanged if unknown)."""
+        return self.aliases[kind].get(name) or self.indexes[kind].match(name) or name
+
+    def resolve_faction(self, name: str) -> str:
+        return self.resolve("factions", name)
+
+    def merge_into(self, context: Any, kind: str, entities: List[Any]) -> int:
+        """Append entities to the context, merging near-duplicates.
+
+        Args:
+            context: WorldContext to modify in place
+            kind: "npcs", "factions" or "technologies"
+            entities: New entities carried by a Choice or agent action
+
+        Returns:
+            Number of entities actually appended
+        """
+        index = self.indexes[kind]
+        present = {entity.name for entity in getattr(context, kind)}
+        added = 0
+        for entity in entities:
+            if kind == "npcs":
+                # A copy, so the Choice that carried the NPC keeps the names it was saved with
+                entity = entity.model_copy(update={
+                    "faction_affiliations": [self.resolve_faction(f) for f in entity.faction_affiliations],
+                })
+            canonical = index.match(entity.name)
+            if canonical is not None and canonical in present:
+                if canonical != entity.name:
+                    self.aliases[kind][entity.name] = canonical
+                    logger.info(f"Merged duplicate {kind[:-1]} '{entity.name}' into '{canonical}'")
+                continue
+            getattr(context, kind).append(entity)
+            present.add(entity.name)
+            index.add(entity.name)
+            added += 1
+        return added
+
+    def merge_choice(self, context: Any, choice: Any) -> int:
+        """Merge a Choice's new_npcs, new_factions and new_technologies into the context."""
+        # Factions first, so NPC faction_affiliations can resolve against them
+        added = self.merge_into(context, "factions", choice.new_factions or [])
+        added += self.merge_into(context, "npcs", choice.new_npcs or [])
+        added += self.merge_into(context, "technologies", choice.new_technologies or [])
+        return added
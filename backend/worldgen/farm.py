@@ -0,0 +1,220 @@
+"""
+Generating many worlds at once.
+
+``generate_many`` splits a list of seeds across a process pool; each process
+generates its share of worlds concurrently on its own event loop. All
+processes share:
+
+- a ``RateLimiter`` on LLM requests per minute, kept in shared memory
+- a ``ResponseCache`` folder, so identical calls (reruns, retries of a seed)
+  are answered from disk
+
+Each finished world appends a line to ``progress.jsonl`` in the farm folder,
+and ``report.json`` aggregates them once every world is done. Used by
+``python -m backend.worldgen.world_generator generate-many seeds.jsonl``.
+"""
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .response_cache import ResponseCache
+from .run_metrics import load_metrics, summarize
+
+logger = logging.getLogger("worldgen")
+
+
+class RateLimiter:
+    """Spaces requests evenly to a rate shared by every process holding it."""
+
+    def __init__(self, requests_per_minute: float):
+        self.interval = 60.0 / requests_per_minute
+        self._next_slot = multiprocessing.Value('d', 0.0, lock=False)
+        self._lock = multiprocessing.Lock()
+
+    async def acquire(self) -> None:
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot.value)
+            self._next_slot.value = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def load_seeds(path: str) -> List[Dict[str, Any]]:
+    """WorldSeed fields from a JSON list or a JSONL file, checked before any world starts."""
+    from .lazy_baml import baml_types
+
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if text.lstrip().startswith("["):
+        seeds = json.loads(text)
+    else:
+        seeds = [json.loads(line) for line in text.splitlines() if line.strip()]
+    for i, seed in enumerate(seeds, 1):
+        if not isinstance(seed, dict):
+            raise ValueError(f"Seed {i} is not an object")
+        seed.setdefault("internal_hint", "")
+        seed.setdefault("internal_justification", "")
+        try:
+            baml_types.WorldSeed(**seed)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Seed {i} ({seed.get('name', 'unnamed')}) is not a valid WorldSeed: {e}") from e
+    names = [seed["name"] for seed in seeds]
+    if len(set(names)) != len(names):
+        raise ValueError("Seed names must be unique; they name the run folders")
+    return seeds
+
+
+# Set in each worker process by _init_worker
+_limiter: Optional[RateLimiter] = None
+_completed: Any = None
+
+
+def _init_worker(limiter: Optional[RateLimiter], completed: Any) -> None:
+    global _limiter, _completed
+    _limiter, _completed = limiter, completed
+
+
+def _error_text(error: BaseException) -> str:
+    return "".join(traceback.format_exception_only(type(error), error)).strip()
+
+
+def _failed(seed_fields: Dict[str, Any], error: BaseException) -> Dict[str, Any]:
+    """The result entry of a seed whose world could not be generated at all."""
+    return {"seed": seed_fields.get("name"), "run_folder": None, "pid": os.getpid(),
+            "status": "failed", "error": _error_text(error), "duration_s": 0.0}
+
+
+async def _generate_one(seed_fields: Dict[str, Any], agent: bool, cache_folder: Optional[str],
+                        farm_folder: str, total: int) -> Dict[str, Any]:
+    from .lazy_baml import baml_types
+
+    started = time.monotonic()
+    name = seed_fields.get("name")
+    result: Dict[str, Any] = {"seed": name, "run_folder": None, "pid": os.getpid()}
+    world = None
+    try:
+        # Built inside the try so a bad seed fails only its own world
+        seed = baml_types.WorldSeed(**seed_fields)
+        if agent:
+            from .agent_world import AgentWorld
+            world = AgentWorld(seed)
+        else:
+            from .world import World
+            world = World(seed)
+        world.llm.rate_limiter = _limiter
+        if cache_folder is not None:
+            world.llm.cache = ResponseCache(cache_folder)
+        result["run_folder"] = world.run_folder
+        await world.generate()
+        result["status"] = "ok"
+    except Exception as e:
+        logger.error(f"World {name} failed: {e}")
+        result["status"] = "failed"
+        result["error"] = _error_text(e)
+    result["duration_s"] = round(time.monotonic() - started, 1)
+    if world is not None and os.path.exists(os.path.join(world.run_folder, "metrics.jsonl")):
+        result["summary"] = summarize(load_metrics(world.run_folder))
+    if world is not None and world.llm.cache is not None:
+        result["cache"] = world.llm.cache.to_dict()
+
+    with _completed.get_lock():
+        _completed.value += 1
+        done = _completed.value
+    with open(os.path.join(farm_folder, "progress.jsonl"), 'a') as f:
+        f.write(json.dumps(result) + "\n")
+    logger.info(f"[{done}/{total}] World {name} {result['status']} in {result['duration_s']}s")
+    return result
+
+
+async def _generate_share(seeds: List[Dict[str, Any]], concurrency: int, agent: bool,
+                          cache_folder: Optional[str], farm_folder: str, total: int) -> List[Dict[str, Any]]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(seed_fields: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await _generate_one(seed_fields, agent, cache_folder, farm_folder, total)
+    results = await asyncio.gather(*(bounded(seed_fields) for seed_fields in seeds), return_exceptions=True)
+    return [
+        _failed(seed_fields, result) if isinstance(result, Exception) else result
+        for seed_fields, result in zip(seeds, results)
+    ]
+
+
+def _run_share(seeds: List[Dict[str, Any]], concurrency: int, agent: bool, cache_folder: Optional[str],
+               farm_folder: str, total: int) -> List[Dict[str, Any]]:
+    return asyncio.run(_generate_share(seeds, concurrency, agent, cache_folder, farm_folder, total))
+
+
+def build_report(results: List[Dict[str, Any]], wall_time_s: float) -> Dict[str, Any]:
+    """Totals and throughput across every world of a farm run."""
+    summaries = [result["summary"] for result in results if "summary" in result]
+    situations = sum(summary["situations"] for summary in summaries)
+    return {
+        "worlds": len(results),
+        "succeeded": sum(1 for result in results if result["status"] == "ok"),
+        "failed": [result["seed"] for result in results if result["status"] != "ok"],
+        "wall_time_s": round(wall_time_s, 1),
+        "worlds_per_hour": round(len(results) / (wall_time_s / 3600), 2) if wall_time_s else 0.0,
+        "situations": situations,
+        "situations_per_minute": round(situations / (wall_time_s / 60), 2) if wall_time_s else 0.0,
+        "llm_calls": sum(summary["llm_calls"] for summary in summaries),
+        "tokens": sum(summary["tokens"] for summary in summaries),
+        "cache_hits": sum(result.get("cache", {}).get("hits", 0) for result in results),
+        "worlds_detail": results,
+    }
+
+
+def generate_many(seeds: List[Dict[str, Any]], processes: int = 4, concurrency: int = 2, agent: bool = False,
+                  requests_per_minute: Optional[float] = None, cache_folder: Optional[str] = "saves/response_cache",
+                  farm_folder: Optional[str] = None) -> Dict[str, Any]:
+    """Generate a world per seed across a process pool.
+
+    Args:
+        seeds: WorldSeed fields, one dict per world
+        processes: Worker processes
+        concurrency: Worlds generated at once within each process
+        agent: Use AgentWorld instead of World
+        requests_per_minute: LLM request rate shared by all processes; None for no limit
+        cache_folder: Shared response cache; None to disable
+        farm_folder: Where progress.jsonl and report.json go
+
+    Returns:
+        The aggregate report
+    """
+    farm_folder = farm_folder or f"saves/farm_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    os.makedirs(farm_folder, exist_ok=True)
+    processes = max(1, min(processes, len(seeds)))
+    shares = [seeds[i::processes] for i in range(processes)]
+    limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
+    completed = multiprocessing.Value('i', 0)
+
+    logger.info(f"Generating {len(seeds)} worlds in {processes} processes, {concurrency} at a time each")
+    started = time.monotonic()
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(limiter, completed)) as pool:
+        futures = [
+            pool.submit(_run_share, share, concurrency, agent, cache_folder, farm_folder, len(seeds))
+            for share in shares
+        ]
+        results = []
+        for share, future in zip(shares, futures):
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                # A worker process died; its worlds count as failed so the report still gets written
+                logger.error(f"Worker for {len(share)} worlds failed: {e}")
+                results.extend(_failed(seed_fields, e) for seed_fields in share)
+
+    report = build_report(results, time.monotonic() - started)
+    with open(os.path.join(farm_folder, "report.json"), 'w') as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"Farm finished: {report['succeeded']}/{report['worlds']} worlds, "
+                f"{report['situations']} situations, {report['situations_per_minute']} situations/minute")
+    return report
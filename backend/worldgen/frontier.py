@@ -0,0 +1,207 @@
+"""
+Frontier expansion of dangling choices.
+
+Every choice that leads nowhere is a frontier item. Items are expanded in
+waves: wave 1 holds the choices dangling when expansion starts, and wave
+``d + 1`` holds the choices of the situations generated in wave ``d``. Each
+wave is drained by a pool of workers sharing one queue, so several situations
+are generated at once, and the caller is told when a wave is done (World saves
+once per wave rather than once per situation).
+
+Expansion stops at the first limit reached: depth, number of new situations,
+or tokens spent since it started (by direct calls, and by batch jobs when
+``extra_tokens`` counts them).
+
+Given ``fill_batch`` instead of relying on ``fill`` alone, each wave is handed
+over whole (World uses this to run a wave as one batch job, see batch.py).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Set
+
+if TYPE_CHECKING:
+    from .baml_client.types import Arc, Choice, Situation
+
+logger = logging.getLogger("worldgen")
+
+
+@dataclass(frozen=True)
+class FrontierLimits:
+    """When to stop expanding, and how many situations to generate at once."""
+    max_depth: int = 1
+    max_situations: int = 200
+    token_budget: Optional[int] = None  # Input plus output tokens across the whole expansion
+    workers: int = 4
+
+
+@dataclass
+class FrontierItem:
+    """A dangling choice waiting for a situation."""
+    arc: Arc
+    choice: Choice
+    depth: int
+
+
+@dataclass
+class FrontierStats:
+    waves: int = 0
+    situations: int = 0
+    failed: int = 0
+    tokens: int = 0
+    stopped_by: Optional[str] = None  # The limit that ended the expansion, if any
+    per_wave: List[int] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "waves": self.waves,
+            "situations": self.situations,
+            "failed": self.failed,
+            "tokens": self.tokens,
+            "stopped_by": self.stopped_by,
+            "per_wave": self.per_wave,
+        }
+
+
+def collector_tokens(collector: Any) -> int:
+    """Input plus output tokens of every call a Collector has seen."""
+    if collector is None:
+        return 0
+    usage = collector.usage
+    return (usage.input_tokens or 0) + (usage.output_tokens or 0)
+
+
+class FrontierExpander:
+    """Closes dangling choices wave by wave with a pool of workers."""
+
+    def __init__(
+        self,
+        fill: Callable[[Arc, Choice], Awaitable[Optional[Situation]]],
+        limits: FrontierLimits = FrontierLimits(),
+        collector: Any = None,
+        on_wave_done: Optional[Callable[[int, List[Situation]], Awaitable[None]]] = None,
+        fill_batch: Optional[Callable[[List[FrontierItem]], Awaitable[List[Optional[Situation]]]]] = None,
+        extra_tokens: Optional[Callable[[], int]] = None,
+    ):
+        """
+        Args:
+            fill: Generates, connects and stores the situation for one choice;
+                returns it, or None if generation failed
+            limits: Depth, size and token limits and the worker count
+            collector: Collector whose token usage counts against the budget
+            on_wave_done: Called with the wave number and its new situations
+            fill_batch: Fills a whole wave at once, returning a situation or
+                None per item; replaces the worker pool when given
+            extra_tokens: Returns tokens spent so far outside the collector
+                (e.g. BatchStats.tokens); they count against the budget too
+        """
+        self.fill = fill
+        self.limits = limits
+        self.collector = collector
+        self.on_wave_done = on_wave_done
+        self.fill_batch = fill_batch
+        self.extra_tokens = extra_tokens
+        self.stats = FrontierStats()
+        self._claimed: Set[int] = set()
+        self._arc_situation_ids: Dict[int, Set[str]] = {}
+        self._tokens_at_start = 0
+
+    def _tokens_total(self) -> int:
+        return collector_tokens(self.collector) + (self.extra_tokens() if self.extra_tokens is not None else 0)
+
+    def _tokens_spent(self) -> int:
+        return self._tokens_total() - self._tokens_at_start
+
+    def _limit_reached(self, in_flight: int = 0) -> Optional[str]:
+        # Count situations still being generated so workers don't overshoot max_situations
+        if self.stats.situations + in_flight >= self.limits.max_situations:
+            return "max_situations"
+        if self.limits.token_budget is not None and self._tokens_spent() >= self.limits.token_budget:
+            return "token_budget"
+        return None
+
+    def _frontier(self, arc: Arc, situations: List[Situation], depth: int) -> List[FrontierItem]:
+        """Unclaimed dangling choices among the given situations of an arc."""
+        if id(arc) not in self._arc_situation_ids:
+            self._arc_situation_ids[id(arc)] = {situation.id for situation in arc.situations}
+        known_ids = self._arc_situation_ids[id(arc)]
+        known_ids.update(situation.id for situation in situations)
+        items = []
+        for situation in situations:
+            for choice in situation.choices:
+                if choice.next_situation_id in known_ids or id(choice) in self._claimed:
+                    continue
+                self._claimed.add(id(choice))
+                items.append(FrontierItem(arc, choice, depth))
+        return items
+
+    async def _run_wave(self, items: List[FrontierItem]) -> List[FrontierItem]:
+        """Expand one wave; returns the frontier of the situations it created."""
+        queue: asyncio.Queue[FrontierItem] = asyncio.Queue()
+        for item in items:
+            queue.put_nowait(item)
+        in_flight = 0
+        next_items: List[FrontierItem] = []
+        created: List[Situation] = []
+
+        def record(item: FrontierItem, situation: Optional[Situation]) -> None:
+            if situation is None:
+                self.stats.failed += 1
+                return
+            self.stats.situations += 1
+            created.append(situation)
+            self._arc_situation_ids[id(item.arc)].add(situation.id)
+            if item.depth < self.limits.max_depth:
+                next_items.extend(self._frontier(item.arc, [situation], item.depth + 1))
+
+        async def worker() -> None:
+            nonlocal in_flight
+            while not queue.empty():
+                limit = self._limit_reached(in_flight)
+                if limit is not None:
+                    self.stats.stopped_by = self.stats.stopped_by or limit
+                    return
+                item = queue.get_nowait()
+                in_flight += 1
+                try:
+                    situation = await self.fill(item.arc, item.choice)
+                finally:
+                    in_flight -= 1
+                record(item, situation)
+
+        if self.fill_batch is None:
+            await asyncio.gather(*(worker() for _ in range(min(self.limits.workers, len(items)))))
+        else:
+            limit = self._limit_reached()
+            room = self.limits.max_situations - self.stats.situations
+            if limit is None and len(items) > room:
+                limit = "max_situations"
+            if limit is not None:
+                self.stats.stopped_by = limit
+                items = items[:room] if limit == "max_situations" else []
+            if items:
+                for item, situation in zip(items, await self.fill_batch(items)):
+                    record(item, situation)
+        self.stats.waves += 1
+        self.stats.per_wave.append(len(created))
+        if self.on_wave_done is not None:
+            await self.on_wave_done(self.stats.waves, created)
+        return next_items
+
+    async def expand(self, arcs: List[Arc]) -> FrontierStats:
+        """Expand every arc's dangling choices up to the limits."""
+        return await self.expand_from([item for arc in arcs for item in self._frontier(arc, list(arc.situations), 1)])
+
+    async def expand_from(self, items: List[FrontierItem]) -> FrontierStats:
+        """Expand only the given dangling choices, and what they lead to, up to the limits."""
+        self._tokens_at_start = self._tokens_total()
+        for item in items:
+            self._claimed.add(id(item.choice))
+            self._arc_situation_ids.setdefault(id(item.arc), {situation.id for situation in item.arc.situations})
+        while items and self.stats.stopped_by is None:
+            logger.info(f"Frontier wave {self.stats.waves + 1}: {len(items)} dangling choices at depth {items[0].depth}")
+            items = await self._run_wave(items)
+        self.stats.tokens = self._tokens_spent()
+        return self.stats
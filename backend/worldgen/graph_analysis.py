@@ -0,0 +1,341 @@
+"""
+Static analysis of generated situation graphs.
+
+Works on both in-memory arcs (``Arc`` models from the BAML client) and saved
+JSON files. All passes are linear in the number of situations and choices,
+except stat-interval propagation, which is bounded by widening.
+
+- Dangling choices: ``next_situation_id`` missing or pointing nowhere
+- Reachability: situations reachable from each arc root
+- Cycles: strongly connected components (iterative Tarjan)
+- Unsatisfiable choices: requirements no reachable stat range can meet
+"""
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger("worldgen")
+
+INF = float("inf")
+WIDEN_AFTER = 8  # Updates per situation before unstable bounds are widened to infinity
+
+
+@dataclass(frozen=True)
+class ChoiceEdge:
+    """A choice reduced to what the analysis needs."""
+    situation_id: str
+    choice_id: str
+    next_situation_id: Optional[str]
+    requirements: Tuple[Tuple[str, int], ...] = ()
+    stat_changes: Tuple[Tuple[str, int], ...] = ()
+
+
+@dataclass
+class SituationGraph:
+    """Situations and their outgoing choices, grouped by arc."""
+    choices: Dict[str, List[ChoiceEdge]] = field(default_factory=dict)  # situation_id -> outgoing choices
+    arc_roots: Dict[str, str] = field(default_factory=dict)  # arc title -> root situation id
+    arc_of: Dict[str, str] = field(default_factory=dict)  # situation_id -> arc title
+
+    def add_situation(self, arc_title: str, situation_id: str, choices: Iterable[Dict[str, Any]]) -> None:
+        if situation_id in self.choices:
+            return
+        if arc_title not in self.arc_roots:
+            self.arc_roots[arc_title] = situation_id
+        self.arc_of[situation_id] = arc_title
+        self.choices[situation_id] = [
+            ChoiceEdge(
+                situation_id=situation_id,
+                choice_id=choice.get("id", ""),
+                next_situation_id=choice.get("next_situation_id"),
+                requirements=tuple((choice.get("requirements") or {}).items()),
+                stat_changes=tuple((choice.get("stat_changes") or {}).items()),
+            )
+            for choice in choices
+        ]
+
+    def successors(self, situation_id: str) -> List[str]:
+        return [
+            edge.next_situation_id for edge in self.choices.get(situation_id, [])
+            if edge.next_situation_id in self.choices
+        ]
+
+
+def graph_from_arcs(arcs: Iterable[Any]) -> SituationGraph:
+    """Build a SituationGraph from in-memory Arc models."""
+    graph = SituationGraph()
+    for arc in arcs:
+        for situation in arc.situations:
+            graph.add_situation(arc.seed.title, situation.id, [
+                {
+                    "id": choice.id,
+                    "next_situation_id": choice.next_situation_id,
+                    "requirements": choice.requirements,
+                    "stat_changes": choice.stat_changes,
+                }
+                for choice in situation.choices
+            ])
+    return graph
+
+
+def graph_from_save(save: Dict[str, Any]) -> SituationGraph:
+    """Build a SituationGraph from a loaded save file."""
+    graph = SituationGraph()
+    for arc in save.get("arcs", []):
+        for situation_id, situation in arc.get("situations", {}).items():
+            graph.add_situation(arc.get("id", ""), situation_id, situation.get("choices", []))
+    return graph
+
+
+def dangling_choices(situations: Iterable[Any]) -> List[Tuple[Any, Any]]:
+    """Find in-memory choices whose next_situation_id is missing or unknown.
+
+    Args:
+        situations: Situation models to check; only ids among them count as valid targets
+
+    Returns:
+        List of (situation, choice) pairs
+    """
+    situations = list(situations)
+    known_ids = {situation.id for situation in situations}
+    return [
+        (situation, choice)
+        for situation in situations
+        for choice in situation.choices
+        if choice.next_situation_id is None or choice.next_situation_id not in known_ids
+    ]
+
+
+def find_dangling_edges(graph: SituationGraph) -> List[ChoiceEdge]:
+    """Find choices that lead nowhere or to situations that don't exist."""
+    return [
+        edge for edges in graph.choices.values() for edge in edges
+        if edge.next_situation_id not in graph.choices
+    ]
+
+
+def reachable_from(graph: SituationGraph, root: str) -> Set[str]:
+    """Breadth-first reachability from a single situation."""
+    if root not in graph.choices:
+        return set()
+    seen = {root}
+    queue = deque([root])
+    while queue:
+        for child in graph.successors(queue.popleft()):
+            if child not in seen:
+                seen.add(child)
+                queue.append(child)
+    return seen
+
+
+def strongly_connected_components(graph: SituationGraph) -> List[List[str]]:
+    """Iterative Tarjan's algorithm over the situation graph."""
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+    counter = 0
+
+    for start in graph.choices:
+        if start in index:
+            continue
+        index[start] = lowlink[start] = counter
+        counter += 1
+        stack.append(start)
+        on_stack.add(start)
+        work = [(start, iter(graph.successors(start)))]
+        while work:
+            node, children = work[-1]
+            child = next(children, None)
+            if child is not None:
+                if child not in index:
+                    index[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(graph.successors(child))))
+                elif child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+
+def find_cycles(graph: SituationGraph) -> List[List[str]]:
+    """Return the SCCs that contain a cycle (size > 1 or a self loop)."""
+    return [
+        component for component in strongly_connected_components(graph)
+        if len(component) > 1 or component[0] in graph.successors(component[0])
+    ]
+
+
+Interval = Tuple[float, float]
+
+
+def propagate_stat_intervals(graph: SituationGraph, start_stats: Dict[str, int]) -> Dict[str, Dict[str, Interval]]:
+    """Compute the range each stat can take on arrival at each situation.
+
+    Starts every arc root at ``start_stats`` and pushes intervals along choices
+    whose requirements can be met. Taking a choice raises the lower bound to its
+    requirement before applying stat changes. Bounds that keep moving (cycles
+    with stat gains) are widened to infinity so the pass terminates.
+
+    Returns:
+        situation_id -> stat -> (low, high) for every reachable situation
+    """
+    start = {stat: (value, value) for stat, value in start_stats.items()}
+    intervals: Dict[str, Dict[str, Interval]] = {}
+    updates: Dict[str, int] = {}
+    queue = deque()
+    for root in graph.arc_roots.values():
+        intervals[root] = dict(start)
+        queue.append(root)
+
+    while queue:
+        situation_id = queue.popleft()
+        current = intervals[situation_id]
+        for edge in graph.choices[situation_id]:
+            if edge.next_situation_id not in graph.choices:
+                continue
+            outgoing = dict(current)
+            satisfiable = True
+            for stat, minimum in edge.requirements:
+                low, high = outgoing.get(stat, (0, 0))
+                if high < minimum:
+                    satisfiable = False
+                    break
+                outgoing[stat] = (max(low, minimum), high)
+            if not satisfiable:
+                continue
+            for stat, change in edge.stat_changes:
+                low, high = outgoing.get(stat, (0, 0))
+                outgoing[stat] = (low + change, high + change)
+
+            target = edge.next_situation_id
+            existing = intervals.get(target)
+            if existing is None:
+                intervals[target] = outgoing
+                queue.append(target)
+                continue
+            merged = dict(existing)
+            changed = False
+            widen = updates.get(target, 0) >= WIDEN_AFTER
+            for stat, (low, high) in outgoing.items():
+                old_low, old_high = merged.get(stat, (low, high))
+                new_low, new_high = min(old_low, low), max(old_high, high)
+                if (new_low, new_high) != (old_low, old_high) or stat not in merged:
+                    if widen:
+                        new_low = -INF if new_low < old_low else new_low
+                        new_high = INF if new_high > old_high else new_high
+                    merged[stat] = (new_low, new_high)
+                    changed = True
+            if changed:
+                intervals[target] = merged
+                updates[target] = updates.get(target, 0) + 1
+                queue.append(target)
+    return intervals
+
+
+def find_unsatisfiable_choices(graph: SituationGraph, intervals: Dict[str, Dict[str, Interval]]) -> List[ChoiceEdge]:
+    """Find choices at reachable situations whose requirements can never be met."""
+    unsatisfiable = []
+    for situation_id, stats in intervals.items():
+        for edge in graph.choices[situation_id]:
+            if any(stats.get(stat, (0, 0))[1] < minimum for stat, minimum in edge.requirements):
+                unsatisfiable.append(edge)
+    return unsatisfiable
+
+
+@dataclass
+class AnalysisReport:
+    """Results of analyze()."""
+    situation_count: int
+    choice_count: int
+    dangling: List[ChoiceEdge]
+    reachable: Dict[str, Set[str]]  # arc title -> situations reachable from its root
+    unreachable: List[str]
+    cycles: List[List[str]]
+    unsatisfiable: List[ChoiceEdge]
+
+    def summary(self) -> str:
+        return (
+            f"{self.situation_count} situations, {self.choice_count} choices: "
+            f"{len(self.dangling)} dangling choices, {len(self.unreachable)} unreachable situations, "
+            f"{len(self.cycles)} cycles, {len(self.unsatisfiable)} unsatisfiable choices"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "situation_count": self.situation_count,
+            "choice_count": self.choice_count,
+            "dangling": [{"situation_id": e.situation_id, "choice_id": e.choice_id, "next_situation_id": e.next_situation_id} for e in self.dangling],
+            "reachable": {arc: sorted(ids) for arc, ids in self.reachable.items()},
+            "unreachable": self.unreachable,
+            "cycles": self.cycles,
+            "unsatisfiable": [{"situation_id": e.situation_id, "choice_id": e.choice_id, "requirements": dict(e.requirements)} for e in self.unsatisfiable],
+        }
+
+
+def analyze(graph: SituationGraph, start_stats: Dict[str, int]) -> AnalysisReport:
+    """Run every analysis pass over a situation graph."""
+    reachable = {arc: reachable_from(graph, root) for arc, root in graph.arc_roots.items()}
+    reached = set().union(*reachable.values()) if reachable else set()
+    intervals = propagate_stat_intervals(graph, start_stats)
+    return AnalysisReport(
+        situation_count=len(graph.choices),
+        choice_count=sum(len(edges) for edges in graph.choices.values()),
+        dangling=find_dangling_edges(graph),
+        reachable=reachable,
+        unreachable=[situation_id for situation_id in graph.choices if situation_id not in reached],
+        cycles=find_cycles(graph),
+        unsatisfiable=find_unsatisfiable_choices(graph, intervals),
+    )
+
+
+def analyze_arcs(arcs: Iterable[Any], start_stats: Dict[str, int]) -> AnalysisReport:
+    """Analyze in-memory arcs."""
+    return analyze(graph_from_arcs(arcs), start_stats)
+
+
+def analyze_save(save_path: str) -> AnalysisReport:
+    """Analyze a saved step file."""
+    with open(save_path, 'r', encoding='utf-8') as f:
+        save = json.load(f)
+    return analyze(graph_from_save(save), save.get("player_state", {}).get("stats", {}))
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python graph_analysis.py <save_file> [--json]")
+        sys.exit(1)
+
+    report = analyze_save(sys.argv[1])
+    if "--json" in sys.argv:
+        print(json.dumps(report.to_dict(), indent=2))
+        sys.exit(0)
+    print(report.summary())
+    for edge in report.dangling:
+        print(f"Dangling: {edge.situation_id} / {edge.choice_id} -> {edge.next_situation_id}")
+    for situation_id in report.unreachable:
+        print(f"Unreachable: {situation_id}")
+    for cycle in report.cycles:
+        print(f"Cycle: {' -> '.join(cycle)}")
+    for edge in report.unsatisfiable:
+        print(f"Unsatisfiable: {edge.situation_id} / {edge.choice_id} requires {dict(edge.requirements)}")
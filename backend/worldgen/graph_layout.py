@@ -0,0 +1,229 @@
+"""
+Layered layout precomputation for the situation graph viewer.
+
+Every saved generation step gets a companion ``*.layout.json`` file holding
+ReactFlow-ready nodes (with x/y positions) and edges, so the frontend does not
+have to position anything itself. Layout is incremental: nodes that already
+have a position keep it, and only newly generated situations are placed.
+"""
+import json
+import logging
+import os
+from collections import defaultdict, deque
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger("worldgen")
+
+LAYER_SPACING = 200  # Vertical distance between layers
+NODE_SPACING = 250  # Horizontal distance between nodes in the same layer
+LAYOUT_SUFFIX = ".layout.json"
+
+
+def layout_path_for(save_path: str) -> str:
+    """Get the path of the layout file that sits next to a save file."""
+    base, _ = os.path.splitext(save_path)
+    return base + LAYOUT_SUFFIX
+
+
+def build_situation_graph(arcs: List[Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """Collect nodes and choice edges from exported arcs.
+
+    Args:
+        arcs: The "arcs" list of a save file (situations keyed by id)
+
+    Returns:
+        A tuple of (nodes, edges). Nodes map situation id -> node data, edges are
+        ReactFlow edge dicts. Choices pointing at unknown situations produce
+        nodes flagged as missing.
+    """
+    nodes: Dict[str, Dict[str, Any]] = {}
+    edges: List[Dict[str, Any]] = []
+    for arc in arcs:
+        for situation_id, situation in arc.get("situations", {}).items():
+            nodes[situation_id] = {"label": situation_id, "arc": arc.get("id"), "missing": False}
+    for arc in arcs:
+        for situation_id, situation in arc.get("situations", {}).items():
+            for choice in situation.get("choices", []):
+                next_situation_id = choice.get("next_situation_id")
+                if not next_situation_id:
+                    continue
+                if next_situation_id not in nodes:
+                    nodes[next_situation_id] = {"label": "MISSING: " + next_situation_id, "arc": arc.get("id"), "missing": True}
+                edges.append({
+                    "id": f"{situation_id}:{choice.get('id', '')}",
+                    "source": situation_id,
+                    "target": next_situation_id,
+                    "label": choice.get("text", ""),
+                })
+    return nodes, edges
+
+
+def _acyclic_successors(node_ids: List[str], edges: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Drop back edges (found by DFS) so the remaining graph is a DAG."""
+    successors: Dict[str, List[str]] = defaultdict(list)
+    for edge in edges:
+        successors[edge["source"]].append(edge["target"])
+
+    dag: Dict[str, List[str]] = defaultdict(list)
+    state: Dict[str, int] = {}  # 1 = on stack, 2 = finished
+    for start in node_ids:
+        if start in state:
+            continue
+        state[start] = 1
+        stack = [(start, iter(successors[start]))]
+        while stack:
+            node, it = stack[-1]
+            child = next(it, None)
+            if child is None:
+                state[node] = 2
+                stack.pop()
+                continue
+            if state.get(child) == 1:
+                continue  # Back edge, would create a cycle
+            dag[node].append(child)
+            if child not in state:
+                state[child] = 1
+                stack.append((child, iter(successors[child])))
+    return dag
+
+
+class GraphLayout:
+    """Incremental layered (Sugiyama-style) layout of the situation graph.
+
+    Layers come from longest-path layering over the graph with back edges
+    removed; within a layer, new nodes are ordered by the barycenter of their
+    already placed predecessors and dropped into the nearest free slot.
+    """
+
+    def __init__(self, positions: Optional[Dict[str, Dict[str, int]]] = None):
+        self.positions: Dict[str, Dict[str, int]] = dict(positions or {})  # node id -> {"x", "y", "layer"}
+
+    @classmethod
+    def from_file(cls, path: str) -> 'GraphLayout':
+        """Load positions from a previously written layout file."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls({
+            node["id"]: {"x": node["position"]["x"], "y": node["position"]["y"], "layer": node.get("layer", 0)}
+            for node in data.get("nodes", [])
+        })
+
+    def update(self, arcs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Place any new nodes and return the ReactFlow-ready layout.
+
+        Args:
+            arcs: The "arcs" list of a save file
+
+        Returns:
+            Dict with "nodes" and "edges" lists
+        """
+        nodes, edges = build_situation_graph(arcs)
+        node_ids = list(nodes)
+        dag = _acyclic_successors(node_ids, edges)
+
+        predecessors: Dict[str, List[str]] = defaultdict(list)
+        in_degree = {node_id: 0 for node_id in node_ids}
+        for source, targets in dag.items():
+            for target in targets:
+                predecessors[target].append(source)
+                in_degree[target] += 1
+
+        # Longest-path layering in topological order; placed nodes keep their layer
+        layers: Dict[str, int] = {}
+        queue = deque(node_id for node_id in node_ids if in_degree[node_id] == 0)
+        order: List[str] = []
+        while queue:
+            node_id = queue.popleft()
+            order.append(node_id)
+            if node_id in self.positions:
+                layers[node_id] = self.positions[node_id]["layer"]
+            else:
+                layers[node_id] = max((layers[p] + 1 for p in predecessors[node_id]), default=0)
+            for child in dag[node_id]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    queue.append(child)
+
+        occupied: Dict[int, Set[int]] = defaultdict(set)  # layer -> occupied slots
+        for node_id, position in self.positions.items():
+            occupied[position["layer"]].add(position["x"] // NODE_SPACING)
+
+        new_by_layer: Dict[int, List[str]] = defaultdict(list)
+        for node_id in order:
+            if node_id not in self.positions:
+                new_by_layer[layers[node_id]].append(node_id)
+
+        placed = 0
+        for layer in sorted(new_by_layer):
+            def barycenter(node_id: str) -> float:
+                xs = [self.positions[p]["x"] / NODE_SPACING for p in predecessors[node_id] if p in self.positions]
+                if not xs:
+                    return float(max(occupied[layer], default=-1) + 1)
+                return sum(xs) / len(xs)
+
+            for node_id in sorted(new_by_layer[layer], key=barycenter):
+                slot = self._nearest_free_slot(occupied[layer], round(barycenter(node_id)))
+                occupied[layer].add(slot)
+                self.positions[node_id] = {"x": slot * NODE_SPACING, "y": layer * LAYER_SPACING, "layer": layer}
+                placed += 1
+        logger.debug(f"Graph layout placed {placed} new nodes ({len(nodes)} total)")
+
+        return {
+            "nodes": [{
+                "id": node_id,
+                "position": {"x": self.positions[node_id]["x"], "y": self.positions[node_id]["y"]},
+                "layer": self.positions[node_id]["layer"],
+                "data": data,
+            } for node_id, data in nodes.items()],
+            "edges": edges,
+        }
+
+    @staticmethod
+    def _nearest_free_slot(occupied: Set[int], target: int) -> int:
+        """Find the free slot closest to the target, preferring the right side."""
+        target = max(target, 0)
+        offset = 0
+        while True:
+            if target + offset not in occupied:
+                return target + offset
+            if target - offset >= 0 and target - offset not in occupied:
+                return target - offset
+            offset += 1
+
+    def write(self, save_path: str, arcs: List[Dict[str, Any]]) -> str:
+        """Update the layout and write it next to the given save file.
+
+        Returns:
+            The path of the written layout file
+        """
+        layout = self.update(arcs)
+        path = layout_path_for(save_path)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(layout, f)
+        return path
+
+
+def layout_save_folder(save_path: str) -> List[str]:
+    """Compute layouts for every step file in a save folder, in step order."""
+    step_files = sorted(
+        file for file in os.listdir(save_path)
+        if file.startswith("step_") and file.endswith(".json") and not file.endswith(LAYOUT_SUFFIX)
+    )
+    graph_layout = GraphLayout()
+    written = []
+    for file in step_files:
+        with open(os.path.join(save_path, file), 'r', encoding='utf-8') as f:
+            save = json.load(f)
+        written.append(graph_layout.write(os.path.join(save_path, file), save.get("arcs", [])))
+    return written
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python graph_layout.py <save_path>")
+        sys.exit(1)
+
+    for path in layout_save_folder(sys.argv[1]):
+        print(f"Wrote {path}")
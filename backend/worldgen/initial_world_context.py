@@ -6,14 +6,18 @@ factions, districts, NPCs, and the root situation that both the traditional
 world generator and the agentic world generator use.
 """
 
-from .baml_client.types import (
-    WorldContext, Technology, Faction, District, NPC, 
-    Situation, Choice, PlayerState, PlayerStats, PlayerAttribute, PlayerProfile
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .baml_client.types import PlayerState, WorldContext
 
 
 def create_initial_world_context(seed) -> WorldContext:
     """Create the initial world context with all default content for Libertas city."""
+    # Imported here so that importing this module doesn't build the BAML runtime
+    from .baml_client.types import WorldContext, Technology, Faction, District, NPC, Situation, Choice
     return WorldContext(
         seed=seed,
         technologies=[
@@ -223,6 +227,7 @@ People that are born in the city are referred to as "Lifers", i.e they will be t
 
 def create_initial_player_state() -> PlayerState:
     """Create the initial player state for Sierra Violet."""
+    from .baml_client.types import PlayerState, PlayerStats, PlayerAttribute, PlayerProfile
     return PlayerState(
         name="Sierra Violet",
         stats=PlayerStats(
@@ -0,0 +1,48 @@
+"""
+Lazy access to the generated BAML client.
+
+Importing anything from ``baml_client`` runs its package ``__init__``, which
+imports the sync client and builds the ``BamlRuntime`` in ``globals.py``. Modules
+that only need the client once they actually make a call import ``b`` and
+``baml_types`` from here instead; both are resolved on first attribute access.
+
+Type annotations should import from ``baml_client.types`` under
+``TYPE_CHECKING`` so they cost nothing at runtime.
+"""
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Optional
+
+
+class _LazyAttribute:
+    """Proxy for ``module.attribute`` that imports the module on first use."""
+
+    def __init__(self, module_name: str, attribute: Optional[str] = None):
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target: Any = None
+
+    def _resolve(self) -> Any:
+        if self._target is None:
+            module: ModuleType = importlib.import_module(self._module_name, __package__)
+            self._target = getattr(module, self._attribute) if self._attribute else module
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<lazy {self._module_name}{'.' + self._attribute if self._attribute else ''} ({state})>"
+
+
+# The async client instance, as in `from .baml_client.async_client import b`
+b: Any = _LazyAttribute(".baml_client.async_client", "b")
+# The generated pydantic types module, as in `from .baml_client import types`
+baml_types: Any = _LazyAttribute(".baml_client.types")
+
+
+def is_loaded() -> bool:
+    """Whether the BAML runtime has been constructed yet."""
+    return f"{__package__}.baml_client.globals" in sys.modules
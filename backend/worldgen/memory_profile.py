@@ -0,0 +1,193 @@
+"""
+Opt-in memory profiling per generation step.
+
+``MemoryProfiler`` keeps ``tracemalloc`` running and, each time a world
+finishes a step, takes a snapshot, diffs it against the previous one and measures the
+structures a long run accumulates (world state tree nodes, their contexts,
+situations, the agent's action history). World and AgentWorld store the
+result under ``"memory"`` in that step's metrics.jsonl record:
+
+- ``traced_kb`` / ``peak_kb``: memory traced by tracemalloc now / so far
+- ``growth_kb``: change since the previous step
+- ``top_growth``: the allocation sites (file:line) that grew the most
+- ``structures``: deep size and item count of each structure. Objects shared
+  between structures count once, toward the first structure listed
+
+Enable it with ``world.memory_profiler = MemoryProfiler()`` (or
+``--memory-profile`` on world_generator.py and test_agent_world.py). Tracing
+stops when generate (or regenerate) returns and resumes with the next call.
+Print the trend of a run with:
+
+    python -m backend.worldgen.memory_profile saves/Libertas_agent_20250622_024014
+"""
+import functools
+import gc
+import os
+import sys
+import tracemalloc
+from types import FunctionType, ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Snapshots leave out the profiler's own bookkeeping
+_IGNORED_FILES = (__file__, tracemalloc.__file__, "<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>", "<unknown>")
+
+
+def _site(frame: tracemalloc.Frame) -> str:
+    """file:line, relative to site-packages or the working directory where possible."""
+    filename = frame.filename
+    if f"site-packages{os.sep}" in filename:
+        filename = filename.split(f"site-packages{os.sep}", 1)[1]
+    elif filename.startswith(os.getcwd()):
+        filename = os.path.relpath(filename)
+    return f"{filename}:{frame.lineno}"
+
+
+def deep_size(roots: Iterable[Any], seen: Set[int]) -> int:
+    """Bytes of every object reachable from roots and not already in seen (which is updated)."""
+    size = 0
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (type, ModuleType, FunctionType)):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return size
+
+
+class MemoryProfiler:
+    """tracemalloc snapshots diffed step to step, plus structure sizes."""
+
+    def __init__(self, top: int = 10, frames: int = 1):
+        """
+        Args:
+            top: Allocation sites to keep per step
+            frames: Stack frames tracemalloc records per allocation
+        """
+        self.top = top
+        self.frames = frames
+        self._started_tracing = False
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        # Set while a generation method decorated with with_world_memory_profiler runs
+        self.in_call = False
+        self.start()
+
+    @property
+    def active(self) -> bool:
+        return self._previous is not None
+
+    def start(self) -> None:
+        """Start tracing, unless something else already is, and take the baseline snapshot."""
+        if self.active:
+            return
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(self.frames)
+        self._previous = self._snapshot()
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, filename) for filename in _IGNORED_FILES]
+        )
+
+    def step(self, structures: List[Tuple[str, List[Any]]]) -> Dict[str, Any]:
+        """Measure memory now.
+
+        Args:
+            structures: (name, root objects) pairs, measured in order
+
+        Returns:
+            The "memory" field for the step's metrics record
+        """
+        self.start()
+        snapshot = self._snapshot()
+        differences = snapshot.compare_to(self._previous, "lineno")
+        self._previous = snapshot
+        traced, peak = tracemalloc.get_traced_memory()
+        seen: Set[int] = set()
+        return {
+            "traced_kb": round(traced / 1024),
+            "peak_kb": round(peak / 1024),
+            "growth_kb": round(sum(difference.size_diff for difference in differences) / 1024, 1),
+            "top_growth": [
+                {
+                    "site": _site(difference.traceback[0]),
+                    "size_diff_kb": round(difference.size_diff / 1024, 1),
+                    "count_diff": difference.count_diff,
+                }
+                for difference in differences[:self.top] if difference.size_diff > 0
+            ],
+            "structures": {
+                name: {"kb": round(deep_size(roots, seen) / 1024, 1), "count": len(roots)}
+                for name, roots in structures
+            },
+        }
+
+    def stop(self) -> None:
+        """Stop tracing if this profiler started it; start() or the next step() resumes."""
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+        self._previous = None
+
+
+def with_world_memory_profiler(method: Callable) -> Callable:
+    """Decorator for a world's async generation methods.
+
+    Traces memory with ``self.memory_profiler`` (when set) for the duration of
+    the call and stops it when the call returns.
+    """
+    @functools.wraps(method)
+    async def wrapper(world, *args, **kwargs):
+        profiler = getattr(world, "memory_profiler", None)
+        if profiler is None or profiler.in_call:
+            return await method(world, *args, **kwargs)
+        profiler.in_call = True
+        profiler.start()
+        try:
+            return await method(world, *args, **kwargs)
+        finally:
+            profiler.in_call = False
+            profiler.stop()
+    return wrapper
+
+
+def walk_tree(root: Any) -> List[Any]:
+    """Every node of a world state tree (World or AgentWorld), depth first."""
+    nodes = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(node.child_nodes)
+    return nodes
+
+
+def unique_contexts(nodes: List[Any]) -> List[Any]:
+    """The distinct context objects of a list of tree nodes."""
+    contexts: Dict[int, Any] = {}
+    for node in nodes:
+        contexts.setdefault(id(node.context), node.context)
+    return list(contexts.values())
+
+
+if __name__ == "__main__":
+    from .run_metrics import load_metrics
+
+    if len(sys.argv) != 2:
+        print("Usage: python -m backend.worldgen.memory_profile <run_folder>")
+        sys.exit(1)
+    records = [record for record in load_metrics(sys.argv[1]) if "memory" in record]
+    if not records:
+        print("No memory records; run with a MemoryProfiler set on the world")
+        sys.exit(1)
+    names = list(records[0]["memory"]["structures"])
+    print(f"{'step':>4} {'traced KiB':>11} {'growth KiB':>11} " + " ".join(f"{name + ' KiB':>16}" for name in names) + "  top growth site")
+    for record in records:
+        memory = record["memory"]
+        top: Optional[Dict[str, Any]] = memory["top_growth"][0] if memory["top_growth"] else None
+        print(f"{record['step']:>4} {memory['traced_kb']:>11} {memory['growth_kb']:>11} "
+              + " ".join(f"{memory['structures'].get(name, {}).get('kb', 0):>16}" for name in names)
+              + (f"  {top['site']} (+{top['size_diff_kb']} KiB)" if top else ""))
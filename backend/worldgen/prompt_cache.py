@@ -0,0 +1,155 @@
+"""
+Prompt-prefix stability and provider prompt-cache measurement.
+
+Providers cache the longest previously seen prompt prefix, so a prompt only
+gets cheap cached input tokens if everything before the first changed byte is
+identical to an earlier call. The BAML prompts put the world context first and
+render it from least to most often changed (seed, root, districts,
+technologies, factions, NPCs). This module keeps the entity lists themselves
+in a canonical, append-only order: every entity gets a sequence number the
+first time it is seen in a run, and lists are always rendered in that order,
+no matter which branch or merge added them. New entities therefore only ever
+extend the tail of a list.
+
+Cache hits are read back from the BAML Collector (the provider's usage block
+in the raw HTTP response).
+"""
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger("worldgen")
+
+# WorldContext lists that grow during generation, in prompt order
+ORDERED_KINDS = ("districts", "technologies", "factions", "npcs")
+
+
+def _entity_key(entity: Any) -> str:
+    return getattr(entity, "id", None) or entity.name
+
+
+class ContextOrder:
+    """First-seen sequence numbers for world context entities across a run."""
+
+    def __init__(self):
+        self.sequence: Dict[Tuple[str, str], int] = {}
+
+    @classmethod
+    def from_context(cls, context: Any) -> 'ContextOrder':
+        """Register the initial world lore so it always renders first."""
+        order = cls()
+        order.canonicalize(context)
+        return order
+
+    def _position(self, kind: str, entity: Any) -> int:
+        key = (kind, _entity_key(entity))
+        if key not in self.sequence:
+            self.sequence[key] = len(self.sequence)
+        return self.sequence[key]
+
+    def canonicalize(self, context: Any) -> Any:
+        """Sort the context's entity lists into canonical order, in place.
+
+        Entities not seen before are registered in their current order, so
+        the sort is stable and existing prefixes never move.
+
+        Returns:
+            The same context, for chaining
+        """
+        for kind in ORDERED_KINDS:
+            entities = getattr(context, kind)
+            positions = [self._position(kind, entity) for entity in entities]
+            if any(a > b for a, b in zip(positions, positions[1:])):
+                entities.sort(key=lambda entity: self.sequence[(kind, _entity_key(entity))])
+        return context
+
+
+def cached_input_tokens(call: Any) -> Optional[int]:
+    """Cached prompt tokens reported by the provider for one LLM call, if any.
+
+    Handles the OpenAI (``prompt_tokens_details.cached_tokens``) and Anthropic
+    (``cache_read_input_tokens``) usage formats.
+    """
+    response = getattr(call, "http_response", None)
+    if response is None:
+        return None
+    try:
+        usage = response.body.json().get("usage") or {}
+    except Exception:
+        return None
+    if "prompt_tokens_details" in usage:
+        return (usage["prompt_tokens_details"] or {}).get("cached_tokens", 0)
+    if "cache_read_input_tokens" in usage:
+        return usage["cache_read_input_tokens"] or 0
+    return None
+
+
+@dataclass
+class FunctionCacheStats:
+    calls: int = 0
+    cache_hits: int = 0
+    input_tokens: int = 0
+    cached_tokens: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.cache_hits / self.calls if self.calls else 0.0
+
+    @property
+    def cached_fraction(self) -> float:
+        return self.cached_tokens / self.input_tokens if self.input_tokens else 0.0
+
+
+class PromptCacheStats:
+    """Per-function prompt cache hit rates, accumulated from a Collector."""
+
+    def __init__(self):
+        self.functions: Dict[str, FunctionCacheStats] = defaultdict(FunctionCacheStats)
+        # Collector logs are append-only; the ones past this index are new since the last observe()
+        self._observed = 0
+
+    def observe(self, collector: Any) -> None:
+        """Account for every call the collector logged since the last observe()."""
+        logs = collector.logs
+        new_logs, self._observed = logs[self._observed:], len(logs)
+        for log in new_logs:
+            call = log.selected_call
+            if call is None:
+                continue
+            stats = self.functions[log.function_name]
+            stats.calls += 1
+            stats.input_tokens += call.usage.input_tokens or 0
+            cached = cached_input_tokens(call) or 0
+            stats.cached_tokens += cached
+            stats.cache_hits += cached > 0
+
+    def totals(self) -> FunctionCacheStats:
+        total = FunctionCacheStats()
+        for stats in self.functions.values():
+            total.calls += stats.calls
+            total.cache_hits += stats.cache_hits
+            total.input_tokens += stats.input_tokens
+            total.cached_tokens += stats.cached_tokens
+        return total
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            name: {
+                "calls": stats.calls,
+                "cache_hits": stats.cache_hits,
+                "input_tokens": stats.input_tokens,
+                "cached_tokens": stats.cached_tokens,
+                "hit_rate": round(stats.hit_rate, 3),
+            }
+            for name, stats in sorted(self.functions.items())
+        }
+
+    def log_summary(self) -> None:
+        total = self.totals()
+        logger.info(
+            f"Prompt cache: {total.cache_hits}/{total.calls} calls hit, "
+            f"{total.cached_tokens}/{total.input_tokens} input tokens cached ({total.cached_fraction:.0%})"
+        )
+        for name, stats in sorted(self.functions.items()):
+            logger.info(f"  {name}: {stats.cache_hits}/{stats.calls} hits, {stats.cached_fraction:.0%} of input cached")
@@ -0,0 +1,125 @@
+"""
+Where each piece of a generated world came from.
+
+``Provenance`` records, as World generates, which LLM call produced each
+situation and choice and which choices carried each context entity (NPC,
+faction, technology). ``dependent_situations`` works out what has to go when
+one situation is regenerated: everything in its arc that can only be reached
+through it. Together they let ``World.regenerate`` and
+``World.regenerate_subtree`` throw away and redo just that part of a world.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .baml_client.types import Arc, Choice, Situation, WorldContext
+
+# Carrier of the initial world context's entities; never a choice id, so they are never orphaned
+INITIAL_CONTEXT = "<initial context>"
+
+
+@dataclass
+class Origin:
+    """The call that produced a situation or choice."""
+    function: str  # BAML function name
+    step: int  # World._generation_step at the time
+    arc: str  # Arc title
+    source_id: Optional[str] = None  # Choice a situation was generated for, or situation a choice was added to
+
+
+class Provenance:
+    """Origins of situations and choices, and the choices carrying each entity."""
+
+    def __init__(self):
+        self.situations: Dict[str, Origin] = {}
+        self.choices: Dict[str, Origin] = {}
+        # "kind:name" -> ids of the choices that carried the entity, the one that introduced it first
+        self.entities: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_context(cls, context: WorldContext, kinds: Iterable[str]) -> 'Provenance':
+        """Provenance whose entities start as the context's, each carried permanently."""
+        provenance = cls()
+        for kind in kinds:
+            provenance.record_entities(INITIAL_CONTEXT, kind, [entity.name for entity in getattr(context, kind)])
+        return provenance
+
+    def record_situation(self, situation: Situation, origin: Origin) -> None:
+        """Record a situation and the choices it was generated with."""
+        self.situations[situation.id] = origin
+        self.record_choices(situation.id, situation.choices, origin.function, origin.step, origin.arc)
+
+    def record_choices(self, situation_id: str, choices: Iterable[Choice], function: str, step: int, arc: str) -> None:
+        for choice in choices:
+            self.choices[choice.id] = Origin(function, step, arc, situation_id)
+
+    def record_entities(self, choice_id: str, kind: str, names: Iterable[str]) -> None:
+        for name in names:
+            carriers = self.entities.setdefault(f"{kind}:{name}", [])
+            if choice_id not in carriers:
+                carriers.append(choice_id)
+
+    def forget(self, situation_ids: Set[str], choice_ids: Set[str]) -> List[Tuple[str, str]]:
+        """Drop removed situations and choices.
+
+        Returns:
+            (kind, name) of every entity no remaining choice carries any more;
+            entities of the initial world context (see from_context) are never returned
+        """
+        for situation_id in situation_ids:
+            self.situations.pop(situation_id, None)
+        for choice_id in choice_ids:
+            self.choices.pop(choice_id, None)
+        orphaned = []
+        for key, carriers in list(self.entities.items()):
+            remaining = [choice_id for choice_id in carriers if choice_id not in choice_ids]
+            if remaining:
+                self.entities[key] = remaining
+                continue
+            del self.entities[key]
+            kind, name = key.split(":", 1)
+            orphaned.append((kind, name))
+        return orphaned
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "situations": {situation_id: asdict(origin) for situation_id, origin in self.situations.items()},
+            "choices": {choice_id: asdict(origin) for choice_id, origin in self.choices.items()},
+            "entities": self.entities,
+        }
+
+
+def _reachable(situations: Dict[str, Situation], start: str, blocked: Optional[str] = None) -> Dict[str, int]:
+    """Distance from start to every situation reachable from it without passing through blocked."""
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        situation_id = queue.popleft()
+        for choice in situations[situation_id].choices:
+            next_id = choice.next_situation_id
+            if next_id in situations and next_id not in distances and next_id != blocked:
+                distances[next_id] = distances[situation_id] + 1
+                queue.append(next_id)
+    return distances
+
+
+def dependent_situations(arc: Arc, situation_id: str) -> Tuple[Set[str], int]:
+    """Situations of an arc that are only reachable through the given one.
+
+    That is the situation itself plus every situation it dominates: reachable
+    from it, but not from the arc root once it is taken out. Situations other
+    paths still lead to are kept.
+
+    Returns:
+        The dependent situation ids, and how many choices deep below the
+        given situation the deepest of them is
+    """
+    situations = {situation.id: situation for situation in arc.situations}
+    below = _reachable(situations, situation_id)
+    root_id = arc.situations[0].id
+    still_reachable = _reachable(situations, root_id, blocked=situation_id) if root_id != situation_id else {}
+    dependents = {dependent for dependent in below if dependent not in still_reachable}
+    return dependents, max(below[dependent] for dependent in dependents)
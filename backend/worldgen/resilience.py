@@ -0,0 +1,448 @@
+"""
+Retries, circuit breaking and dead-lettering for generator LLM calls.
+
+``ResilientClient`` stands in for the async BAML client (``b``). Instead of
+sending every call to the ``ReforgedClient`` fallback chain, it walks the
+function's route (see routing.py) itself so it can:
+
+- give each BAML function its own retry budget and timeout, with jittered
+  exponential backoff between attempts
+- keep a circuit breaker per client, skipping clients that keep failing until
+  their cool-down has passed
+- report every call into the world's Collector
+- optionally answer repeated calls from a ``ResponseCache`` and space
+  requests with a shared rate limiter (see farm.py)
+- optionally hedge slow calls: once a call has run longer than its
+  function's observed p90, send the same request to the next client in the
+  route and take whichever valid answer comes first
+
+``DeadLetterQueue`` runs a generator's work items (one arc seed, one situation
+group, one agent action, ...) and keeps the ones that still failed, so they can
+be retried at the end of the step instead of aborting the whole run.
+"""
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, FrozenSet, List, Optional, Sequence, Tuple, Type
+
+from .lazy_baml import b
+from .response_cache import ResponseCache, cache_key
+from .routing import FALLBACK_CHAIN, RoutingTable
+from .span_trace import span
+
+logger = logging.getLogger("worldgen")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How hard to try one BAML function before giving up."""
+    max_attempts: int = 3
+    timeout: float = 120.0  # Seconds per attempt
+    base_delay: float = 1.0
+    max_delay: float = 20.0
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before the given retry (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+DEFAULT_POLICY = RetryPolicy()
+# Long generations get more time; cheap checks fail fast
+RETRY_POLICIES: Dict[str, RetryPolicy] = {
+    "SelectGenerationToolAndGenerate": RetryPolicy(max_attempts=4, timeout=240.0),
+    "ExpandArcSituations": RetryPolicy(max_attempts=3, timeout=300.0),
+    "AugmentSituationsChoices": RetryPolicy(max_attempts=2, timeout=240.0),
+    "GenerateJoinChoices": RetryPolicy(max_attempts=2, timeout=180.0),
+    "CheckTechnologyNeeds": RetryPolicy(max_attempts=2, timeout=30.0),
+    "CheckFactionNeeds": RetryPolicy(max_attempts=2, timeout=30.0),
+    "CheckChoiceAttributeNeeds": RetryPolicy(max_attempts=2, timeout=30.0),
+}
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """When to send a duplicate of a slow request to a second client."""
+    percentile: float = 0.9  # Hedge once a call runs longer than this share of its function's past calls
+    min_samples: int = 10  # Successful calls of a function needed before hedging it
+    min_delay: float = 2.0  # Seconds; never hedge sooner than this
+    functions: Optional[FrozenSet[str]] = None  # Functions to hedge; None hedges all of them
+
+
+class CircuitBreaker:
+    """Closed -> open after consecutive failures; half-open again after a cool-down.
+
+    While half-open, a single trial request at a time is let through; its
+    outcome closes or re-opens the breaker.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allows_request(self) -> bool:
+        state = self.state
+        return state == "closed" or (state == "half_open" and not self.trial_in_flight)
+
+    def start_request(self) -> bool:
+        """Note that an allowed request is being sent.
+
+        Returns:
+            Whether it is the half-open trial, which must be passed to end_trial
+        """
+        if self.state != "half_open":
+            return False
+        self.trial_in_flight = True
+        return True
+
+    def end_trial(self) -> None:
+        self.trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        # A failed trial request while half-open re-opens the breaker immediately
+        if self.consecutive_failures >= self.failure_threshold or self.opened_at is not None:
+            self.opened_at = time.monotonic()
+
+
+class CircuitOpen(Exception):
+    """A client's breaker refused a request: open, or half-open with its trial already in flight."""
+
+    def __init__(self, client_name: str):
+        super().__init__(f"{client_name}: circuit breaker open")
+        self.client_name = client_name
+
+
+class CallFailed(Exception):
+    """A BAML function failed on every attempt its retry policy allowed."""
+
+    def __init__(self, function_name: str, errors: List[str]):
+        super().__init__(f"{function_name} failed after {len(errors)} attempts: {errors[-1] if errors else 'no client available'}")
+        self.function_name = function_name
+        self.errors = errors
+
+
+class ResilientClient:
+    """Async BAML client wrapper: `await client.GenerateArcSeed(...)` as with `b`."""
+
+    def __init__(self, collector: Any = None, chain: Sequence[str] = FALLBACK_CHAIN,
+                 policies: Optional[Dict[str, RetryPolicy]] = None, routing: Optional[RoutingTable] = None,
+                 hedging: Optional[HedgePolicy] = None):
+        self.collector = collector
+        self.policies = dict(RETRY_POLICIES if policies is None else policies)
+        # Candidate clients per function; `chain` is the route of functions without one
+        self.routing = routing or RoutingTable(default=chain)
+        self.hedging = hedging
+        # Repeated calls are answered from the cache; requests wait on the (farm.RateLimiter) rate limiter
+        self.cache: Optional[ResponseCache] = None
+        self.refresh_cache = False  # Skip cache reads but still write results, e.g. while regenerating
+        self.rate_limiter: Any = None
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._registries: Dict[str, Any] = {}
+        self._latencies: Dict[str, Deque[float]] = {}  # function -> recent successful call latencies (ms)
+        # function -> calls/retries/failures/timeouts/hedged/hedge_wins/wasted_tokens
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def policy_for(self, function_name: str) -> RetryPolicy:
+        return self.policies.get(function_name, DEFAULT_POLICY)
+
+    def _registry(self, client_name: str) -> Any:
+        if client_name not in self._registries:
+            from baml_py import ClientRegistry
+            registry = ClientRegistry()
+            registry.set_primary(client_name)
+            self._registries[client_name] = registry
+        return self._registries[client_name]
+
+    def _breaker(self, client_name: str) -> CircuitBreaker:
+        return self.breakers.setdefault(client_name, CircuitBreaker())
+
+    def _next_client(self, function_name: str, attempt: int) -> Optional[str]:
+        """The first client from the attempt's position in the function's route whose breaker is not open."""
+        route = self.routing.order(function_name)
+        for offset in range(len(route)):
+            client_name = route[(attempt + offset) % len(route)]
+            if self._breaker(client_name).allows_request():
+                return client_name
+        return None
+
+    def _hedge_delay(self, function_name: str) -> Optional[float]:
+        """Seconds to wait before hedging a call, or None to not hedge it."""
+        if self.hedging is None or (self.hedging.functions is not None and function_name not in self.hedging.functions):
+            return None
+        latencies = self._latencies.get(function_name)
+        if latencies is None or len(latencies) < self.hedging.min_samples:
+            return None
+        ordered = sorted(latencies)
+        return max(self.hedging.min_delay, ordered[int(self.hedging.percentile * (len(ordered) - 1))] / 1000)
+
+    def _hedge_client(self, function_name: str, client_name: str) -> Optional[str]:
+        """The next client after client_name in the function's route whose breaker is not open."""
+        route = self.routing.order(function_name)
+        start = route.index(client_name) if client_name in route else -1
+        for offset in range(1, len(route) + 1):
+            candidate = route[(start + offset) % len(route)]
+            if candidate != client_name and self._breaker(candidate).allows_request():
+                return candidate
+        return None
+
+    def registry_for(self, function_name: str) -> Any:
+        """Client registry pinning a function to the client its first attempt would use."""
+        client_name = self._next_client(function_name, 0) or self.routing.order(function_name)[0]
+        return self._registry(client_name)
+
+    def options_for(self, client_name: str) -> Dict[str, Any]:
+        """BAML call options that pin a call to one client."""
+        options: Dict[str, Any] = {"client_registry": self._registry(client_name)}
+        if self.collector is not None:
+            options["collector"] = self.collector
+        return options
+
+    async def _call_client(self, function_name: str, client_name: str, kwargs: Dict[str, Any],
+                           usage: Any = None) -> Any:
+        """One request to one client, recorded in its breaker and the routing table.
+
+        Args:
+            usage: Extra Collector to report this request into
+        """
+        from baml_py.errors import BamlClientFinishReasonError, BamlError, BamlInvalidArgumentError, BamlValidationError
+
+        # Checked again here, with no await since, as other calls may have taken the half-open trial
+        breaker = self._breaker(client_name)
+        if not breaker.allows_request():
+            raise CircuitOpen(client_name)
+        trial = breaker.start_request()
+        options = self.options_for(client_name)
+        if usage is not None:
+            options["collector"] = [options["collector"], usage] if "collector" in options else usage
+        function = getattr(b.with_options(**options), function_name)
+        started = time.monotonic()
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+                started = time.monotonic()
+            with span(function_name, "llm_request", client=client_name):
+                result = await function(**kwargs)
+        except (BamlValidationError, BamlClientFinishReasonError):
+            # The client answered; the output just didn't parse or was cut off, so don't trip its breaker
+            self.routing.observe(function_name, client_name, (time.monotonic() - started) * 1000, ok=False)
+            raise
+        except BamlInvalidArgumentError:
+            # The call itself is wrong; no client is to blame
+            raise
+        except BamlError:
+            breaker.record_failure()
+            self.routing.observe(function_name, client_name, (time.monotonic() - started) * 1000, ok=False)
+            raise
+        finally:
+            # Cancelled or not, the trial is over; its outcome (if any) was recorded above
+            if trial:
+                breaker.end_trial()
+        latency_ms = (time.monotonic() - started) * 1000
+        breaker.record_success()
+        self.routing.observe(function_name, client_name, latency_ms, ok=True)
+        self._latencies.setdefault(function_name, deque(maxlen=100)).append(latency_ms)
+        return result
+
+    async def _attempt(self, function_name: str, client_name: str, kwargs: Dict[str, Any],
+                       stats: Dict[str, int]) -> Any:
+        """One attempt at a call, hedged on a second client if it runs long."""
+        delay = self._hedge_delay(function_name)
+        hedge_client = self._hedge_client(function_name, client_name) if delay is not None else None
+        if hedge_client is None:
+            return await self._call_client(function_name, client_name, kwargs)
+
+        from baml_py import Collector
+        primary_usage = Collector(name=f"{function_name}_primary")
+        hedge_usage = Collector(name=f"{function_name}_hedge")
+        primary = asyncio.ensure_future(self._call_client(function_name, client_name, kwargs, primary_usage))
+        pending = {primary}
+        winner = None
+        # Cancelled anywhere in the race (e.g. by the attempt timeout), no request is left running
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+
+            stats["hedged"] += 1
+            logger.info(f"{function_name} on {client_name} passed its p90 ({delay:.1f}s), hedging on {hedge_client}")
+            hedge = asyncio.ensure_future(self._call_client(function_name, hedge_client, kwargs, hedge_usage))
+            pending = {primary, hedge}
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+        finally:
+            for task in pending:
+                task.cancel()
+        if winner is None:
+            raise primary.exception()
+        if winner is hedge:
+            stats["hedge_wins"] += 1
+        winner_usage, loser_usage = (primary_usage, hedge_usage) if winner is primary else (hedge_usage, primary_usage)
+        loser_tokens = (loser_usage.usage.input_tokens or 0) + (loser_usage.usage.output_tokens or 0)
+        # A cancelled request reports no usage; it had sent the same prompt as the winner
+        stats["wasted_tokens"] += loser_tokens or (winner_usage.usage.input_tokens or 0)
+        return winner.result()
+
+    async def call(self, function_name: str, **kwargs) -> Any:
+        """Call a BAML function with retries, timeouts, circuit breaking and optional hedging.
+
+        Raises:
+            CallFailed: If every attempt failed, or the arguments were invalid
+        """
+        with span(function_name, "llm_call"):
+            return await self._call(function_name, kwargs)
+
+    async def _call(self, function_name: str, kwargs: Dict[str, Any]) -> Any:
+        from baml_py.errors import BamlError, BamlInvalidArgumentError
+
+        policy = self.policy_for(function_name)
+        stats = self.stats.setdefault(function_name, {
+            "calls": 0, "retries": 0, "failures": 0, "timeouts": 0, "hedged": 0, "hedge_wins": 0, "wasted_tokens": 0,
+        })
+        stats["calls"] += 1
+        key = None
+        if self.cache is not None:
+            key = cache_key(function_name, kwargs)
+            hit, result = self.cache.get(key) if not self.refresh_cache else (False, None)
+            if hit:
+                return result
+        errors: List[str] = []
+        for attempt in range(policy.max_attempts):
+            client_name = self._next_client(function_name, attempt)
+            if client_name is None:
+                errors.append("every client's circuit breaker is open")
+                break
+            if attempt:
+                stats["retries"] += 1
+                await asyncio.sleep(policy.backoff(attempt))
+            try:
+                result = await asyncio.wait_for(self._attempt(function_name, client_name, kwargs, stats), timeout=policy.timeout)
+            except asyncio.TimeoutError:
+                stats["timeouts"] += 1
+                self._breaker(client_name).record_failure()
+                self.routing.observe(function_name, client_name, policy.timeout * 1000, ok=False)
+                errors.append(f"{client_name}: timed out after {policy.timeout:.0f}s")
+            except BamlInvalidArgumentError as e:
+                # Every client would reject the same arguments
+                errors.append(f"{client_name}: {e}")
+                break
+            except CircuitOpen as e:
+                # Another call took this client's half-open trial; try the next client
+                errors.append(str(e))
+            except BamlError as e:
+                # Client, parse and finish-reason errors: the next attempt moves on to the next client in the route
+                errors.append(f"{client_name}: {e}")
+            else:
+                if key is not None:
+                    self.cache.put(key, result)
+                return result
+            logger.warning(f"{function_name} attempt {attempt + 1}/{policy.max_attempts} failed: {errors[-1][:200]}")
+        stats["failures"] += 1
+        raise CallFailed(function_name, errors)
+
+    def __getattr__(self, function_name: str) -> Callable[..., Awaitable[Any]]:
+        if function_name.startswith("_"):
+            raise AttributeError(function_name)
+
+        async def call(**kwargs):
+            return await self.call(function_name, **kwargs)
+        return call
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "functions": {
+                function_name: {**stats, "hedge_rate": round(stats["hedged"] / stats["calls"], 3) if stats["calls"] else 0.0}
+                for function_name, stats in self.stats.items()
+            },
+            "breakers": {client: breaker.state for client, breaker in self.breakers.items()},
+            "routing": self.routing.to_dict(),
+            **({"cache": self.cache.to_dict()} if self.cache is not None else {}),
+        }
+
+
+def recoverable_errors() -> Tuple[Type[BaseException], ...]:
+    """What a work item may fail with and still succeed later.
+
+    Failed and timed-out calls, connection drops, and model output that didn't
+    validate or names ids that don't exist; anything else is a bug and propagates.
+    """
+    from baml_py.errors import BamlError
+
+    return (CallFailed, BamlError, asyncio.TimeoutError, ConnectionError, ValueError, KeyError)
+
+
+@dataclass
+class FailedWorkItem:
+    """A unit of generation work that raised, kept for a later retry."""
+    description: str
+    work: Callable[[], Awaitable[Any]]
+    errors: List[str] = field(default_factory=list)
+
+
+class DeadLetterQueue:
+    """Runs work items, keeping failed ones to retry at the end of the step."""
+
+    def __init__(self, max_retries: int = 1):
+        self.max_retries = max_retries
+        self.pending: List[FailedWorkItem] = []
+        self.abandoned: List[FailedWorkItem] = []
+
+    async def run(self, description: str, work: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a work item; on failure, log it, queue it and return None.
+
+        A failed item runs again from the start, so it must be safe to repeat:
+        changes it made before failing must not be made twice.
+        """
+        try:
+            return await work()
+        except recoverable_errors() as e:
+            logger.error(f"{description} failed, will retry at the end of the step: {e}", exc_info=True)
+            self.pending.append(FailedWorkItem(description, work, [str(e)]))
+            return None
+
+    async def retry_pending(self) -> int:
+        """Retry every queued item once; items past max_retries are abandoned.
+
+        Returns:
+            Number of items that succeeded this time
+        """
+        items, self.pending = self.pending, []
+        recovered = 0
+        for item in items:
+            try:
+                await item.work()
+            except recoverable_errors() as e:
+                item.errors.append(str(e))
+                if len(item.errors) > self.max_retries:
+                    logger.error(f"Giving up on {item.description}: {e}", exc_info=True)
+                    self.abandoned.append(item)
+                else:
+                    self.pending.append(item)
+                continue
+            recovered += 1
+            logger.info(f"Recovered {item.description} on retry")
+        return recovered
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "pending": [{"description": item.description, "errors": item.errors} for item in self.pending],
+            "abandoned": [{"description": item.description, "errors": item.errors} for item in self.abandoned],
+        }
@@ -0,0 +1,69 @@
+"""
+On-disk cache of LLM responses.
+
+Keyed by the BAML function name and its arguments, so an identical call
+(same world context, same player state, same arc...) is answered from disk
+instead of the provider. Entries are pickled BAML results, one file each,
+written to a temporary name and renamed into place, so several processes can
+share one cache folder.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, Tuple
+
+logger = logging.getLogger("worldgen")
+
+
+def _plain(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+def cache_key(function_name: str, kwargs: Dict[str, Any]) -> str:
+    """Stable hash of a call."""
+    payload = json.dumps({"function": function_name, "args": kwargs}, default=_plain, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Pickled BAML results in a folder, shareable between processes."""
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(folder, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.folder, key[:2], f"{key}.pkl")
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """(True, result) for a cached call, (False, None) otherwise."""
+        try:
+            with open(self._path(key), 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return False, None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, value
+
+    def put(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f)
+        os.replace(temp_path, path)
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,130 @@
+"""
+Per-function client routing.
+
+Every BAML function is declared against ``ReforgedClient``, so a yes/no check
+like ``CheckFactionNeeds`` walks the same chain as ``ExpandArcSituations``.
+``ROUTES`` gives each function its own ordered list of candidate clients:
+small, fast models first for checks and short lists, the strongest models
+first for arc and situation writing.
+
+``RoutingTable`` keeps that order unless observations say otherwise. It tracks
+an exponentially weighted latency and error rate per (function, client) and
+moves a candidate behind the others once it has enough samples and is either
+failing too often or much slower than the best healthy candidate. Unparseable
+output counts as an error here, since it says the model isn't good at the
+function.
+
+Demotion doesn't last: a score that hasn't been updated for
+``recovery_seconds`` is stale. The client goes back to its configured place,
+so the next call probes it, and that call's outcome starts a fresh score.
+"""
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Mirrors the `ReforgedClient` fallback strategy in baml_src/clients.baml; used for unlisted functions
+FALLBACK_CHAIN = ("CustomGPT4oMini", "CustomGPT41mini", "CustomGPT4o", "CustomGPT41")
+FAST_CLIENTS = ("CustomGPT4oMini", "CustomGPT41mini", "CustomGPT4o")
+WRITING_CLIENTS = ("CustomGPT41", "CustomGPT4o", "CustomGPT41mini", "CustomGPT4oMini")
+
+ROUTES: Dict[str, Tuple[str, ...]] = {
+    # Boolean checks and short outputs
+    "CheckTechnologyNeeds": FAST_CLIENTS,
+    "CheckFactionNeeds": FAST_CLIENTS,
+    "CheckChoiceAttributeNeeds": FAST_CLIENTS,
+    "GenerateArcTitles": FAST_CLIENTS,
+    "IdentifyMissingSituations": FAST_CLIENTS,
+    "GetStatNarrative": FAST_CLIENTS,
+    # Arc and situation writing
+    "SelectGenerationToolAndGenerate": WRITING_CLIENTS,
+    "GenerateRootSituation": WRITING_CLIENTS,
+    "ExpandArcSituations": WRITING_CLIENTS,
+    "GenerateSituationForChoice": WRITING_CLIENTS,
+    "GenerateMissingSituationForChoice": WRITING_CLIENTS,
+    "AugmentSituationsChoices": WRITING_CLIENTS,
+    "GenerateJoinChoices": WRITING_CLIENTS,
+}
+
+
+@dataclass
+class ClientScore:
+    """Smoothed latency and error rate of one client on one function."""
+    latency_ms: Optional[float] = None  # Successful calls only
+    error_rate: float = 0.0
+    samples: int = 0
+    updated_at: float = 0.0  # time.monotonic() of the last observation
+
+    def observe(self, latency_ms: float, ok: bool, alpha: float) -> None:
+        self.samples += 1
+        self.updated_at = time.monotonic()
+        self.error_rate += alpha * ((0.0 if ok else 1.0) - self.error_rate)
+        if ok:
+            self.latency_ms = latency_ms if self.latency_ms is None else self.latency_ms + alpha * (latency_ms - self.latency_ms)
+
+
+class RoutingTable:
+    """Orders candidate clients per function, demoting slow or failing ones."""
+
+    def __init__(self, routes: Optional[Dict[str, Sequence[str]]] = None, default: Sequence[str] = FALLBACK_CHAIN,
+                 alpha: float = 0.2, min_samples: int = 3, max_error_rate: float = 0.5, slow_factor: float = 3.0,
+                 recovery_seconds: float = 300.0):
+        self.routes = {function: tuple(clients) for function, clients in (ROUTES if routes is None else routes).items()}
+        self.default = tuple(default)
+        self.alpha = alpha
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.slow_factor = slow_factor
+        self.recovery_seconds = recovery_seconds
+        self.scores: Dict[Tuple[str, str], ClientScore] = {}
+
+    def candidates(self, function_name: str) -> Tuple[str, ...]:
+        """Configured clients for a function, preferred first."""
+        return self.routes.get(function_name, self.default)
+
+    def _score(self, function_name: str, client_name: str) -> ClientScore:
+        return self.scores.setdefault((function_name, client_name), ClientScore())
+
+    def _stale(self, score: ClientScore) -> bool:
+        return score.samples > 0 and time.monotonic() - score.updated_at >= self.recovery_seconds
+
+    def observe(self, function_name: str, client_name: str, latency_ms: float, ok: bool) -> None:
+        score = self._score(function_name, client_name)
+        if self._stale(score):
+            score = self.scores[(function_name, client_name)] = ClientScore()
+        score.observe(latency_ms, ok, self.alpha)
+
+    def order(self, function_name: str) -> List[str]:
+        """Clients to try for a function: configured order, demoted clients last."""
+        candidates = self.candidates(function_name)
+        scores = {client: self._score(function_name, client) for client in candidates}
+        sampled = {
+            client: score for client, score in scores.items()
+            if score.samples >= self.min_samples and not self._stale(score)
+        }
+        healthy_latencies = [
+            score.latency_ms for score in sampled.values()
+            if score.error_rate <= self.max_error_rate and score.latency_ms is not None
+        ]
+        best_latency = min(healthy_latencies) if healthy_latencies else None
+
+        def demoted(client: str) -> bool:
+            score = sampled.get(client)
+            if score is None:
+                return False
+            if score.error_rate > self.max_error_rate:
+                return True
+            return best_latency is not None and score.latency_ms is not None and score.latency_ms > self.slow_factor * best_latency
+
+        return sorted(candidates, key=demoted)  # Stable, so configured order holds within each group
+
+    def to_dict(self) -> Dict[str, Any]:
+        functions: Dict[str, Any] = {}
+        for (function_name, client_name), score in self.scores.items():
+            if not score.samples:
+                continue
+            functions.setdefault(function_name, {"order": self.order(function_name), "clients": {}})["clients"][client_name] = {
+                "latency_ms": round(score.latency_ms) if score.latency_ms is not None else None,
+                "error_rate": round(score.error_rate, 3),
+                "samples": score.samples,
+            }
+        return functions
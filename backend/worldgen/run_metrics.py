@@ -0,0 +1,147 @@
+"""
+Per-run cost and throughput metrics.
+
+Each generation run appends one JSON record per finished step to
+``metrics.jsonl`` in its run folder: the step and action, the LLM calls made
+since the previous step (count, tokens, latency), wall time, bytes written and
+the size of the world. Run directly to summarize and compare runs:
+
+    python -m backend.worldgen.run_metrics saves/Libertas_20250622_024014 [other_run ...]
+"""
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("worldgen")
+
+METRICS_FILENAME = "metrics.jsonl"
+
+
+class RunMetrics:
+    """Appends step records to a run's metrics.jsonl."""
+
+    def __init__(self, run_folder: str, collector: Any = None):
+        self.path = os.path.join(run_folder, METRICS_FILENAME)
+        self.collector = collector
+        # Collector logs are append-only; the ones past this index are new since the last record
+        self._logged_calls = 0
+        self._last_record_at = time.perf_counter()
+
+    def _llm_usage_since_last(self) -> Dict[str, int]:
+        usage = {"llm_calls": 0, "input_tokens": 0, "output_tokens": 0, "llm_latency_ms": 0}
+        if self.collector is None:
+            return usage
+        logs = self.collector.logs
+        for log in logs[self._logged_calls:]:
+            usage["llm_calls"] += 1
+            usage["input_tokens"] += log.usage.input_tokens or 0
+            usage["output_tokens"] += log.usage.output_tokens or 0
+            usage["llm_latency_ms"] += log.timing.duration_ms or 0
+        self._logged_calls = len(logs)
+        return usage
+
+    def record(self, step: int, action: str, bytes_saved: int, situations: int, choices: int,
+               npcs: int, dead_ends: int, **extra: Any) -> Dict[str, Any]:
+        """Append the record for a step that has just finished.
+
+        Latency and LLM usage are counted since the previous record, so call
+        this once per step, when the step's work is done.
+
+        Args:
+            step: Generation step number
+            action: Step or agent action name
+            bytes_saved: Bytes written to disk for this step
+            situations, choices, npcs: Current world size
+            dead_ends: Choices that lead nowhere yet
+            **extra: Additional fields to store with the record
+
+        Returns:
+            The record that was written
+        """
+        now = time.perf_counter()
+        record = {
+            "step": step,
+            "action": action,
+            "timestamp": time.time(),
+            "step_latency_ms": round((now - self._last_record_at) * 1000),
+            **self._llm_usage_since_last(),
+            "bytes_saved": bytes_saved,
+            "situations": situations,
+            "choices": choices,
+            "npcs": npcs,
+            "dead_ends": dead_ends,
+            **extra,
+        }
+        self._last_record_at = now
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record) + "\n")
+        return record
+
+
+def load_metrics(run_folder: str) -> List[Dict[str, Any]]:
+    """Read a run's metrics records."""
+    path = os.path.join(run_folder, METRICS_FILENAME)
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Throughput and cost figures for one run."""
+    latencies = [record["step_latency_ms"] for record in records]
+    total_ms = sum(latencies)
+    tokens = sum(record["input_tokens"] + record["output_tokens"] for record in records)
+    situations = records[-1]["situations"] if records else 0
+    return {
+        "steps": len(records),
+        "duration_s": round(total_ms / 1000, 1),
+        "p50_step_ms": _percentile(latencies, 0.5),
+        "p95_step_ms": _percentile(latencies, 0.95),
+        "mean_step_ms": round(statistics.mean(latencies)) if latencies else 0,
+        "llm_calls": sum(record["llm_calls"] for record in records),
+        "tokens": tokens,
+        "bytes_saved": sum(record["bytes_saved"] for record in records),
+        "situations": situations,
+        "dead_ends": records[-1]["dead_ends"] if records else 0,
+        "situations_per_minute": round(situations / (total_ms / 60000), 2) if total_ms else 0.0,
+        "tokens_per_situation": round(tokens / situations) if situations else 0,
+    }
+
+
+def compare(baseline: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """Relative change of each summary figure from baseline to other (0.1 = +10%)."""
+    return {
+        key: round((other[key] - value) / value, 3) if value else None
+        for key, value in baseline.items()
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m backend.worldgen.run_metrics <run_folder> [<run_folder> ...]")
+        sys.exit(1)
+
+    summaries = {folder: summarize(load_metrics(folder)) for folder in sys.argv[1:]}
+    keys = list(next(iter(summaries.values())).keys())
+    name_width = max(len(key) for key in keys)
+    for folder, summary in summaries.items():
+        print(folder)
+        for key in keys:
+            print(f"  {key:<{name_width}}  {summary[key]}")
+    if len(summaries) > 1:
+        baseline_folder, baseline = next(iter(summaries.items()))
+        for folder, summary in list(summaries.items())[1:]:
+            print(f"{folder} vs {baseline_folder}")
+            for key, change in compare(baseline, summary).items():
+                print(f"  {key:<{name_width}}  {'n/a' if change is None else f'{change:+.1%}'}")
@@ -0,0 +1,158 @@
+"""
+Fast encoding and writing of save files.
+
+Saves are converted to plain data once (``model_dump``) and encoded with the
+fastest available encoder: orjson or msgspec if installed, the standard
+library otherwise. Machine-read files are written without indentation.
+Files are written inline: encoding dominates the cost of a save, and the
+write itself is too short to be worth a writer thread.
+
+Run directly to benchmark save latency against world size:
+
+    python -m backend.worldgen.serialization
+"""
+import gc
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def encoder_name() -> str:
+    if orjson is not None:
+        return "orjson"
+    if msgspec is not None:
+        return "msgspec"
+    return "json"
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """Encode plain data as UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if msgspec is not None and not indent:
+        return msgspec.json.encode(data)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def write_json(path: str, data: Any, indent: bool = False) -> int:
+    """Encode and write a JSON file.
+
+    Returns:
+        Number of bytes written
+    """
+    encoded = dumps(data, indent)
+    with open(path, 'wb') as f:
+        f.write(encoded)
+    return len(encoded)
+
+
+def export_choice(choice: Any) -> Dict[str, Any]:
+    return choice.model_dump()
+
+
+def export_situation(situation: Any) -> Dict[str, Any]:
+    """The save-file form of a situation, shared by step files and situations.json."""
+    choices = [export_choice(choice) for choice in situation.choices]
+    choice_targets = {choice["id"]: choice["next_situation_id"] for choice in choices if choice["next_situation_id"]}
+    return {
+        "id": situation.id,
+        "title": situation.description,
+        "description": situation.description,
+        "choices": choices,
+        "stat_requirements": [stat_requirement.model_dump() for stat_requirement in situation.stat_requirements],
+        "attribute_requirements": None,  # TODO: Add attribute requirements
+        "is_bridge_node": situation.bridgeable,
+        "next_situations": list(choice_targets.values()),
+        "choice_to_situation_mapping": choice_targets,
+    }
+
+
+def _benchmark_world(situation_count: int, choices_per_situation: int = 4):
+    """A synthetic arc list of the given size, built from trusted data."""
+    from .lazy_baml import baml_types
+
+    def choice(situation_index: int, choice_index: int):
+        return baml_types.Choice.model_construct(
+            id=f"s{situation_index}_c{choice_index}", text="You lean closer and ask what she means.",
+            dialogue_response="What do you mean?", choice_type="dialogue", emotional_tone="curious",
+            body_language="Leans in", requirements=None, attributes_gained=[], attributes_lost=[],
+            stat_changes={"insight": 1}, next_situation_id=f"s{situation_index + 1}",
+            internal_hint="Opens a line of questioning", internal_justification="Lets the player probe",
+            new_npcs=[], new_factions=[], new_technologies=[],
+        )
+
+    return [
+        baml_types.Situation.model_construct(
+            id=f"s{i}", description="The informant hesitates before answering.",
+            player_perspective_description="\"You really want to know?\" she whispers, glancing at the door. " * 4,
+            choices=[choice(i, j) for j in range(choices_per_situation)], stat_requirements=[],
+            bridgeable=i % 5 == 0, context_tags=["dialogue", "informant"],
+            internal_hint="Tension rises", internal_justification="Builds the reveal",
+        )
+        for i in range(situation_count)
+    ]
+
+
+def _best_ms(operation: Callable[[], Any], repeat: int) -> float:
+    """Fastest of repeat runs, in milliseconds, each after a full collection."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        operation()
+        best = min(best, (time.perf_counter() - started) * 1000)
+    return best
+
+
+def benchmark(sizes=(50, 200, 1000, 5000), repeat: int = 3) -> List[Dict[str, Any]]:
+    """Time the legacy save path against compact encoding.
+
+    Returns:
+        One row per world size, times in milliseconds on the main thread
+    """
+    import tempfile
+
+    rows = []
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "step.json")
+        for size in sizes:
+            situations = _benchmark_world(size)
+
+            def legacy() -> None:
+                data = {"situations": {s.id: {"choices": [c.model_dump() for c in s.choices], "description": s.description} for s in situations}}
+                with open(path, 'w') as f:
+                    json.dump(data, f, indent=2)
+
+            def compact() -> None:
+                write_json(path, {"situations": {s.id: export_situation(s) for s in situations}})
+
+            legacy_ms = _best_ms(legacy, repeat)
+            compact_ms = _best_ms(compact, repeat)
+
+            rows.append({
+                "situations": size,
+                "bytes": os.path.getsize(path),
+                "legacy_ms": round(legacy_ms, 1),
+                "compact_ms": round(compact_ms, 1),
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    print(f"Encoder: {encoder_name()}")
+    print(f"{'situations':>10} {'bytes':>12} {'legacy ms':>10} {'compact ms':>11}")
+    for row in benchmark():
+        print(f"{row['situations']:>10} {row['bytes']:>12} {row['legacy_ms']:>10} {row['compact_ms']:>11}")
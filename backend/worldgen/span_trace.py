@@ -0,0 +1,191 @@
+"""
+Timeline of a generation run in Chrome Trace Event format.
+
+With concurrent generation (frontier waves, bridge batches, hedged calls,
+speculation) flat logs can't show what overlapped, where the run sat idle or
+which chain of calls held a step up. ``SpanTracer`` records spans instead:
+
+- one span per generation step, on its own "generation steps" track
+- one per BAML call (retries and backoff included) and one per request to a
+  client inside it, so hedged requests show up side by side
+- one per save and per ``apply_choice_diffs``
+
+Spans nest by asyncio task: each task draws on a track of its own while it has
+spans open, and a span started in a task spawned from inside another span is
+linked to it with a flow arrow. The active tracer and the current span live in
+context variables, so they follow ``asyncio.gather`` and ``create_task`` and
+concurrent worlds in one process (see farm.py) never share a tracer.
+
+This is a local stand-in for the ``trace`` decorator in baml_client/tracing.py,
+which reports to Boundary Studio and builds the BAML runtime on import.
+
+Set ``world.tracer = SpanTracer()`` (or pass ``--trace`` to world_generator.py
+or test_agent_world.py); ``trace.json`` is written to the run folder when
+generation ends. Open it in chrome://tracing or https://ui.perfetto.dev.
+"""
+import asyncio
+import functools
+import heapq
+import itertools
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+TRACE_FILENAME = "trace.json"
+STEP_LANE = 0
+
+_active_tracer: ContextVar[Optional["SpanTracer"]] = ContextVar("span_tracer", default=None)
+_current_span: ContextVar[Optional[Tuple[int, int]]] = ContextVar("current_span", default=None)  # (span id, lane)
+
+
+class SpanTracer:
+    """Collects spans and step markers as Chrome trace events."""
+
+    def __init__(self, process_name: str = "worldgen"):
+        self.process_name = process_name
+        self.events: List[Dict[str, Any]] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._span_ids = itertools.count(1)
+        self._task_lanes: Dict[Any, List[int]] = {}  # task -> [lane, open spans]
+        self._free_lanes: List[int] = []
+        self._lane_count = STEP_LANE + 1
+        self._step: Optional[Tuple[str, float]] = None
+
+    def _now_us(self) -> float:
+        return (time.perf_counter_ns() - self._origin_ns) / 1000
+
+    def _acquire_lane(self, task: Any) -> int:
+        """The task's track, allocated on its first open span."""
+        entry = self._task_lanes.get(task)
+        if entry is None:
+            if self._free_lanes:
+                lane = heapq.heappop(self._free_lanes)
+            else:
+                lane = self._lane_count
+                self._lane_count += 1
+            entry = self._task_lanes[task] = [lane, 0]
+        entry[1] += 1
+        return entry[0]
+
+    def _release_lane(self, task: Any) -> None:
+        """Give the track back once the task has no span open."""
+        entry = self._task_lanes[task]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._task_lanes[task]
+            heapq.heappush(self._free_lanes, entry[0])
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[None]:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        lane = self._acquire_lane(task)
+        span_id = next(self._span_ids)
+        parent = _current_span.get()
+        start = self._now_us()
+        if parent is not None and parent[1] != lane:
+            # Started from a span in another task: draw an arrow from it
+            common = {"name": "spawn", "cat": "flow", "id": span_id, "pid": self._pid, "ts": start}
+            self.events.append({**common, "ph": "s", "tid": parent[1]})
+            self.events.append({**common, "ph": "f", "bp": "e", "tid": lane})
+        if task is not None:
+            args["task"] = task.get_name()
+        token = _current_span.set((span_id, lane))
+        try:
+            yield
+        except BaseException as e:
+            args["error"] = repr(e)[:200]
+            raise
+        finally:
+            _current_span.reset(token)
+            self.events.append({
+                "name": name, "cat": category, "ph": "X", "pid": self._pid, "tid": lane,
+                "ts": start, "dur": self._now_us() - start, "args": args,
+            })
+            self._release_lane(task)
+
+    def step(self, name: Optional[str]) -> None:
+        """End the current generation step span and, given a name, start the next."""
+        now = self._now_us()
+        if self._step is not None:
+            step_name, start = self._step
+            self.events.append({
+                "name": step_name, "cat": "step", "ph": "X", "pid": self._pid, "tid": STEP_LANE,
+                "ts": start, "dur": now - start, "args": {},
+            })
+        self._step = (name, now) if name is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        metadata = [{"name": "process_name", "ph": "M", "pid": self._pid, "tid": STEP_LANE, "args": {"name": self.process_name}}]
+        for lane in range(self._lane_count):
+            metadata.append({
+                "name": "thread_name", "ph": "M", "pid": self._pid, "tid": lane,
+                "args": {"name": "generation steps" if lane == STEP_LANE else f"tasks {lane}"},
+            })
+            metadata.append({"name": "thread_sort_index", "ph": "M", "pid": self._pid, "tid": lane, "args": {"sort_index": lane}})
+        return {"traceEvents": metadata + sorted(self.events, key=lambda event: event["ts"]), "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+
+def span(name: str, category: str, **args: Any) -> ContextManager[None]:
+    """A span on the active tracer, or nothing if no tracer is active."""
+    tracer = _active_tracer.get()
+    if tracer is None:
+        return nullcontext()
+    return tracer.span(name, category, **args)
+
+
+def mark_step(name: Optional[str]) -> None:
+    """Start the next generation step span on the active tracer, if any."""
+    tracer = _active_tracer.get()
+    if tracer is not None:
+        tracer.step(name)
+
+
+def traced(name: str, category: str) -> Callable[[Callable], Callable]:
+    """Decorator: run a function, sync or async, inside a span."""
+    def decorate(function: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                with span(name, category):
+                    return await function(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(name, category):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def with_world_tracer(method: Callable) -> Callable:
+    """Decorator for a world's async generation methods.
+
+    Activates ``self.tracer`` (when set) for the duration of the call, then
+    closes the last step and writes trace.json to ``self.run_folder``.
+    """
+    @functools.wraps(method)
+    async def wrapper(world, *args, **kwargs):
+        tracer = getattr(world, "tracer", None)
+        if tracer is None or _active_tracer.get() is tracer:
+            return await method(world, *args, **kwargs)
+        token = _active_tracer.set(tracer)
+        try:
+            return await method(world, *args, **kwargs)
+        finally:
+            tracer.step(None)
+            _active_tracer.reset(token)
+            tracer.write(os.path.join(world.run_folder, TRACE_FILENAME))
+    return wrapper
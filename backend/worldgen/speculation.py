@@ -0,0 +1,104 @@
+"""
+Speculative pre-generation for the agentic world generator.
+
+While ``SelectGenerationToolAndGenerate`` is in flight, the situations for the
+current situation's incomplete choices are already being generated with
+``GenerateSituationForChoice``. If the agent then creates situations here, the
+choices it left open are filled from these results instead of taking further
+agent steps; otherwise the results are discarded after a few steps.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger("agent_worldgen")
+
+SpeculationKey = Tuple[str, str]  # (situation_id, choice_id)
+
+
+@dataclass
+class _Speculation:
+    task: asyncio.Task
+    started_step: int
+
+
+@dataclass
+class SpeculationStats:
+    started: int = 0
+    hits: int = 0
+    discarded: int = 0
+    failed: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.started if self.started else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "started": self.started,
+            "hits": self.hits,
+            "discarded": self.discarded,
+            "failed": self.failed,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+class SpeculativeSituationCache:
+    """Short-lived cache of in-flight situation generations keyed by choice."""
+
+    def __init__(self, max_age_steps: int = 2, max_in_flight: int = 4):
+        self.max_age_steps = max_age_steps
+        self.max_in_flight = max_in_flight
+        self.entries: Dict[SpeculationKey, _Speculation] = {}
+        self.stats = SpeculationStats()
+
+    def __contains__(self, key: SpeculationKey) -> bool:
+        return key in self.entries
+
+    def start(self, key: SpeculationKey, step: int, generate: Callable[[], Awaitable[Any]]) -> bool:
+        """Start generating for a choice unless it is cached or the cache is full."""
+        if key in self.entries or len(self.entries) >= self.max_in_flight:
+            return False
+        self.entries[key] = _Speculation(asyncio.ensure_future(generate()), step)
+        self.stats.started += 1
+        logger.debug(f"Speculating on choice {key[1]} of {key[0]}")
+        return True
+
+    async def take(self, key: SpeculationKey) -> Optional[Any]:
+        """Use the speculative result for a choice, waiting for it if still running."""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return None
+        try:
+            result = await entry.task
+        except Exception as e:
+            self.stats.failed += 1
+            logger.warning(f"Speculative generation for choice {key[1]} failed: {e}")
+            return None
+        self.stats.hits += 1
+        return result
+
+    def discard(self, key: SpeculationKey) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        task = entry.task
+        # A finished task's exception is retrieved here, so asyncio doesn't report it as never retrieved
+        if task.done() and not task.cancelled() and task.exception() is not None:
+            self.stats.failed += 1
+            logger.warning(f"Speculative generation for choice {key[1]} failed: {task.exception()}")
+            return
+        task.cancel()
+        self.stats.discarded += 1
+
+    def expire(self, step: int, still_open: Iterable[SpeculationKey]) -> None:
+        """Discard entries for choices that were filled otherwise, or that are too old."""
+        still_open = set(still_open)
+        for key, entry in list(self.entries.items()):
+            if key not in still_open or step - entry.started_step >= self.max_age_steps:
+                self.discard(key)
+
+    def cancel_all(self) -> None:
+        for key in list(self.entries):
+            self.discard(key)
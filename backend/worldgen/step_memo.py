@@ -0,0 +1,58 @@
+"""
+Memoized agent step inputs.
+
+Navigation actions (UpOneLevel, DownOneLevel, GoToArcRoot, GoToSituation) only
+move the agent's cursor; the world itself is unchanged. Yet every step
+rescans all situations for open choices, walks the tree for the distance to a
+complete situation and re-sorts the context, several times over (prompt,
+logging, save). ``StepInputMemo`` caches those values under a version key: a
+counter the world bumps whenever it mutates, plus the current tree node. Every
+mutation drops the cache, so it never holds more than one world version.
+
+Rendering the arguments into the prompt itself is left to BAML: passing
+pre-dumped dicts renders the identical request with no measurable saving, and
+the full request differs every step because the action history grows.
+"""
+import logging
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger("agent_worldgen")
+
+
+class StepInputMemo:
+    """Values derived from the world, cached until the world next changes."""
+
+    def __init__(self):
+        self.world_version = 0
+        self._values: Dict[Tuple[str, Hashable], Any] = {}
+        self.hits = 0
+        self.misses = 0
+        # Agent calls saved by resolving navigation without the agent
+        self.navigation_resolved = 0
+
+    def bump(self) -> None:
+        """Record that the world changed, invalidating every cached value."""
+        self.world_version += 1
+        self._values.clear()
+
+    def get(self, name: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """The cached value for (name, key) at the current world version, computing it if needed.
+
+        Callers must not mutate the returned value.
+        """
+        memo_key = (name, key)
+        if memo_key in self._values:
+            self.hits += 1
+            return self._values[memo_key]
+        self.misses += 1
+        value = compute()
+        self._values[memo_key] = value
+        return value
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "world_version": self.world_version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "navigation_resolved": self.navigation_resolved,
+        }
@@ -0,0 +1,137 @@
+"""
+CPU profiling scoped to generation steps.
+
+When a step is slow for CPU reasons rather than LLM latency (deep copies,
+``model_dump``, pretty-printed JSON, quadratic id scans) ``StepProfiler``
+shows where the time went, step by step:
+
+- a deterministic cProfile of each step, written to ``<folder>/<step>.prof``
+  (open with ``python -m pstats`` or snakeviz)
+- a sampling profile of the whole run: a background thread samples the event
+  loop thread's stack every few milliseconds, and ``stacks.collapsed`` holds
+  one ``step;outer;...;inner count`` line per distinct stack, the folded
+  format flamegraph.pl, speedscope and inferno read
+
+Set ``world.profiler = StepProfiler(f"{world.run_folder}/profile")`` (or pass
+``--profile`` to world_generator.py or test_agent_world.py). Files are written
+when generate (or regenerate) returns.
+"""
+import cProfile
+import functools
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+from collections import Counter
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("worldgen")
+
+COLLAPSED_FILENAME = "stacks.collapsed"
+
+
+def _frame_label(code: Any) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StepProfiler:
+    """cProfile per step plus a sampled collapsed-stack profile of the run."""
+
+    def __init__(self, folder: str, sample_interval: float = 0.005):
+        """
+        Args:
+            folder: Where .prof files and stacks.collapsed go
+            sample_interval: Seconds between stack samples
+        """
+        self.folder = folder
+        self.sample_interval = sample_interval
+        self.stacks: Counter = Counter()  # (step, frame labels root first) -> samples
+        self._step_name: Optional[str] = None
+        self._step_index = 0
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._stop_sampling = threading.Event()
+        self._target_thread = threading.get_ident()
+
+    @property
+    def active(self) -> bool:
+        """Whether a step is being profiled."""
+        return self._step_name is not None
+
+    def _sample(self) -> None:
+        while not self._stop_sampling.wait(self.sample_interval):
+            frame = sys._current_frames().get(self._target_thread)
+            step_name = self._step_name
+            if frame is None or step_name is None:
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            self.stacks[(step_name, tuple(reversed(labels)))] += 1
+
+    def _end_step(self) -> None:
+        if self._profile is None:
+            return
+        self._profile.disable()
+        os.makedirs(self.folder, exist_ok=True)
+        path = os.path.join(self.folder, f"{re.sub(r'[^A-Za-z0-9_.-]', '_', self._step_name)}.prof")
+        if os.path.exists(path):
+            # A step name can repeat, e.g. across regenerate calls
+            path = f"{path[:-len('.prof')]}_{self._step_index}.prof"
+        self._profile.dump_stats(path)
+        stats = pstats.Stats(self._profile)
+        top = max(stats.stats.items(), key=lambda item: item[1][2], default=None)  # Highest own time
+        if top is not None:
+            (filename, line, function), (_, _, own_time, _, _) = top
+            logger.info(f"Profiled step {self._step_name}: {stats.total_tt:.2f}s CPU, "
+                        f"most in {function} ({os.path.basename(filename)}:{line}, {own_time:.2f}s)")
+        self._profile = None
+
+    def step(self, name: str) -> None:
+        """End the current step's profile and start profiling the next."""
+        self._end_step()
+        self._step_index += 1
+        self._step_name = name
+        if self._sampler is None:
+            self._target_thread = threading.get_ident()
+            self._stop_sampling.clear()
+            self._sampler = threading.Thread(target=self._sample, name="step-profiler-sampler", daemon=True)
+            self._sampler.start()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def finish(self) -> None:
+        """End the current step, stop sampling and write stacks.collapsed."""
+        self._end_step()
+        self._step_name = None
+        if self._sampler is not None:
+            self._stop_sampling.set()
+            self._sampler.join()
+            self._sampler = None
+        os.makedirs(self.folder, exist_ok=True)
+        with open(os.path.join(self.folder, COLLAPSED_FILENAME), 'w') as f:
+            for (step_name, labels), count in self.stacks.most_common():
+                f.write(f"{';'.join((step_name,) + labels)} {count}\n")
+        logger.info(f"Wrote step profiles and {sum(self.stacks.values())} stack samples to {self.folder}")
+
+
+def with_world_profiler(method: Callable) -> Callable:
+    """Decorator for a world's async generation methods.
+
+    Profiles the call (as a step named after the method until the world
+    starts its first step) and writes ``self.profiler``'s files when it returns.
+    """
+    @functools.wraps(method)
+    async def wrapper(world, *args, **kwargs):
+        profiler = getattr(world, "profiler", None)
+        if profiler is None or profiler.active:
+            return await method(world, *args, **kwargs)
+        profiler.step(method.__name__)
+        try:
+            return await method(world, *args, **kwargs)
+        finally:
+            profiler.finish()
+    return wrapper
@@ -7,6 +7,7 @@ a world using an AI agent that makes autonomous decisions about what
 content to generate next.
 """
 
+import argparse
 import asyncio
 import sys
 import os
@@ -15,12 +16,15 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from worldgen.agent_world import AgentWorld
+from worldgen.memory_profile import MemoryProfiler
+from worldgen.span_trace import SpanTracer
+from worldgen.step_profile import StepProfiler
 from worldgen.baml_client.types import WorldSeed
 from dotenv import load_dotenv
 
 load_dotenv()
 
-async def test_agent_world():
+async def test_agent_world(memory_profile: bool = False, trace: bool = False, profile: bool = False):
     """Test the agentic world generator."""
     
     # Create a world seed for testing
@@ -42,6 +46,12 @@ async def test_agent_world():
     
     # Create and initialize the agentic world
     agent_world = AgentWorld(seed=test_seed)
+    if memory_profile:
+        agent_world.memory_profiler = MemoryProfiler()
+    if trace:
+        agent_world.tracer = SpanTracer(process_name=test_seed.name)
+    if profile:
+        agent_world.profiler = StepProfiler(f"{agent_world.run_folder}/profile")
     
     print("World initialized. Starting agentic generation...")
     print("-" * 80)
@@ -76,5 +86,13 @@ async def test_agent_world():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--memory-profile", action="store_true",
+                        help="Record tracemalloc growth and structure sizes per step in metrics.jsonl")
+    parser.add_argument("--trace", action="store_true",
+                        help="Write a Chrome trace of the run to trace.json in the run folder")
+    parser.add_argument("--profile", action="store_true",
+                        help="Write a cProfile per step and sampled stacks to the run folder's profile/")
+    args = parser.parse_args()
     # Run the test
-    asyncio.run(test_agent_world())
\ No newline at end of file
+    asyncio.run(test_agent_world(memory_profile=args.memory_profile, trace=args.trace, profile=args.profile))
\ No newline at end of file
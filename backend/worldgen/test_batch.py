@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for BatchRunner against LocalBatchEndpoint.
+
+Requests are rendered by BAML (no LLM calls) and answered in-process, so a
+batch makes the full trip: render, submit, poll, download and parse.
+
+Run with pytest.
+"""
+import asyncio
+import json
+
+from backend.worldgen.batch import BatchRequest, BatchRunner, LocalBatchEndpoint
+
+STATS = ["might", "insight", "nimbleness", "destiny", "savvy", "expertise", "tenacity",
+         "station", "opulence", "celebrity", "integrity", "allure", "lineage"]
+
+
+def descriptors(line):
+    if line["custom_id"] == "broken":
+        raise RuntimeError("model overloaded")
+    return json.dumps({f"{stat}_descriptors": {"10": "average"} for stat in STATS})
+
+
+def requests(*custom_ids):
+    return [BatchRequest(custom_id, "GetDefaultStatDescriptors", {}) for custom_id in custom_ids]
+
+
+def test_round_trip(tmp_path):
+    runner = BatchRunner(LocalBatchEndpoint(descriptors), str(tmp_path), poll_interval=0.01)
+    result = asyncio.run(runner.run(requests("first", "broken", "last")))
+
+    assert set(result.results) == {"first", "last"}
+    assert result.results["first"].might_descriptors == {"10": "average"}
+    assert result.errors == {"broken": "model overloaded"}
+    sent = [json.loads(line) for line in open(tmp_path / "batch_001_input.jsonl")]
+    assert [line["custom_id"] for line in sent] == ["first", "broken", "last"]
+    assert sent[0]["url"] == "/v1/chat/completions"
+    assert runner.stats.to_dict()["succeeded"] == 2 and runner.stats.failed == 1
+
+
+def test_unrenderable_requests_fail_alone(tmp_path):
+    runner = BatchRunner(LocalBatchEndpoint(descriptors), str(tmp_path), poll_interval=0.01)
+    batch = requests("good") + [BatchRequest("unknown", "NoSuchFunction", {})]
+    result = asyncio.run(runner.run(batch))
+    assert set(result.results) == {"good"}
+    assert result.errors["unknown"].startswith("not rendered")
+
+
+class UnreachableEndpoint(LocalBatchEndpoint):
+    def submit(self, input_path):
+        raise ConnectionError("endpoint down")
+
+
+def test_endpoint_errors_fail_every_request(tmp_path):
+    runner = BatchRunner(UnreachableEndpoint(descriptors), str(tmp_path), poll_interval=0.01)
+    result = asyncio.run(runner.run(requests("a", "b")))
+    assert not result.results
+    assert set(result.errors) == {"a", "b"}
+    assert "endpoint down" in result.errors["a"]
+
+
+class StuckEndpoint(LocalBatchEndpoint):
+    def __init__(self, respond):
+        super().__init__(respond)
+        self.cancelled = []
+
+    def submit(self, input_path):
+        self._jobs["stuck"] = {"status": "in_progress", "output": []}
+        return "stuck"
+
+    def cancel(self, job_id):
+        super().cancel(job_id)
+        self.cancelled.append(job_id)
+
+
+def test_timed_out_batch_is_cancelled(tmp_path):
+    endpoint = StuckEndpoint(descriptors)
+    runner = BatchRunner(endpoint, str(tmp_path), poll_interval=0.01, timeout=0.05)
+    result = asyncio.run(runner.run(requests("a")))
+    assert endpoint.cancelled == ["stuck"]
+    assert result.errors == {"a": "no result (batch timed_out)"}
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Tests for local bridge candidate ranking.
+
+Builds small arcs from trusted data (no LLM calls) and checks which cross-arc
+pairs are ranked and sent to GenerateJoinChoices.
+
+Run with pytest.
+"""
+from backend.worldgen.bridge_candidates import candidate_pairs, rank_bridge_candidates
+from backend.worldgen.lazy_baml import baml_types
+
+
+def make_situation(situation_id, tags=(), bridgeable=False):
+    return baml_types.Situation.model_construct(
+        id=situation_id, description=situation_id, player_perspective_description=situation_id,
+        choices=[], stat_requirements=[], bridgeable=bridgeable, context_tags=list(tags),
+        internal_hint="", internal_justification="",
+    )
+
+
+def make_arc(title, situations):
+    seed = baml_types.ArcSeed.model_construct(title=title, core_conflict="", theme_tags=[], tone="", factions_involved=[])
+    return baml_types.Arc.model_construct(seed=seed, situations=situations, outcomes=[])
+
+
+def ranked_pairs(arcs, top_k=12):
+    context = baml_types.WorldContext.model_construct(factions=[], npcs=[], technologies=[])
+    return [(pair.from_situation_id, pair.to_situation_id)
+            for pair in candidate_pairs(rank_bridge_candidates(arcs, context, top_k=top_k))]
+
+
+def test_only_related_cross_arc_pairs_are_ranked():
+    north = make_arc("North", [make_situation("n1", ["market"]), make_situation("n2", ["storm"])])
+    south = make_arc("South", [make_situation("s1", ["market"]), make_situation("s2", ["harbor"])])
+    assert sorted(ranked_pairs([north, south], top_k=2)) == [("n1", "s1"), ("s1", "n1")]
+    # With too few related pairs, unrelated ones fill the rest
+    assert len(ranked_pairs([north, south])) == 8
+
+
+def test_bridgeable_situations_pair_with_everything():
+    north = make_arc("North", [make_situation("n1", bridgeable=True), make_situation("n2")])
+    south = make_arc("South", [make_situation("s1", ["market"])])
+    assert set(ranked_pairs([north, south], top_k=2)) == {("n1", "s1"), ("s1", "n1")}
+    assert ranked_pairs([north, south], top_k=1) in ([("n1", "s1")], [("s1", "n1")])
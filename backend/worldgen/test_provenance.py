@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for dependency tracking behind World.regenerate and World.regenerate_subtree.
+
+Builds small arcs from trusted data (no LLM calls) and checks which situations
+depend on a regenerated one and what World._invalidate removes.
+
+Run with pytest.
+"""
+import asyncio
+import itertools
+
+from backend.worldgen.lazy_baml import baml_types
+from backend.worldgen.provenance import Origin, Provenance, dependent_situations
+
+_choice_ids = itertools.count()
+
+
+def make_choice(next_situation_id=None, new_factions=()):
+    return baml_types.Choice.model_construct(
+        id=f"c{next(_choice_ids)}", text="t", dialogue_response=None, choice_type="dialogue", emotional_tone="",
+        body_language="", requirements=None, attributes_gained=[], attributes_lost=[], stat_changes={},
+        next_situation_id=next_situation_id, internal_hint="", internal_justification="",
+        new_npcs=[], new_factions=list(new_factions), new_technologies=[],
+    )
+
+
+def make_situation(situation_id, *next_ids):
+    return baml_types.Situation.model_construct(
+        id=situation_id, description=situation_id, player_perspective_description=situation_id,
+        choices=[make_choice(next_id) for next_id in next_ids], stat_requirements=[], bridgeable=False,
+        context_tags=[], internal_hint="", internal_justification="",
+    )
+
+
+def make_arc(title, situations):
+    seed = baml_types.ArcSeed.model_construct(title=title, core_conflict="", theme_tags=[], tone="", factions_involved=[])
+    return baml_types.Arc.model_construct(seed=seed, situations=situations, outcomes=[])
+
+
+def diamond_arc():
+    # root -> a -> b -> c, root -> d -> c: only b is dominated by a; c is still reachable through d
+    return make_arc("Diamond", [
+        make_situation("root", "a", "d"),
+        make_situation("a", "b"),
+        make_situation("b", "c"),
+        make_situation("c"),
+        make_situation("d", "c"),
+    ])
+
+
+def test_dependents_are_dominated_situations():
+    arc = diamond_arc()
+    assert dependent_situations(arc, "a") == ({"a", "b"}, 1)
+    assert dependent_situations(arc, "d") == ({"d"}, 0)
+    assert dependent_situations(arc, "root") == ({"root", "a", "b", "c", "d"}, 2)
+
+
+def test_forget_keeps_initial_context_entities():
+    context = baml_types.WorldContext.model_construct(
+        factions=[baml_types.Faction.model_construct(name="Vextros")], npcs=[], technologies=[],
+    )
+    provenance = Provenance.from_context(context, ("npcs", "factions", "technologies"))
+    provenance.record_entities("c_old", "factions", ["Vextros", "Newcomers"])
+    provenance.record_entities("c_kept", "factions", ["Survivors"])
+    provenance.record_entities("c_other", "factions", ["Survivors"])
+    assert provenance.forget(set(), {"c_old", "c_other"}) == [("factions", "Newcomers")]
+
+
+def test_invalidate_removes_only_dependent_work(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    from backend.worldgen.world import World
+
+    world = World(baml_types.WorldSeed(name="Provenance", themes=["x"], high_concept="x",
+                                       internal_hint="", internal_justification=""))
+    arc = diamond_arc()
+    other = make_arc("Other", [make_situation("x", "b", "c")])  # Bridges into b and c
+    world.arcs = [arc, other]
+    newcomer = baml_types.Faction.model_construct(name="Newcomers", description="", ideology="", territory=[], influence_level=1)
+    vextros = baml_types.Faction.model_construct(name="Vextros", description="", ideology="", territory=[], influence_level=1)
+    b_choice = make_choice(new_factions=[newcomer, vextros])
+    arc.situations[2].choices.append(b_choice)
+    for situation in arc.situations + other.situations:
+        world.provenance.record_situation(situation, Origin("Test", 0, "Diamond"))
+    asyncio.run(world.apply_choice_diffs(b_choice))
+    assert "Newcomers" in {faction.name for faction in world.world_context.factions}
+
+    dependents, _ = dependent_situations(arc, "a")
+    asyncio.run(world._invalidate(arc, dependents, "regenerate_a"))
+
+    assert [situation.id for situation in arc.situations] == ["root", "c", "d"]
+    assert [choice.next_situation_id for choice in other.situations[0].choices] == ["c"]
+    factions = {faction.name for faction in world.world_context.factions}
+    assert "Newcomers" not in factions
+    assert "Vextros" in factions
+    assert "a" not in world.provenance.situations and "root" in world.provenance.situations
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for retries, circuit breaking and dead-lettering in resilience.py.
+
+The BAML client is replaced by a scripted one, so no LLM calls are made.
+
+Run with pytest.
+"""
+import asyncio
+
+import pytest
+from baml_py.errors import BamlClientHttpError
+
+from backend.worldgen import resilience
+from backend.worldgen.resilience import (
+    CallFailed, CircuitBreaker, DeadLetterQueue, ResilientClient, RetryPolicy,
+)
+
+
+class ScriptedBaml:
+    """Stands in for `b`: each call pops the next outcome for the client it was pinned to."""
+
+    def __init__(self, outcomes, delay=0.0):
+        self.outcomes = outcomes  # client name -> list of results or exceptions
+        self.delay = delay
+        self.calls = []
+
+    def with_options(self, client_registry, **options):
+        client_name = next(name for name, registry in self.registries.items() if registry is client_registry)
+
+        async def call(**kwargs):
+            self.calls.append(client_name)
+            await asyncio.sleep(self.delay)
+            outcome = self.outcomes[client_name].pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        return type("Pinned", (), {"Generate": staticmethod(call)})()
+
+
+def scripted_client(monkeypatch, outcomes, delay=0.0, max_attempts=3):
+    scripted = ScriptedBaml(outcomes, delay)
+    monkeypatch.setattr(resilience, "b", scripted)
+    client = ResilientClient(chain=tuple(outcomes), policies={
+        "Generate": RetryPolicy(max_attempts=max_attempts, timeout=5.0, base_delay=0.0),
+    })
+    scripted.registries = {name: client._registry(name) for name in outcomes}
+    return client, scripted
+
+
+def http_error(client_name):
+    return BamlClientHttpError(client_name, "503 Service Unavailable", 503)
+
+
+def test_retry_moves_to_the_next_client(monkeypatch):
+    client, scripted = scripted_client(monkeypatch, {"CustomGPT4oMini": [http_error("CustomGPT4oMini")],
+                                                     "CustomGPT4o": ["answer"]})
+    assert asyncio.run(client.Generate()) == "answer"
+    assert scripted.calls == ["CustomGPT4oMini", "CustomGPT4o"]
+    assert client.stats["Generate"]["retries"] == 1
+
+
+def test_call_failed_after_every_attempt(monkeypatch):
+    client, _ = scripted_client(monkeypatch, {"CustomGPT4oMini": [http_error("CustomGPT4oMini")] * 2}, max_attempts=2)
+    with pytest.raises(CallFailed) as failed:
+        asyncio.run(client.Generate())
+    assert len(failed.value.errors) == 2
+
+
+def test_breaker_opens_then_half_opens_for_one_trial():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "half_open"  # reset_timeout of 0: the cool-down is already over
+
+    assert breaker.allows_request()
+    assert breaker.start_request()
+    assert not breaker.allows_request()  # The trial is in flight
+    breaker.record_failure()
+    breaker.end_trial()
+    assert breaker.opened_at is not None and breaker.allows_request()
+
+    assert breaker.start_request()
+    breaker.record_success()
+    breaker.end_trial()
+    assert breaker.state == "closed" and not breaker.start_request()
+
+
+def test_half_open_client_gets_a_single_concurrent_trial(monkeypatch):
+    client, scripted = scripted_client(monkeypatch, {"CustomGPT4oMini": ["trial"], "CustomGPT4o": ["other"] * 3},
+                                       delay=0.05)
+    breaker = client._breaker("CustomGPT4oMini")
+    breaker.opened_at, breaker.reset_timeout = 0.0, 0.0
+
+    async def main():
+        return await asyncio.gather(*(client.Generate() for _ in range(4)))
+    results = asyncio.run(main())
+    assert sorted(results) == ["other", "other", "other", "trial"]
+    assert scripted.calls.count("CustomGPT4oMini") == 1
+    assert breaker.state == "closed"
+
+
+def test_dead_letters_retry_recoverable_failures():
+    queue = DeadLetterQueue(max_retries=1)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise CallFailed("Generate", ["timed out"])
+        return "done"
+
+    async def hopeless():
+        raise ValueError("unparseable")
+
+    async def main():
+        assert await queue.run("flaky", flaky) is None
+        assert await queue.run("hopeless", hopeless) is None
+        assert len(queue.pending) == 2
+        assert await queue.retry_pending() == 1
+    asyncio.run(main())
+    assert not queue.pending
+    assert [item.description for item in queue.abandoned] == ["hopeless"]
+
+
+def test_dead_letters_let_bugs_through():
+    async def buggy():
+        raise AttributeError("'NoneType' object has no attribute 'choices'")
+
+    queue = DeadLetterQueue()
+    with pytest.raises(AttributeError):
+        asyncio.run(queue.run("buggy", buggy))
+    assert not queue.pending
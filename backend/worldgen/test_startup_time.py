@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for worldgen modules.
+
+Imports each module in a fresh interpreter with `python -X importtime` and checks
+that read-only tooling starts within the budget, and that nothing constructs the
+BAML runtime at import time (see lazy_baml.py).
+
+Run directly or through pytest. Set REFORGED_IMPORT_BUDGET_MS to change the budget.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BUDGET_MS = float(os.environ.get("REFORGED_IMPORT_BUDGET_MS", "100"))
+BAML_RUNTIME_MODULE = "backend.worldgen.baml_client.globals"
+
+# Tools that only read saves must start fast
+READ_ONLY_MODULES = [
+    "backend.worldgen.mermaid_export",
+    "backend.worldgen.graph_analysis",
+    "backend.worldgen.graph_layout",
+]
+# Generators may import more, but must not build the BAML runtime until first use
+LAZY_MODULES = READ_ONLY_MODULES + [
+    "backend.worldgen.world",
+    "backend.worldgen.agent_world",
+]
+
+
+def measure_import(module: str):
+    """Import a module in a fresh interpreter.
+
+    Returns:
+        (cumulative import time in ms, set of imported module names)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    imported = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            imported[name.strip()] = int(cumulative.strip()) / 1000
+    return imported[module], set(imported)
+
+
+def test_read_only_modules_start_fast():
+    for module in READ_ONLY_MODULES:
+        elapsed_ms, _ = measure_import(module)
+        assert elapsed_ms < BUDGET_MS, f"{module} took {elapsed_ms:.1f} ms to import (budget {BUDGET_MS} ms)"
+
+
+def test_baml_runtime_is_lazy():
+    for module in LAZY_MODULES:
+        _, imported = measure_import(module)
+        assert BAML_RUNTIME_MODULE not in imported, f"Importing {module} constructed the BAML runtime"
+
+
+if __name__ == "__main__":
+    failed = False
+    for module in LAZY_MODULES:
+        elapsed_ms, imported = measure_import(module)
+        loads_runtime = BAML_RUNTIME_MODULE in imported
+        over_budget = module in READ_ONLY_MODULES and elapsed_ms >= BUDGET_MS
+        failed = failed or loads_runtime or over_budget
+        status = "❌" if loads_runtime or over_budget else "✅"
+        print(f"{status} {module}: {elapsed_ms:.1f} ms{' (builds BAML runtime)' if loads_runtime else ''}")
+    sys.exit(1 if failed else 0)
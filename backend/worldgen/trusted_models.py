@@ -0,0 +1,91 @@
+"""
+Copying of trusted world contexts without ``copy.deepcopy``.
+
+BAML validates everything it parses out of an LLM response, and seeds read
+from disk are validated by the normal constructors. A world context built
+from that data is already valid, so deep-copying it before every change only
+costs time and memory. ``fork_context(context)`` copies a WorldContext with
+``model_copy`` instead: the entity lists and tension sliders are new
+containers, the entities in them are shared.
+
+Models are still built with their validating constructors: pydantic doesn't
+revalidate model instances passed as fields, so ``model_construct`` saves
+nothing there (it measured slower for an Arc) and would drop validation.
+
+Generators treat world contexts as copy-on-write: every change forks the
+current context, changes the fork's lists (append, sort, filter) and
+installs it, and no entity inside a context is modified in place. That is
+what makes sharing entities, and sharing one context between tree nodes,
+safe.
+
+Run directly for a per-step benchmark against the deepcopy path:
+
+    python -m backend.worldgen.trusted_models
+"""
+import copy
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+# WorldContext fields that generators change
+CONTEXT_LISTS = ("districts", "technologies", "factions", "npcs")
+
+
+def fork_context(context: Any) -> Any:
+    """A WorldContext whose lists can be changed without touching the original."""
+    update: Dict[str, Any] = {kind: list(getattr(context, kind)) for kind in CONTEXT_LISTS}
+    update["tension_sliders"] = dict(context.tension_sliders)
+    return context.model_copy(update=update)
+
+
+def _measure(operation: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Mean CPU time and allocated bytes of one call."""
+    operation()
+    tracemalloc.start()
+    started = time.process_time()
+    results = [operation() for _ in range(repeat)]
+    cpu_ms = (time.process_time() - started) * 1000 / repeat
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return {"cpu_ms": cpu_ms, "kb": allocated / 1024 / repeat}
+
+
+def _benchmark_context(npc_count: int) -> Any:
+    """The initial world context grown to npc_count NPCs (and a third as many factions and technologies)."""
+    from .initial_world_context import create_initial_world_context
+    from .lazy_baml import baml_types
+
+    seed = baml_types.WorldSeed(name="Benchmark", themes=["intrigue"], high_concept="A city of informants")
+    context = create_initial_world_context(seed)
+    for kind, count in (("npcs", npc_count), ("factions", npc_count // 3), ("technologies", npc_count // 3)):
+        entities = getattr(context, kind)
+        templates = list(entities)
+        for i in range(count - len(templates)):
+            entities.append(templates[i % len(templates)].model_copy(update={"name": f"{templates[i % len(templates)].name} {i}"}))
+    return context
+
+
+def benchmark(npc_counts=(10, 100, 500), repeat: int = 50) -> List[Dict[str, Any]]:
+    """Per-step cost of copying the world context, both ways.
+
+    Returns:
+        One row per context size, CPU ms and KiB allocated per operation
+    """
+    rows = []
+    for npc_count in npc_counts:
+        context = _benchmark_context(npc_count)
+        costs = {
+            "deepcopy": _measure(lambda: copy.deepcopy(context), repeat),
+            "fork": _measure(lambda: fork_context(context), repeat),
+        }
+        rows.append({"npcs": npc_count, **{
+            f"{name}_{unit}": round(value, 3) for name, cost in costs.items() for unit, value in cost.items()
+        }})
+    return rows
+
+
+if __name__ == "__main__":
+    print(f"{'npcs':>5} {'deepcopy ms':>12} {'KiB':>9} {'fork ms':>8} {'KiB':>7}")
+    for row in benchmark():
+        print(f"{row['npcs']:>5} {row['deepcopy_cpu_ms']:>12} {row['deepcopy_kb']:>9} {row['fork_cpu_ms']:>8} {row['fork_kb']:>7}")
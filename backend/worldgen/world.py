@@ -1,29 +1,75 @@
-import copy
-from .baml_client.types import NPC, Arc, Choice, PlayerAttribute, PlayerProfile, PlayerStats, Situation, WorldSeed, District, Faction, Technology, WorldContext, PlayerState
-from .baml_client.async_client import b
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import itertools
+from .lazy_baml import baml_types
 import logging
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Any, List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass, field
 import json
 import os
 from datetime import datetime
 from tqdm import tqdm
 from .initial_world_context import create_initial_world_context, create_initial_player_state
+from .graph_layout import GraphLayout
+from .graph_analysis import analyze_arcs, dangling_choices
+from .entity_index import WorldEntityIndex
+from .prompt_cache import ContextOrder, PromptCacheStats
+from .resilience import CallFailed, DeadLetterQueue, ResilientClient
+from .run_metrics import RunMetrics
+from .memory_profile import MemoryProfiler, unique_contexts, walk_tree, with_world_memory_profiler
+from .span_trace import SpanTracer, mark_step, traced, with_world_tracer
+from .step_profile import StepProfiler, with_world_profiler
+from .serialization import export_situation, write_json
+from .augmentation import group_situations, split_results
+from .frontier import FrontierExpander, FrontierItem, FrontierLimits
+from .batch import BatchRequest, BatchRunner
+from .provenance import Origin, Provenance, dependent_situations
+from .trusted_models import fork_context
+from .bridge_candidates import (
+    batch_candidates, build_situation_index, candidate_arcs, candidate_pairs, rank_bridge_candidates,
+)
+
+if TYPE_CHECKING:
+    from .baml_client.types import Arc, ArcSeed, Choice, Situation, WorldSeed, WorldContext, PlayerState
 
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s_%(name)s]:  %(message)s")
 logger = logging.getLogger("worldgen")
 
-@dataclass
+_node_ids = itertools.count()
+
+
+@dataclass(slots=True, eq=False)
 class WorldStateNode:
-    """A node in the world state tree representing a specific state of the world."""
+    """A node in the world state tree representing a specific state of the world.
+
+    Children are kept in two parallel lists (choice ids and nodes) rather than a
+    dict, and each node records the choice that led to it, so walking back to
+    the root never has to search a parent's children.
+    """
     context: WorldContext
-    parent: Optional['WorldStateNode'] = None
-    children: Dict[str, 'WorldStateNode'] = field(default_factory=dict)  # choice_id -> child node
+    parent: Optional[WorldStateNode] = None
+    incoming_choice_id: Optional[str] = None
+    node_id: int = field(default_factory=lambda: next(_node_ids))
+    child_choice_ids: List[str] = field(default_factory=list)
+    child_nodes: List[WorldStateNode] = field(default_factory=list)
     
-    def add_child(self, choice_id: str, child: 'WorldStateNode') -> None:
+    def add_child(self, choice_id: str, child: WorldStateNode) -> None:
         """Add a child node resulting from a specific choice."""
-        self.children[choice_id] = child
+        if choice_id in self.child_choice_ids:
+            self.child_nodes[self.child_choice_ids.index(choice_id)] = child
+        else:
+            self.child_choice_ids.append(choice_id)
+            self.child_nodes.append(child)
         child.parent = self
+        child.incoming_choice_id = choice_id
+
+    def get_child(self, choice_id: str) -> Optional[WorldStateNode]:
+        """Get the child reached by a choice, or None."""
+        if choice_id not in self.child_choice_ids:
+            return None
+        return self.child_nodes[self.child_choice_ids.index(choice_id)]
 
 class World():
     def __init__(self, seed: WorldSeed):
@@ -34,6 +80,10 @@ class World():
         self.seed = seed
         self.generation_run_started_at = datetime.now()
         self.initial_world_context: WorldContext = create_initial_world_context(self.seed)
+        # Merges near-duplicate NPCs, factions and technologies as choices add them
+        self.entity_index = WorldEntityIndex.from_context(self.initial_world_context)
+        # Keeps entity lists in first-seen order so prompts share a stable prefix
+        self.context_order = ContextOrder.from_context(self.initial_world_context)
         logger.info("Initial world context created with:")
         logger.info(f"- {len(self.initial_world_context.technologies)} technologies")
         logger.info(f"- {len(self.initial_world_context.factions)} factions")
@@ -50,6 +100,43 @@ class World():
         self._current_node = self._root_node
         # Track generation steps
         self._generation_step = 0
+        # Viewer layout, kept across steps so existing nodes don't move
+        self._graph_layout = GraphLayout()
+        # Step files are compact unless pretty_saves is set
+        self.pretty_saves = False
+        # Bridge generation: how many ranked candidate pairs to send, and how many per call
+        self.bridge_top_k = 12
+        self.bridge_batch_size = 4
+        # Choice augmentation: situations per batched call, and the rough token budget of a batch
+        self.augment_batch_size = 4
+        self.augment_token_budget = 6000
+        # Missing situations: how deep to close dangling choices, when to stop, and how many to generate at once
+        self.frontier_limits = FrontierLimits(max_depth=1, max_situations=200, token_budget=None, workers=4)
+        # Set to run augmentation and missing situations as batch jobs, e.g.
+        # BatchRunner(OpenAIBatchEndpoint(), f"{world.run_folder}/batches", client=world.llm) (see batch.py)
+        self.batch_runner: Optional[BatchRunner] = None
+        # Which call produced each situation and choice, and which choices carried each entity (see regenerate)
+        self.provenance = Provenance.from_context(self.initial_world_context, WorldEntityIndex.KINDS)
+        # Token usage of every BAML call, used to measure provider prompt cache hits
+        from baml_py import Collector
+        self.collector = Collector(name=f"worldgen_{seed.name}")
+        self.prompt_cache_stats = PromptCacheStats()
+        # LLM calls retry per function and fail over between clients; failed work items are retried per step
+        self.llm = ResilientClient(collector=self.collector)
+        self.dead_letters = DeadLetterQueue()
+        # One folder per generation run; metrics.jsonl gets a record per finished step
+        self.run_folder = f"saves/{self.seed.name}_{self.generation_run_started_at.strftime('%Y%m%d_%H%M%S')}"
+        self.metrics = RunMetrics(self.run_folder, self.collector)
+        # (number, name) of the step in progress, recorded in metrics.jsonl when it finishes
+        self._open_step: Optional[Tuple[int, str]] = None
+        # Bytes of save, situations and layout files written since the last metrics record
+        self._bytes_saved = 0
+        # Set to a MemoryProfiler to add memory growth and structure sizes to every metrics record
+        self.memory_profiler: Optional[MemoryProfiler] = None
+        # Set to a SpanTracer to write a Chrome trace of each generate/regenerate call to trace.json
+        self.tracer: Optional[SpanTracer] = None
+        # Set to a StepProfiler to write a cProfile per step and sampled stacks of each generate/regenerate call
+        self.profiler: Optional[StepProfiler] = None
         # Create saves directory if it doesn't exist
         os.makedirs("saves", exist_ok=True)
         logger.info("World initialization complete")
@@ -73,9 +160,9 @@ class World():
         """
         current = self._root_node
         for choice_id in choice_path:
-            if choice_id not in current.children:
+            current = current.get_child(choice_id)
+            if current is None:
                 raise KeyError(f"Invalid choice path: {choice_path}")
-            current = current.children[choice_id]
         return current.context
 
     def update_world_context(self, new_context: WorldContext, choice_id: str) -> None:
@@ -94,17 +181,13 @@ class World():
         history = []
         current = self._current_node
         while current.parent is not None:
-            # Find the choice that led to this node
-            for choice_id, node in current.parent.children.items():
-                if node is current:
-                    history.append(choice_id)
-                    break
+            history.append(current.incoming_choice_id)
             current = current.parent
         return list(reversed(history))
 
     def get_available_choices(self) -> List[str]:
         """Get the list of choice IDs available from the current state."""
-        return list(self._current_node.children.keys())
+        return list(self._current_node.child_choice_ids)
 
     def step_back(self) -> Optional[WorldContext]:
         """Step back to the parent state.
@@ -129,30 +212,39 @@ class World():
         Raises:
             KeyError: If the choice is not available
         """
-        if choice_id not in self._current_node.children:
+        child = self._current_node.get_child(choice_id)
+        if child is None:
             raise KeyError(f"Choice {choice_id} is not available from current state")
-        self._current_node = self._current_node.children[choice_id]
+        self._current_node = child
         return self.world_context
 
+    @traced("save", "io")
     def _save_world_state(self, step_name: str) -> None:
         """Save the current world state to a JSON file.
         
         Args:
             step_name: Name of the generation step (e.g., "arc_titles", "arc_seeds")
         """
-        # Use the timestamp from when the generation run started
-        timestamp = self.generation_run_started_at.strftime("%Y%m%d_%H%M%S")
         # Create a dedicated folder for this generation run
-        run_folder = f"saves/{self.seed.name}_{timestamp}"
+        run_folder = self.run_folder
         os.makedirs(run_folder, exist_ok=True)
         
         # Use numerical step label instead of timestamp
         filename = f"{run_folder}/step_{self._generation_step:02d}_{step_name}.json"
         
+        # Convert each situation once; step file and situations.json share the result
+        situations = [situation for arc in getattr(self, 'arcs', []) for situation in arc.situations]
+        exported_situations = {situation.id: export_situation(situation) for situation in situations}
+
         # Create the export package
         export_data = {
-            "world_context": self.world_context.dict(),
-            "player_state": self.player_state.dict(),
+            "world_context": self.world_context.model_dump(),
+            "player_state": self.player_state.model_dump(),
+            "entity_aliases": self.entity_index.aliases,
+            "prompt_cache": self.prompt_cache_stats.to_dict(),
+            "llm_calls": self.llm.to_dict(),
+            "failed_work": self.dead_letters.to_dict(),
+            "provenance": self.provenance.to_dict(),
             "generation_step": self._generation_step,
             "step_name": step_name,
             "choice_history": self.get_choice_history(),
@@ -160,17 +252,7 @@ class World():
             "arcs": [{
                 "id": arc.seed.title,
                 "situations": {
-                    situation.id: {
-                        "id": situation.id,
-                        "title": situation.description,
-                        "description": situation.description,
-                        "choices": [choice.dict() for choice in situation.choices],
-                        "stat_requirements": [stat_requirement.dict() for stat_requirement in situation.stat_requirements],
-                        "attribute_requirements": None,  # TODO: Add attribute requirements
-                        "consequences": situation.consequences,
-                        "is_bridge_node": situation.bridgeable,
-                        "next_situations": list(situation.consequences.values())
-                    } for situation in arc.situations
+                    situation.id: exported_situations[situation.id] for situation in arc.situations
                 },
                 "bridge_nodes": [
                     situation.id for situation in arc.situations 
@@ -180,59 +262,402 @@ class World():
         }
         
         # Save to file
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        self._bytes_saved += write_json(filename, export_data, indent=self.pretty_saves)
         logger.info(f"Saved world state to {filename}")
-        logger.debug(f"Export data: {json.dumps(export_data, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Export data: {json.dumps(export_data, indent=2)}")
+        layout_file = self._graph_layout.write(filename, export_data["arcs"])
+        self._bytes_saved += os.path.getsize(layout_file)
 
         # If we have arcs, also save a situations-only file
         if hasattr(self, 'arcs'):
             situations_data = {
-                "situations": {
-                    situation.id: {
-                        "id": situation.id,
-                        "title": situation.description,
-                        "description": situation.description,
-                        "choices": [choice.dict() for choice in situation.choices],
-                        "stat_requirements": [stat_requirement.dict() for stat_requirement in situation.stat_requirements],
-                        "attribute_requirements": None,  # TODO: Add attribute requirements
-                        "consequences": situation.consequences,
-                        "is_bridge_node": situation.bridgeable,
-                        "next_situations": list(situation.consequences.values())
-                    }
-                    for arc in self.arcs
-                    for situation in arc.situations
-                },
-                "bridge_nodes": [
-                    situation.id
-                    for arc in self.arcs
-                    for situation in arc.situations
-                    if situation.bridgeable
-                ]
+                "situations": exported_situations,
+                "bridge_nodes": [situation.id for situation in situations if situation.bridgeable]
             }
             
             situations_file = f"{run_folder}/situations.json"
-            with open(situations_file, 'w') as f:
-                json.dump(situations_data, f, indent=2)
+            self._bytes_saved += write_json(situations_file, situations_data)
             logger.info(f"Saved situations data to {situations_file}")
 
+    def _finish_step(self) -> None:
+        """Append the metrics record of the step in progress, if any.
+
+        Its bytes saved include the step file written when the step started.
+        """
+        if self._open_step is None:
+            return
+        step, step_name = self._open_step
+        self._open_step = None
+        memory = {"memory": self._measure_memory()} if self.memory_profiler is not None else {}
+        situations = [situation for arc in getattr(self, 'arcs', []) for situation in arc.situations]
+        self.metrics.record(
+            step=step,
+            action=step_name,
+            bytes_saved=self._bytes_saved,
+            situations=len(situations),
+            choices=sum(len(situation.choices) for situation in situations),
+            npcs=len(self.world_context.npcs),
+            dead_ends=len(dangling_choices(situations)),
+            **memory,
+        )
+        self._bytes_saved = 0
+
+    def _measure_memory(self) -> Dict[str, Any]:
+        nodes = walk_tree(self._root_node)
+        return self.memory_profiler.step([
+            ("situations", [situation for arc in getattr(self, 'arcs', []) for situation in arc.situations]),
+            ("contexts", unique_contexts(nodes)),
+            ("tree_nodes", nodes),
+        ])
+
+    def _begin_step(self, name: str) -> None:
+        """Start the next step's span and profile."""
+        mark_step(name)
+        if self.profiler is not None:
+            self.profiler.step(name)
+
     async def advance_generation_step(self, filename_note: str = ""):
-        """Advance the generation step by 1. Also saves the world state to a file."""
+        """Advance the generation step by 1. Also saves the world state to a file.
+
+        The step that was in progress is recorded in metrics.jsonl first.
+        """
         logger.info(f"Advancing generation step to {filename_note}_{self._generation_step}")
+        self._finish_step()
         self._generation_step += 1
+        self._begin_step(f"step_{self._generation_step:02d}_{filename_note}")
+        self._open_step = (self._generation_step, filename_note)
+        self.prompt_cache_stats.observe(self.collector)
         self._save_world_state(f"{filename_note}")
 
+    @traced("apply_choice_diffs", "context")
     async def apply_choice_diffs(self, new_choice: Choice):
         """Apply new_npcs, new_factions, new_technologies to the world context whenever a new Choice is created."""
-        new_context = copy.deepcopy(self.world_context)
-        if new_choice.new_npcs:
-            new_context.npcs.extend(new_choice.new_npcs)
-        if new_choice.new_factions:
-            new_context.factions.extend(new_choice.new_factions)
-        if new_choice.new_technologies:
-            new_context.technologies.extend(new_choice.new_technologies)
+        new_context = fork_context(self.world_context)
+        self.entity_index.merge_choice(new_context, new_choice)
+        self.context_order.canonicalize(new_context)
+        for kind in WorldEntityIndex.KINDS:
+            entities = getattr(new_choice, f"new_{kind}") or []
+            self.provenance.record_entities(new_choice.id, kind, [self.entity_index.resolve(kind, entity.name) for entity in entities])
         self.update_world_context(new_context, new_choice.id)
 
+    async def _augment_situation_group(self, arc: Arc, group: List[Situation]) -> Dict[str, List[Choice]]:
+        """Generate extra choices for a group of situations in one call.
+
+        If the batched call fails (usually unparseable output), and for situations
+        it returns nothing for, this falls back to one AugmentSituationChoices
+        call per situation.
+
+        Returns:
+            situation_id -> new choices
+        """
+        choices_by_situation: Dict[str, List[Choice]] = {}
+        missing = group
+        if len(group) > 1:
+            try:
+                results = await self.llm.AugmentSituationsChoices(
+                    world_context=self.world_context,
+                    player_state=self.player_state,
+                    arc=arc,
+                    situations=group
+                )
+                choices_by_situation, missing = split_results(group, results)
+            except CallFailed as e:
+                logger.warning(f"Batched augmentation failed, augmenting one situation at a time: {e}")
+        for situation in missing:
+            choices_by_situation[situation.id] = await self.llm.AugmentSituationChoices(
+                world_context=self.world_context,
+                player_state=self.player_state,
+                arc=arc,
+                situation=situation
+            )
+        return choices_by_situation
+
+    async def _start_arc(self, arc_seed: ArcSeed) -> Arc:
+        """Generate an arc's root situation and outcomes."""
+        logger.info(f"Generating root situation for arc: {arc_seed.title}")
+        root_situation = await self.llm.GenerateRootSituation(
+            world_context=self.world_context,
+            player_state=self.player_state,
+            arc_seed=arc_seed
+        )
+        arc_outcomes = await self.llm.GenerateArcOutcomes(
+            world_context=self.world_context,
+            player_state=self.player_state,
+            arc_seed=arc_seed
+        )
+        logger.info(f"Generated {len(arc_outcomes)} arc outcomes:")
+        for outcome in arc_outcomes:
+            logger.info(f"- {outcome.description}")
+        self.provenance.record_situation(root_situation, Origin("GenerateRootSituation", self._generation_step, arc_seed.title))
+        for choice in root_situation.choices:
+            await self.apply_choice_diffs(choice)
+        # Create new arc with seed and root situation
+        arc = baml_types.Arc(
+            seed=arc_seed,
+            situations=[root_situation],
+            outcomes=arc_outcomes
+        )
+        logger.info(f"Root situation generated:")
+        logger.info(f"- ID: {root_situation.id}")
+        logger.info(f"- Description: {root_situation.description}")
+        logger.info(f"- Number of choices: {len(root_situation.choices)}")
+        logger.info(f"- Bridgeable: {root_situation.bridgeable}")
+        logger.info(f"- Context tags: {', '.join(root_situation.context_tags)}")
+        return arc
+
+    async def _expand_arc(self, arc: Arc) -> None:
+        new_situations = await self.llm.ExpandArcSituations(
+            world_context=self.world_context,
+            player_state=self.player_state,
+            arc=arc
+        )
+        for new_situation in new_situations:
+            self.provenance.record_situation(new_situation, Origin("ExpandArcSituations", self._generation_step, arc.seed.title))
+            for choice in new_situation.choices:
+                await self.apply_choice_diffs(choice)
+        arc.situations.extend(new_situations)
+
+    async def _add_augmented_choices(self, arc: Arc, group: List[Situation], choices_by_situation: Dict[str, List[Choice]]) -> None:
+        arc_situation_ids = {situation.id for situation in arc.situations}
+        for situation in group:
+            new_choices = []
+            # Newly generated choices must not reference any choices in the arc
+            for choice in choices_by_situation.get(situation.id, []):
+                if choice.next_situation_id in arc_situation_ids:
+                    logger.warning(f"Choice {choice.id} references a situation that already exists in the arc")
+                    continue
+                new_choices.append(choice)
+            self.provenance.record_choices(situation.id, new_choices, "AugmentSituationsChoices", self._generation_step, arc.seed.title)
+            for choice in new_choices:
+                await self.apply_choice_diffs(choice)
+            situation.choices.extend(new_choices)
+
+    async def _augment_group(self, arc: Arc, group: List[Situation]) -> None:
+        logger.info(f"Augmenting choices for situations: {', '.join(situation.id for situation in group)}")
+        await self._add_augmented_choices(arc, group, await self._augment_situation_group(arc, group))
+
+    async def _augment_arcs(self, arcs: List[Arc]) -> None:
+        """Add choices to every situation of the arcs, as a batch job when batch_runner is set."""
+        arc_groups = [
+            (arc, group) for arc in arcs
+            for group in group_situations(list(arc.situations), self.augment_batch_size, self.augment_token_budget)
+        ]
+        batch_results = {}
+        if self.batch_runner is not None:
+            batch = await self.batch_runner.run([
+                BatchRequest(f"augment_{i:05d}", "AugmentSituationsChoices", dict(
+                    world_context=self.world_context,
+                    player_state=self.player_state,
+                    arc=arc,
+                    situations=group
+                ))
+                for i, (arc, group) in enumerate(arc_groups)
+            ])
+            batch_results = {int(custom_id.split("_")[1]): results for custom_id, results in batch.results.items()}
+        for i, (arc, group) in enumerate(tqdm(arc_groups, desc="Augmenting choices", unit="group")):
+            if i in batch_results:
+                choices_by_situation, missing = split_results(group, batch_results[i])
+                await self._add_augmented_choices(arc, group, choices_by_situation)
+                if not missing:
+                    continue
+                group = missing
+            # Direct calls, also for whatever a batch job failed to produce
+            await self.dead_letters.run(
+                f"augmentation of {', '.join(situation.id for situation in group)}",
+                lambda arc=arc, group=group: self._augment_group(arc, group)
+            )
+
+    async def _connect_situation(self, arc: Arc, choice: Choice, new_situation: Situation) -> Situation:
+        # Set the next_situation_id on the original choice
+        choice.next_situation_id = new_situation.id
+        
+        self.provenance.record_situation(new_situation, Origin("GenerateSituationForChoice", self._generation_step, arc.seed.title, choice.id))
+        for new_choice in new_situation.choices:
+            await self.apply_choice_diffs(new_choice)
+        arc.situations.append(new_situation)
+        logger.info(f"Generated new situation for choice {choice.id}: {new_situation.id}")
+        return new_situation
+
+    async def _fill_choice(self, arc: Arc, choice: Choice) -> Situation:
+        new_situation = await self.llm.GenerateSituationForChoice(
+            world_context=self.world_context,
+            player_state=self.player_state,
+            arc=arc,
+            choice=choice
+        )
+        return await self._connect_situation(arc, choice, new_situation)
+
+    async def _fill_frontier_choice(self, arc: Arc, choice: Choice) -> Optional[Situation]:
+        logger.warning(f"Choice {choice.id} has no next_situation_id or points to non-existent situation")
+        return await self.dead_letters.run(
+            f"situation for choice {choice.id}",
+            lambda: self._fill_choice(arc, choice)
+        )
+
+    async def _fill_frontier_batch(self, items: List[FrontierItem]) -> List[Optional[Situation]]:
+        batch = await self.batch_runner.run([
+            BatchRequest(f"situation_{i:05d}", "GenerateSituationForChoice", dict(
+                world_context=self.world_context,
+                player_state=self.player_state,
+                arc=item.arc,
+                choice=item.choice
+            ))
+            for i, item in enumerate(items)
+        ])
+        new_situations = []
+        for i, item in enumerate(items):
+            new_situation = batch.results.get(f"situation_{i:05d}")
+            if new_situation is None:
+                # Direct call for whatever the batch job failed to produce
+                new_situations.append(await self._fill_frontier_choice(item.arc, item.choice))
+            else:
+                new_situations.append(await self._connect_situation(item.arc, item.choice, new_situation))
+        return new_situations
+
+    def _frontier_expander(self, limits: FrontierLimits, step_name: Optional[str] = None) -> FrontierExpander:
+        """A FrontierExpander filling choices through this world, saving as step_name after each wave if given."""
+
+        async def save_wave(wave: int, new_situations: List[Situation]) -> None:
+            logger.info(f"Frontier wave {wave} added {len(new_situations)} situations")
+            if step_name is not None:
+                await self.advance_generation_step(step_name)
+
+        if self.batch_runner is None:
+            return FrontierExpander(self._fill_frontier_choice, limits, self.collector, save_wave)
+        # Batch jobs bypass the collector; their usage counts against the token budget through the runner's stats
+        stats = self.batch_runner.stats
+        return FrontierExpander(
+            self._fill_frontier_choice, limits, self.collector, save_wave,
+            fill_batch=self._fill_frontier_batch, extra_tokens=lambda: stats.tokens
+        )
+
+    def _find_arc(self, title: Optional[str] = None, situation_id: Optional[str] = None) -> Arc:
+        for arc in getattr(self, 'arcs', []):
+            if arc.seed.title == title or any(situation.id == situation_id for situation in arc.situations):
+                return arc
+        raise KeyError(f"No arc {'titled ' + repr(title) if title is not None else 'with situation ' + repr(situation_id)}")
+
+    async def _invalidate(self, arc: Arc, situation_ids: Set[str], reason: str) -> None:
+        """Remove situations of an arc and everything that only exists because of them.
+
+        Choices leading into them from other arcs (bridges) are removed too;
+        choices of the same arc are left dangling for the caller to refill.
+        Entities no remaining choice carries are taken out of the world context.
+        """
+        removed_choice_ids = set()
+        for situation in arc.situations:
+            if situation.id in situation_ids:
+                removed_choice_ids.update(choice.id for choice in situation.choices)
+        arc.situations = [situation for situation in arc.situations if situation.id not in situation_ids]
+        for other_arc in self.arcs:
+            if other_arc is arc:
+                continue
+            for situation in other_arc.situations:
+                bridges = [choice for choice in situation.choices if choice.next_situation_id in situation_ids]
+                if bridges:
+                    removed_choice_ids.update(choice.id for choice in bridges)
+                    situation.choices = [choice for choice in situation.choices if choice.next_situation_id not in situation_ids]
+                    logger.info(f"Removed {len(bridges)} bridge choices from {situation.id}")
+        orphaned = self.provenance.forget(situation_ids, removed_choice_ids)
+        logger.info(f"Invalidated {len(situation_ids)} situations, {len(removed_choice_ids)} choices and {len(orphaned)} entities")
+        if not orphaned:
+            return
+        new_context = fork_context(self.world_context)
+        for kind, name in orphaned:
+            setattr(new_context, kind, [entity for entity in getattr(new_context, kind) if entity.name != name])
+            aliases = self.entity_index.aliases[kind]
+            for alias in [alias for alias, canonical in aliases.items() if canonical == name]:
+                del aliases[alias]
+        self.update_world_context(new_context, reason)
+
+    @with_world_tracer
+    @with_world_profiler
+    @with_world_memory_profiler
+    async def regenerate(self, arc_title: str) -> List[Situation]:
+        """Regenerate one arc from its seed, keeping the rest of the world.
+
+        The arc's situations, the bridges into them and the entities only its
+        choices introduced are invalidated; the arc is then generated again
+        (root situation, expansion, augmentation, missing situations) without
+        reading the LLM response cache. Bridges are not regenerated.
+
+        Returns:
+            The arc's new situations
+
+        Raises:
+            KeyError: If there is no arc with that title
+            CallFailed: If the root situation could not be generated; the arc is then left empty
+        """
+        old_arc = self._find_arc(title=arc_title)
+        logger.info(f"Regenerating arc {arc_title} ({len(old_arc.situations)} situations)")
+        self.llm.refresh_cache = True
+        try:
+            await self._invalidate(old_arc, {situation.id for situation in old_arc.situations}, f"regenerate_{arc_title}")
+            arc = await self._start_arc(old_arc.seed)
+            self.arcs[self.arcs.index(old_arc)] = arc
+            await self.dead_letters.run(f"expansion of '{arc.seed.title}'", lambda: self._expand_arc(arc))
+            await self._augment_arcs([arc])
+            await self.dead_letters.retry_pending()
+            await self._frontier_expander(self.frontier_limits).expand([arc])
+            await self.dead_letters.retry_pending()
+        finally:
+            self.llm.refresh_cache = False
+        logger.info(f"Regenerated arc {arc_title} with {len(arc.situations)} situations")
+        await self.advance_generation_step("regenerated_arc")
+        self._finish_step()
+        return list(arc.situations)
+
+    @with_world_tracer
+    @with_world_profiler
+    @with_world_memory_profiler
+    async def regenerate_subtree(self, situation_id: str) -> List[Situation]:
+        """Regenerate a situation and every situation only reachable through it.
+
+        Everything else in the world is kept. The situation is generated again
+        for the choice leading to it, and the frontier below it is expanded as
+        deep as the old subtree went. An arc's root situation regenerates the
+        whole arc.
+
+        Returns:
+            The new situations
+
+        Raises:
+            KeyError: If no arc has the situation
+            ValueError: If no choice in its arc leads to the situation
+        """
+        arc = self._find_arc(situation_id=situation_id)
+        if arc.situations[0].id == situation_id:
+            return await self.regenerate(arc.seed.title)
+        dependents, depth = dependent_situations(arc, situation_id)
+        inbound = [
+            choice for situation in arc.situations if situation.id not in dependents
+            for choice in situation.choices if choice.next_situation_id == situation_id
+        ]
+        if not inbound:
+            raise ValueError(f"No choice in arc {arc.seed.title} leads to {situation_id}; regenerate the arc instead")
+        logger.info(f"Regenerating {situation_id} and {len(dependents) - 1} situations below it ({depth} deep)")
+        self.llm.refresh_cache = True
+        try:
+            await self._invalidate(arc, dependents, f"regenerate_{situation_id}")
+            situation_count = len(arc.situations)
+            limits = dataclasses.replace(self.frontier_limits, max_depth=depth + 1)
+            await self._frontier_expander(limits).expand_from([FrontierItem(arc, inbound[0], 1)])
+            await self.dead_letters.retry_pending()
+        finally:
+            self.llm.refresh_cache = False
+        # Other choices that led to the old situation now lead to the new one
+        for choice in inbound[1:]:
+            choice.next_situation_id = inbound[0].next_situation_id
+        new_situations = arc.situations[situation_count:]
+        logger.info(f"Regenerated {len(new_situations)} situations in place of {len(dependents)}")
+        await self.advance_generation_step("regenerated_subtree")
+        self._finish_step()
+        return list(new_situations)
+
+    @with_world_tracer
+    @with_world_profiler
+    @with_world_memory_profiler
     async def generate(self):
         """Generate a new narrative arc for the world.
         
@@ -254,7 +679,8 @@ class World():
            - Provide meaningful progression
            - Include appropriate stat requirements
         5. Augment situation choices with more dialogue options
-        6. Identify missing situations
+        6. Fill missing situations - Generate situations for choices that go nowhere,
+           wave by wave, down to frontier_limits.max_depth
         7. Identify and generate bridge nodes
         8. Final validation and export
         """
@@ -264,7 +690,7 @@ class World():
         # Step 1: Generate arc titles
         logger.info(f"Step {self._generation_step}: Generating arc titles")
         await self.advance_generation_step("arc_titles")
-        arc_titles = await b.GenerateArcTitles(
+        arc_titles = await self.llm.GenerateArcTitles(
             world_context=self.world_context,
             player_state=self.player_state,
             count=1
@@ -278,55 +704,38 @@ class World():
         logger.info(f"Step {self._generation_step}: Generating arc seeds")
         await self.advance_generation_step("arc_seeds")
         arc_seeds = []
-        for title in tqdm(arc_titles, desc="Generating arc seeds", unit="arc"):
+
+        async def seed_arc(title: str) -> None:
             logger.info(f"Generating seed for arc: {title}")
-            arc_seed = await b.GenerateArcSeed(
+            arc_seed = await self.llm.GenerateArcSeed(
                 world_context=self.world_context,
                 player_state=self.player_state,
                 title=title
             )
+            arc_seed.factions_involved = [self.entity_index.resolve_faction(f) for f in arc_seed.factions_involved]
             arc_seeds.append(arc_seed)
             logger.info(f"Arc seed generated:")
             logger.info(f"- Core conflict: {arc_seed.core_conflict}")
             logger.info(f"- Theme tags: {', '.join(arc_seed.theme_tags)}")
             logger.info(f"- Tone: {arc_seed.tone}")
             logger.info(f"- Factions involved: {', '.join(arc_seed.factions_involved)}")
+
+        for title in tqdm(arc_titles, desc="Generating arc seeds", unit="arc"):
+            await self.dead_letters.run(f"arc seed for '{title}'", lambda title=title: seed_arc(title))
+        await self.dead_letters.retry_pending()
         logger.info("-" * 80)
         
         # Step 3: Generate root situations
         logger.info(f"Step {self._generation_step}: Generating root situations")
         await self.advance_generation_step("root_situations")
         self.arcs = []  # Initialize arcs list
+
+        async def start_arc(arc_seed: ArcSeed) -> None:
+            self.arcs.append(await self._start_arc(arc_seed))
+
         for arc_seed in tqdm(arc_seeds, desc="Generating root situations", unit="situation"):
-            logger.info(f"Generating root situation for arc: {arc_seed.title}")
-            root_situation = await b.GenerateRootSituation(
-                world_context=self.world_context,
-                player_state=self.player_state,
-                arc_seed=arc_seed
-            )
-            arc_outcomes = await b.GenerateArcOutcomes(
-                world_context=self.world_context,
-                player_state=self.player_state,
-                arc_seed=arc_seed
-            )
-            logger.info(f"Generated {len(arc_outcomes)} arc outcomes:")
-            for outcome in arc_outcomes:
-                logger.info(f"- {outcome.description}")
-            for choice in root_situation.choices:
-                await self.apply_choice_diffs(choice)
-            # Create new arc with seed and root situation
-            arc = Arc(
-                seed=arc_seed,
-                situations=[root_situation],
-                outcomes=arc_outcomes
-            )
-            self.arcs.append(arc)
-            logger.info(f"Root situation generated:")
-            logger.info(f"- ID: {root_situation.id}")
-            logger.info(f"- Description: {root_situation.description}")
-            logger.info(f"- Number of choices: {len(root_situation.choices)}")
-            logger.info(f"- Bridgeable: {root_situation.bridgeable}")
-            logger.info(f"- Context tags: {', '.join(root_situation.context_tags)}")
+            await self.dead_letters.run(f"root situation for '{arc_seed.title}'", lambda arc_seed=arc_seed: start_arc(arc_seed))
+        await self.dead_letters.retry_pending()
         logger.info("-" * 80)
         
         # Step 4: Expand arc situations
@@ -334,87 +743,80 @@ class World():
         await self.advance_generation_step("expanded_situations")
         logger.info("Expanding situations with additional content and choices")
         for arc in tqdm(self.arcs, desc="Expanding arcs", unit="arc"):
-            new_situations = await b.ExpandArcSituations(
-                world_context=self.world_context,
-                player_state=self.player_state,
-                arc=arc
-            )
-            for new_situation in new_situations:
-                for choice in new_situation.choices:
-                    await self.apply_choice_diffs(choice)
-            arc.situations.extend(new_situations)
+            await self.dead_letters.run(f"expansion of '{arc.seed.title}'", lambda arc=arc: self._expand_arc(arc))
+        await self.dead_letters.retry_pending()
         logger.info("-" * 80)
         
         # Step 5: Augment situation choices with more dialogue options
         logger.info(f"Step {self._generation_step}: Augmenting situation choices")
         await self.advance_generation_step("augmented_choices")
         logger.info("Adding more granular dialogue choices and micro-interactions")
-        for arc in tqdm(self.arcs, desc="Augmenting choices", unit="arc"):
-            for i, situation in enumerate(arc.situations):
-                logger.info(f"Augmenting choices for situation: {situation.id}")
-                new_choices = await b.AugmentSituationChoices(
-                    world_context=self.world_context,
-                    player_state=self.player_state,
-                    arc=arc,
-                    situation=situation
-                )
-                # Newly generated choices must not reference any choices in the arc
-                for choice in new_choices:
-                    if choice.next_situation_id in [situation.id for situation in arc.situations]:
-                        logger.warning(f"Choice {choice.id} references a situation that already exists in the arc")
-                        new_choices.remove(choice)
-                        continue
-                for choice in new_choices:
-                    await self.apply_choice_diffs(choice)
-                arc.situations[i].choices.extend(new_choices)
+        await self._augment_arcs(self.arcs)
+        await self.dead_letters.retry_pending()
         logger.info("-" * 80)
         
         # Step 6: Identify missing situations
         logger.info(f"Step {self._generation_step}: Identifying missing situations")
         await self.advance_generation_step("missing_situations")
-        # first, start by finding any Choices that have been created that go nowhere
-        for arc in self.arcs:
-            situations_to_add = []
-
-            for situation in arc.situations:
-                for choice in situation.choices:
-                    if choice.next_situation_id is None or choice.next_situation_id not in [s.id for s in arc.situations]:
-                        logger.warning(f"Choice {choice.id} has no next_situation_id or points to non-existent situation")
-                        new_situation = await b.GenerateSituationForChoice(
-                            world_context=self.world_context,
-                            player_state=self.player_state,
-                            arc=arc,
-                            choice=choice
-                        )
-                        # Set the next_situation_id on the original choice
-                        choice.next_situation_id = new_situation.id
-                        
-                        for choice in new_situation.choices:
-                            await self.apply_choice_diffs(choice)
-                        situations_to_add.append(new_situation)
-                        await self.advance_generation_step("missing_situations")
-                        logger.info(f"Generated new situation for choice {choice.id}: {new_situation.id}")
-                        # These situations will also not have choices - for now, we're only going to work with a depth of 1
-            arc.situations.extend(situations_to_add)
-            logger.info(f"Added {len(situations_to_add)} new situations to arc {arc.seed.title}")
+
+        # Close choices that go nowhere, wave by wave, down to frontier_limits.max_depth
+        situation_counts = [len(arc.situations) for arc in self.arcs]
+        frontier_stats = await self._frontier_expander(self.frontier_limits, "missing_situations").expand(self.arcs)
+        for arc, situation_count in zip(self.arcs, situation_counts):
+            logger.info(f"Added {len(arc.situations) - situation_count} new situations to arc {arc.seed.title}")
+        if frontier_stats.stopped_by:
+            logger.info(f"Frontier expansion stopped by {frontier_stats.stopped_by} after {frontier_stats.situations} situations")
+        await self.dead_letters.retry_pending()
 
         logger.info(f"Step {self._generation_step}: Generating bridge connections")
         await self.advance_generation_step("bridge_generation")
-        join_situations = await b.GenerateJoinChoices(
-            world_context=self.world_context,
-            arcs=self.arcs
-        )
-        logger.info(f"Generated {len(join_situations)} join situations")
-        for join_situation in tqdm(join_situations, desc="Adding join situations"):
-            logger.info(f"- {join_situation.from_situation_id} -> {join_situation.to_situation_id}: {join_situation.reason}")
-            # Now find each situation and add the choice.
-            for arc in self.arcs:
-                for situation in arc.situations:
-                    if join_situation.from_situation_id == situation.id:
-                        situation.choices.append(join_situation.choice)
-                        await self.apply_choice_diffs(join_situation.choice)
-                        logger.info(f"Added choice {join_situation.choice.id} to situation {situation.id}")
-                        break
+        # Rank cross-arc pairs locally and only send the best ones to the model
+        candidates = rank_bridge_candidates(self.arcs, self.world_context, top_k=self.bridge_top_k)
+        logger.info(f"Selected {len(candidates)} bridge candidates")
+        for candidate in candidates:
+            logger.debug(f"- {candidate.from_situation.id} -> {candidate.to_situation.id}: {candidate.score:.2f}")
+        batches = batch_candidates(candidates, self.bridge_batch_size)
+        join_situations = []  # (join, the pairs its batch allowed)
+
+        async def generate_joins(batch) -> None:
+            allowed = {(candidate.from_situation.id, candidate.to_situation.id) for candidate in batch}
+            joins = await self.llm.GenerateJoinChoices(
+                world_context=self.world_context,
+                arcs=candidate_arcs(batch),
+                pairs=candidate_pairs(batch)
+            )
+            join_situations.extend((join_situation, allowed) for join_situation in joins)
+
+        await asyncio.gather(*(
+            self.dead_letters.run(f"bridge batch {i + 1}", lambda batch=batch: generate_joins(batch))
+            for i, batch in enumerate(batches)
+        ))
+        await self.dead_letters.retry_pending()
+        logger.info(f"Generated {len(join_situations)} join situations from {len(batches)} batches")
+        situation_index = build_situation_index(self.arcs)
+        situation_arcs = {situation.id: arc.seed.title for arc in self.arcs for situation in arc.situations}
+        joined = set()
+        for join_situation, allowed in tqdm(join_situations, desc="Adding join situations"):
+            pair = (join_situation.from_situation_id, join_situation.to_situation_id)
+            logger.info(f"- {pair[0]} -> {pair[1]}: {join_situation.reason}")
+            situation = situation_index.get(pair[0])
+            if situation is None or pair[1] not in situation_index:
+                logger.warning(f"Skipping join between unknown situations {pair[0]} -> {pair[1]}")
+                continue
+            if pair not in allowed or situation_arcs[pair[0]] == situation_arcs[pair[1]]:
+                logger.warning(f"Skipping join {pair[0]} -> {pair[1]}: not one of its batch's cross-arc candidates")
+                continue
+            if pair in joined:
+                continue
+            joined.add(pair)
+            join_situation.choice.next_situation_id = join_situation.to_situation_id
+            situation.choices.append(join_situation.choice)
+            self.provenance.record_choices(
+                situation.id, [join_situation.choice], "GenerateJoinChoices", self._generation_step,
+                self._find_arc(situation_id=situation.id).seed.title
+            )
+            await self.apply_choice_diffs(join_situation.choice)
+            logger.info(f"Added choice {join_situation.choice.id} to situation {situation.id}")
         
         # Step 8: Final validation and export
         logger.info(f"Step {self._generation_step}: Final validation and export")
@@ -423,5 +825,17 @@ class World():
         logger.info(f"Generated {len(self.arcs)} arcs with enhanced dialogue and choices")
         total_situations = sum(len(arc.situations) for arc in self.arcs)
         logger.info(f"Total situations created: {total_situations}")
+        report = analyze_arcs(self.arcs, self.player_state.stats.dict())
+        logger.info(f"Graph analysis: {report.summary()}")
+        self.prompt_cache_stats.log_summary()
+        if self.batch_runner is not None:
+            logger.info(f"Batch jobs: {self.batch_runner.stats.to_dict()}")
+        for item in self.dead_letters.abandoned:
+            logger.warning(f"Gave up on {item.description}: {item.errors[-1]}")
+        self._finish_step()
+        for situation_id in report.unreachable:
+            logger.warning(f"Situation {situation_id} is not reachable from any arc root")
+        for edge in report.unsatisfiable:
+            logger.warning(f"Choice {edge.choice_id} in {edge.situation_id} can never meet its requirements {dict(edge.requirements)}")
         logger.info("=" * 80)
 
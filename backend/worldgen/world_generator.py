@@ -1,5 +1,5 @@
 # Generates a world file, and outputs it to worldname_001.json.
-from click import command, option
+from click import argument, group, option, pass_context
 import asyncio
 
 from .baml_client.types import WorldSeed
@@ -8,10 +8,36 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-@command()
-def main():
-    asyncio.run(gen_world())
-async def gen_world():
+@group(invoke_without_command=True)
+@option("--memory-profile", is_flag=True, help="Record tracemalloc growth and structure sizes per step in metrics.jsonl")
+@option("--trace", is_flag=True, help="Write a Chrome trace of the run to trace.json in the run folder")
+@option("--profile", is_flag=True, help="Write a cProfile per step and sampled stacks to the run folder's profile/")
+@pass_context
+def main(ctx, memory_profile, trace, profile):
+    if ctx.invoked_subcommand is None:
+        asyncio.run(gen_world(memory_profile, trace, profile))
+
+@main.command("generate-many")
+@argument("seeds_file", type=str)
+@option("--processes", default=4, help="Worker processes")
+@option("--concurrency", default=2, help="Worlds generated at once in each process")
+@option("--agent", is_flag=True, help="Use the agentic generator (AgentWorld)")
+@option("--requests-per-minute", type=float, default=None, help="LLM request rate shared by all processes")
+@option("--cache-dir", default="saves/response_cache", help="Shared LLM response cache folder")
+@option("--no-cache", is_flag=True, help="Don't use the response cache")
+def generate_many_command(seeds_file, processes, concurrency, agent, requests_per_minute, cache_dir, no_cache):
+    """Generate one world per seed in SEEDS_FILE (JSON list or JSONL of WorldSeed fields)."""
+    from .farm import generate_many, load_seeds
+    generate_many(
+        load_seeds(seeds_file),
+        processes=processes,
+        concurrency=concurrency,
+        agent=agent,
+        requests_per_minute=requests_per_minute,
+        cache_folder=None if no_cache else cache_dir,
+    )
+
+async def gen_world(memory_profile: bool = False, trace: bool = False, profile: bool = False):
     high_concept = f"""
 An isolated, libertarian society in the near (100 years) future. 
 Society is highly stratified.
@@ -28,7 +54,16 @@ Crime that does not damage corporations' property or employees is tolerated when
         internal_hint="",
         internal_justification="",
     ))
+    if memory_profile:
+        from .memory_profile import MemoryProfiler
+        world.memory_profiler = MemoryProfiler()
+    if trace:
+        from .span_trace import SpanTracer
+        world.tracer = SpanTracer(process_name=world.seed.name)
+    if profile:
+        from .step_profile import StepProfiler
+        world.profiler = StepProfiler(f"{world.run_folder}/profile")
     await world.generate()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,5 +1,15 @@
+import asyncio
 import json
-from typing import Dict, List, Optional
+import multiprocessing
+import os
+import random
+import secrets
+import sys
+import time
+from array import array
+from collections import Counter
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
@@ -11,6 +21,19 @@ from pathlib import Path
 app = typer.Typer()
 console = Console()
 
+def meets_requirements(stats: Dict[str, int], choice: Dict) -> bool:
+    """Check whether the given stats satisfy a choice's requirements"""
+    for stat, value in (choice.get('requirements') or {}).items():
+        if stats.get(stat, 0) < value:
+            return False
+    return True
+
+def apply_choice_effects(stats: Dict[str, int], attributes: List, choice: Dict):
+    """Apply a choice's stat changes and gained attributes in place"""
+    for stat, change in (choice.get('stat_changes') or {}).items():
+        stats[stat] = stats.get(stat, 0) + change
+    attributes.extend(choice.get('attributes_gained') or [])
+
 class GameState:
     def __init__(self, save_file: str):
         with open(save_file, 'r') as f:
@@ -66,21 +89,13 @@ class GameState:
         ))
         
         for i, choice in enumerate(situation['choices'], 1):
-            # Check if player meets requirements
-            meets_requirements = True
-            if 'requirements' in choice:
-                for stat, value in choice['requirements'].items():
-                    if self.player['stats'][stat] < value:
-                        meets_requirements = False
-                        break
-            
             # Display choice with requirements
             req_text = ""
-            if 'requirements' in choice:
+            if choice.get('requirements'):
                 reqs = [f"{k}: {v}" for k, v in choice['requirements'].items()]
                 req_text = f"\n[dim]Requirements: {', '.join(reqs)}[/dim]"
             
-            style = "green" if meets_requirements else "red"
+            style = "green" if meets_requirements(self.player['stats'], choice) else "red"
             console.print(f"{i}. [bold {style}]{choice['text']}[/bold {style}]{req_text}")
         
         return situation['choices']
@@ -91,20 +106,12 @@ class GameState:
         choice = situation['choices'][choice_index - 1]
         
         # Check requirements
-        if 'requirements' in choice:
-            for stat, value in choice['requirements'].items():
-                if self.player['stats'][stat] < value:
-                    console.print(f"[red]You don't meet the requirements for this choice![/red]")
-                    return False
-        
-        # Apply stat changes
-        if 'stat_changes' in choice:
-            for stat, change in choice['stat_changes'].items():
-                self.player['stats'][stat] += change
+        if not meets_requirements(self.player['stats'], choice):
+            console.print(f"[red]You don't meet the requirements for this choice![/red]")
+            return False
         
-        # Apply attributes
-        if 'attributes_gained' in choice:
-            self.player['attributes'].extend(choice['attributes_gained'])
+        # Apply stat changes and attributes
+        apply_choice_effects(self.player['stats'], self.player['attributes'], choice)
         
         # Move to next situation
         if 'next_situation_id' in choice:
@@ -113,6 +120,494 @@ class GameState:
         
         return False
 
+class StoryGraph:
+    """Read-only, index-based view of a save's situations, used for simulation.
+
+    Situations and stats are addressed by integer index so a playthrough only
+    needs a situation index, a list of stat values and a set of attribute ids.
+    """
+    def __init__(self, data: Dict):
+        self.stat_names: List[str] = list(data['player_state']['stats'])
+        self.start_stats: List[int] = list(data['player_state']['stats'].values())
+        self.start_attributes: List[str] = [attr['id'] for attr in data['player_state'].get('attributes') or []]
+        self.attribute_descriptions: Dict[str, str] = {
+            attr['id']: attr.get('description', '') for attr in data['player_state'].get('attributes') or []
+        }
+        self.situation_ids: List[str] = []
+        self.situation_index: Dict[str, int] = {}
+        self.situations: List[Dict] = []
+        self.roots: List[int] = []
+        for arc in data['arcs']:
+            for situation_id, situation in arc['situations'].items():
+                if situation_id not in self.situation_index:
+                    self.situation_index[situation_id] = len(self.situation_ids)
+                    self.situation_ids.append(situation_id)
+                    self.situations.append(situation)
+            if arc['situations']:
+                self.roots.append(self.situation_index[next(iter(arc['situations']))])
+
+        # Per situation: (choice_id, requirements, stat_changes, attribute_ids, next_index or -1)
+        self.choices: List[List[tuple]] = [[] for _ in self.situation_ids]
+        for arc in data['arcs']:
+            for situation_id, situation in arc['situations'].items():
+                compiled = self.choices[self.situation_index[situation_id]]
+                if compiled:
+                    continue
+                for choice in situation['choices']:
+                    for attr in choice.get('attributes_gained') or []:
+                        self.attribute_descriptions.setdefault(attr['id'], attr.get('description', ''))
+                    compiled.append((
+                        choice.get('id', ''),
+                        tuple((self._stat(k), v) for k, v in (choice.get('requirements') or {}).items()),
+                        tuple((self._stat(k), v) for k, v in (choice.get('stat_changes') or {}).items()),
+                        tuple(sys.intern(attr['id']) for attr in choice.get('attributes_gained') or []),
+                        self.situation_index.get(choice.get('next_situation_id'), -1),
+                    ))
+
+    def _stat(self, name: str) -> int:
+        """Get the index of a stat, registering unknown stats with a value of 0."""
+        if name not in self.stat_names:
+            self.stat_names.append(name)
+            self.start_stats.append(0)
+        return self.stat_names.index(name)
+
+    def stats_vector(self, stats: Dict[str, int]) -> List[int]:
+        """Convert a stat dict into a vector aligned with stat_names."""
+        return [stats.get(name, 0) for name in self.stat_names]
+
+    @classmethod
+    def load(cls, save_file: str) -> 'StoryGraph':
+        with open(save_file, 'r') as f:
+            return cls(json.load(f))
+
+def simulate_playthrough(graph: StoryGraph, root: int, stats: List[int], policy: str, rng: random.Random, max_steps: int):
+    """Run one playthrough, mirroring GameState.make_choice.
+
+    Returns:
+        (visited situation indices, taken (situation, choice) pairs, final stats,
+        gained attribute ids, ending kind)
+    """
+    stats = list(stats)
+    attributes = set()
+    visited = [root]
+    taken = []
+    current = root
+    for _ in range(max_steps):
+        choices = graph.choices[current]
+        if not choices:
+            return visited, taken, stats, attributes, "ending"
+        available = [
+            i for i, (_, requirements, _, _, _) in enumerate(choices)
+            if all(stats[stat] >= value for stat, value in requirements)
+        ]
+        if not available:
+            return visited, taken, stats, attributes, "stuck"
+        if policy == "greedy":
+            best = max(sum(change for _, change in choices[i][2]) for i in available)
+            available = [i for i in available if sum(change for _, change in choices[i][2]) == best]
+        index = rng.choice(available)
+        _, _, stat_changes, attribute_ids, next_index = choices[index]
+        for stat, change in stat_changes:
+            stats[stat] += change
+        attributes.update(attribute_ids)
+        taken.append((current, index))
+        if next_index < 0:
+            return visited, taken, stats, attributes, "dangling"
+        current = next_index
+        visited.append(current)
+    return visited, taken, stats, attributes, "max_steps"
+
+_worker_graph: Optional[StoryGraph] = None
+
+def _init_simulation_worker(save_file: str):
+    """Load the story graph once per worker process."""
+    global _worker_graph
+    _worker_graph = StoryGraph.load(save_file)
+
+def _simulate_batch(args) -> Dict:
+    """Simulate a batch of playthroughs and return aggregated counts."""
+    profile_name, stats, roots, runs, policy, max_steps, seed = args
+    graph = _worker_graph
+    rng = random.Random(seed)
+    reach = Counter()
+    taken_choices = Counter()
+    endings = Counter()
+    ending_attributes = Counter()
+    ending_stats: List[List[int]] = []
+    for run in range(runs):
+        root = roots[run % len(roots)]
+        visited, taken, final_stats, attributes, ending = simulate_playthrough(graph, root, stats, policy, rng, max_steps)
+        reach.update(set(visited))
+        taken_choices.update(taken)
+        endings[ending] += 1
+        ending_attributes.update(attributes)
+        ending_stats.append(final_stats)
+    return {
+        "profile": profile_name, "runs": runs, "reach": reach, "taken": taken_choices,
+        "endings": endings, "attributes": ending_attributes, "ending_stats": ending_stats,
+    }
+
+def _percentile(values: List[int], fraction: float) -> int:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+@app.command()
+def simulate(
+    save_file: str = typer.Argument(..., help="Path to the save file"),
+    runs: int = typer.Option(1000, help="Playthroughs per stat profile"),
+    policy: str = typer.Option("random", help="Choice policy: random or greedy"),
+    profiles_file: Optional[str] = typer.Option(None, "--profiles", help="JSON file mapping profile name -> starting stats"),
+    max_steps: int = typer.Option(200, help="Maximum choices per playthrough"),
+    workers: int = typer.Option(0, help="Worker processes (0 = one per core)"),
+    seed: int = typer.Option(0, help="Random seed"),
+    output: Optional[str] = typer.Option(None, help="Write the full report as JSON"),
+):
+    """Run randomized playthroughs headlessly and report balance statistics"""
+    if not Path(save_file).exists():
+        console.print(f"[red]Error: Save file {save_file} not found![/red]")
+        return
+    if policy not in ("random", "greedy"):
+        console.print(f"[red]Error: Unknown policy {policy}![/red]")
+        return
+    if runs < 1:
+        console.print("[red]Error: --runs must be at least 1![/red]")
+        return
+
+    graph = StoryGraph.load(save_file)
+    if not graph.roots:
+        console.print("[red]Error: Save file has no situations![/red]")
+        return
+    profiles = {"save": dict(zip(graph.stat_names, graph.start_stats))}
+    if profiles_file:
+        with open(profiles_file, 'r') as f:
+            profiles = json.load(f)
+        if not isinstance(profiles, dict) or not profiles or not all(isinstance(stats, dict) for stats in profiles.values()):
+            console.print(f"[red]Error: {profiles_file} must map at least one profile name to its starting stats![/red]")
+            return
+
+    workers = workers or os.cpu_count() or 1
+    batch_size = max(1, runs // (workers * 4))
+    batches = []
+    for profile_name, profile_stats in profiles.items():
+        stats = graph.stats_vector(profile_stats)
+        for start in range(0, runs, batch_size):
+            batch_runs = min(batch_size, runs - start)
+            batches.append((profile_name, stats, graph.roots, batch_runs, policy, max_steps, seed * 1_000_003 + len(batches)))
+
+    started = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_init_simulation_worker, initargs=(save_file,)) as pool:
+        results = pool.map(_simulate_batch, batches)
+    elapsed = time.perf_counter() - started
+
+    total_runs = sum(result["runs"] for result in results)
+    reach = Counter()
+    taken = Counter()
+    for result in results:
+        reach.update(result["reach"])
+        taken.update(result["taken"])
+    console.print(f"[bold]Simulated {total_runs} playthroughs ({policy} policy) in {elapsed:.2f}s on {workers} workers[/bold]")
+
+    table = Table(title="Situation reach frequency")
+    table.add_column("Situation", style="cyan")
+    table.add_column("Reached", style="green")
+    for index in sorted(range(len(graph.situation_ids)), key=lambda i: reach[i]):
+        table.add_row(graph.situation_ids[index], f"{reach[index] / total_runs:.1%}")
+    console.print(table)
+
+    report = {"runs": total_runs, "policy": policy, "profiles": {}, "reach": {}, "never_taken_choices": []}
+    for index, situation_id in enumerate(graph.situation_ids):
+        report["reach"][situation_id] = reach[index] / total_runs
+    for profile_name in profiles:
+        profile_results = [result for result in results if result["profile"] == profile_name]
+        endings = sum((result["endings"] for result in profile_results), Counter())
+        attributes = sum((result["attributes"] for result in profile_results), Counter())
+        ending_stats = [stats for result in profile_results for stats in result["ending_stats"]]
+        if not ending_stats:
+            console.print(f"[yellow]No playthroughs ended for profile {profile_name}[/yellow]")
+            report["profiles"][profile_name] = {"endings": dict(endings), "ending_stats": {}, "ending_attributes": {}}
+            continue
+        table = Table(title=f"Stats at endings: {profile_name} ({dict(endings)})")
+        for column in ("Stat", "Min", "P50", "Mean", "Max"):
+            table.add_column(column, style="cyan" if column == "Stat" else "green")
+        distribution = {}
+        for stat_index, stat in enumerate(graph.stat_names):
+            values = [stats[stat_index] for stats in ending_stats]
+            distribution[stat] = {
+                "min": min(values), "p50": _percentile(values, 0.5),
+                "mean": sum(values) / len(values), "max": max(values),
+            }
+            table.add_row(stat, str(distribution[stat]["min"]), str(distribution[stat]["p50"]),
+                          f"{distribution[stat]['mean']:.2f}", str(distribution[stat]["max"]))
+        console.print(table)
+        report["profiles"][profile_name] = {
+            "endings": dict(endings),
+            "ending_stats": distribution,
+            "ending_attributes": dict(attributes.most_common()),
+        }
+
+    for situation_index, choices in enumerate(graph.choices):
+        for choice_index, choice in enumerate(choices):
+            if (situation_index, choice_index) not in taken:
+                report["never_taken_choices"].append({
+                    "situation_id": graph.situation_ids[situation_index],
+                    "choice_id": choice[0],
+                    "situation_reached": reach[situation_index] > 0,
+                })
+    console.print(f"[yellow]{len(report['never_taken_choices'])} choices were never taken[/yellow]")
+    for entry in report["never_taken_choices"]:
+        if entry["situation_reached"]:
+            console.print(f"- {entry['situation_id']}: {entry['choice_id']}")
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2)
+        console.print(f"Report written to {output}")
+
+# Sessions keep stats in a C int array
+STAT_MIN, STAT_MAX = -2**31, 2**31 - 1
+
+def clamp_stat(value: int) -> int:
+    return min(max(value, STAT_MIN), STAT_MAX)
+
+class Session:
+    """Per-player state for the game server; everything else lives in the shared StoryGraph."""
+    __slots__ = ("situation", "stats", "attributes")
+
+    def __init__(self, situation: int, stats: List[int], attributes):
+        self.situation = situation  # Index into StoryGraph.situation_ids, -1 once the story has ended
+        self.stats = array('i', stats)
+        self.attributes = set(attributes)
+
+    def to_snapshot(self, graph: StoryGraph) -> List:
+        situation_id = graph.situation_ids[self.situation] if self.situation >= 0 else None
+        return [situation_id, dict(zip(graph.stat_names, self.stats)), sorted(self.attributes)]
+
+    @classmethod
+    def from_snapshot(cls, graph: StoryGraph, snapshot: List) -> 'Session':
+        situation_id, stats, attributes = snapshot
+        return cls(
+            graph.situation_index.get(situation_id, -1),
+            [clamp_stat(value) for value in graph.stats_vector(stats)],
+            (sys.intern(attr) for attr in attributes),
+        )
+
+    def nbytes(self) -> int:
+        """Approximate memory held by this session."""
+        return (sys.getsizeof(self) + sys.getsizeof(self.stats) + sys.getsizeof(self.attributes))
+
+class GameServer:
+    """Serves many concurrent play sessions over a single read-only StoryGraph."""
+    # Request bodies are small JSON objects; anything larger is refused unread
+    max_body_bytes = 64 * 1024
+
+    def __init__(self, graph: StoryGraph, snapshot_file: Optional[str] = None):
+        self.graph = graph
+        self.snapshot_file = snapshot_file
+        self.sessions: Dict[str, Session] = {}
+        if snapshot_file and Path(snapshot_file).exists():
+            with open(snapshot_file, 'r') as f:
+                snapshot = json.load(f)
+            self.sessions = {
+                session_id: Session.from_snapshot(graph, state)
+                for session_id, state in snapshot['sessions'].items()
+            }
+            console.print(f"Restored {len(self.sessions)} sessions from {snapshot_file}")
+
+    def snapshot(self):
+        """Atomically write every session's state to the snapshot file."""
+        if not self.snapshot_file:
+            return
+        data = {"sessions": {
+            session_id: session.to_snapshot(self.graph) for session_id, session in self.sessions.items()
+        }}
+        temp_file = f"{self.snapshot_file}.tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(data, f)
+        os.replace(temp_file, self.snapshot_file)
+
+    def view(self, session_id: str, session: Session) -> Dict:
+        """Render a session's current situation and choices for the client."""
+        graph = self.graph
+        result = {
+            "session_id": session_id,
+            "stats": dict(zip(graph.stat_names, session.stats)),
+            "attributes": {attr: graph.attribute_descriptions.get(attr, '') for attr in sorted(session.attributes)},
+            "ended": session.situation < 0,
+        }
+        if session.situation < 0:
+            return result
+        situation = graph.situations[session.situation]
+        result["situation"] = {
+            "id": graph.situation_ids[session.situation],
+            "title": situation.get('title', ''),
+            "description": situation.get('description', ''),
+        }
+        result["choices"] = [{
+            "index": i,
+            "text": choice.get('text', ''),
+            "requirements": choice.get('requirements') or {},
+            "available": all(session.stats[stat] >= value for stat, value in graph.choices[session.situation][i - 1][1]),
+        } for i, choice in enumerate(situation['choices'], 1)]
+        return result
+
+    def create_session(self, body: Dict) -> Tuple[int, Dict]:
+        graph = self.graph
+        if 'stats' in body:
+            stats = body['stats']
+            if not isinstance(stats, dict):
+                return 400, {"error": "stats must be an object"}
+            for name, value in stats.items():
+                if type(value) is not int or not STAT_MIN <= value <= STAT_MAX:
+                    return 400, {"error": f"Stat {name} must be an integer from {STAT_MIN} to {STAT_MAX}"}
+            stats = graph.stats_vector(stats)
+        else:
+            stats = list(graph.start_stats)
+        arc = body.get('arc', 0)
+        if not 0 <= arc < len(graph.roots):
+            return 400, {"error": f"Unknown arc {arc}"}
+        session_id = secrets.token_hex(8)
+        self.sessions[session_id] = Session(graph.roots[arc], stats, (sys.intern(a) for a in graph.start_attributes))
+        return 201, self.view(session_id, self.sessions[session_id])
+
+    def make_choice(self, session_id: str, session: Session, body: Dict) -> Tuple[int, Dict]:
+        """Apply a choice exactly as GameState.make_choice does."""
+        if session.situation < 0:
+            return 409, {"error": "This story has ended"}
+        choices = self.graph.choices[session.situation]
+        index = body.get('choice')
+        if not isinstance(index, int) or not 1 <= index <= len(choices):
+            return 400, {"error": "Invalid choice"}
+        _, requirements, stat_changes, attribute_ids, next_index = choices[index - 1]
+        if not all(session.stats[stat] >= value for stat, value in requirements):
+            return 403, {"error": "You don't meet the requirements for this choice"}
+        # Work out every new value before changing the session, so a choice applies whole or not at all
+        stats = list(session.stats)
+        for stat, change in stat_changes:
+            stats[stat] += change
+        session.stats = array('i', (clamp_stat(value) for value in stats))
+        session.attributes.update(attribute_ids)
+        session.situation = next_index
+        return 200, self.view(session_id, session)
+
+    def route(self, method: str, path: str, body: Dict) -> Tuple[int, Dict]:
+        parts = [part for part in path.split('?')[0].split('/') if part]
+        if parts == ['sessions'] and method == 'POST':
+            return self.create_session(body)
+        if parts == ['stats'] and method == 'GET':
+            total = sum(session.nbytes() for session in self.sessions.values())
+            return 200, {
+                "sessions": len(self.sessions),
+                "situations": len(self.graph.situation_ids),
+                "bytes_per_session": total / len(self.sessions) if self.sessions else 0,
+            }
+        if len(parts) >= 2 and parts[0] == 'sessions':
+            session = self.sessions.get(parts[1])
+            if session is None:
+                return 404, {"error": "Unknown session"}
+            if len(parts) == 2 and method == 'GET':
+                return 200, self.view(parts[1], session)
+            if len(parts) == 2 and method == 'DELETE':
+                del self.sessions[parts[1]]
+                return 200, {"deleted": parts[1]}
+            if len(parts) == 3 and parts[2] == 'choose' and method == 'POST':
+                return self.make_choice(parts[1], session, body)
+        return 404, {"error": "Not found"}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Minimal HTTP/1.1 handler with keep-alive and JSON bodies."""
+        try:
+            while True:
+                status, payload, close = await self.handle_request(reader)
+                if status is None:
+                    break
+                response = json.dumps(payload).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(response)}\r\n"
+                    f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n".encode('latin-1') + response
+                )
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, reader: asyncio.StreamReader) -> Tuple[Optional[int], Dict, bool]:
+        """Read and answer one request.
+
+        Returns:
+            (status, payload, close); status is None once the client has hung up
+        """
+        # readline raises ValueError for a line longer than the reader's limit;
+        # after a framing error the connection can't be reused
+        try:
+            request_line = await reader.readline()
+        except ValueError:
+            return 400, {"error": "Request line too long"}, True
+        if not request_line:
+            return None, {}, True
+        try:
+            method, path, _ = request_line.decode('latin-1').split(' ', 2)
+        except ValueError:
+            return 400, {"error": "Malformed request line"}, True
+        headers = {}
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                return 431, {"error": "Header line too long"}, True
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        close = headers.get('connection', '').lower() == 'close'
+        content_length = headers.get('content-length', '0')
+        if not content_length.isdigit():
+            return 400, {"error": f"Bad Content-Length: {content_length!r}"}, True
+        if int(content_length) > self.max_body_bytes:
+            return 413, {"error": f"Body over {self.max_body_bytes} bytes"}, True
+        raw_body = await reader.readexactly(int(content_length))
+        try:
+            body = json.loads(raw_body) if raw_body else {}
+            if not isinstance(body, dict):
+                raise TypeError("body must be a JSON object")
+            status, payload = self.route(method, path, body)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            status, payload = 400, {"error": f"Bad request: {e}"}
+        return status, payload, close
+
+    async def serve(self, host: str, port: int, snapshot_interval: float):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        console.print(f"[bold]Serving {len(self.graph.situation_ids)} situations on http://{host}:{port}[/bold]")
+        try:
+            async with server:
+                while True:
+                    await asyncio.sleep(snapshot_interval)
+                    self.snapshot()
+        finally:
+            self.snapshot()
+
+@app.command()
+def serve(
+    save_file: str = typer.Argument(..., help="Path to the save file"),
+    host: str = typer.Option("127.0.0.1", help="Host to bind"),
+    port: int = typer.Option(8765, help="Port to bind"),
+    snapshot_file: Optional[str] = typer.Option(None, "--snapshot", help="File to persist session state to"),
+    snapshot_interval: float = typer.Option(30.0, help="Seconds between session snapshots"),
+):
+    """Serve many concurrent play sessions over HTTP from one shared story graph"""
+    if not Path(save_file).exists():
+        console.print(f"[red]Error: Save file {save_file} not found![/red]")
+        return
+    server = GameServer(StoryGraph.load(save_file), snapshot_file)
+    try:
+        asyncio.run(server.serve(host, port, snapshot_interval))
+    except KeyboardInterrupt:
+        console.print(f"Stopped; {len(server.sessions)} sessions saved")
+
 @app.command()
 def play(save_file: str = typer.Argument(..., help="Path to the save file")):
     """Play through the game situations"""
@@ -13,7 +13,7 @@ function findSaveFolders(dir: string): Array<{ name: string; path: string }> {
     
     if (stat.isDirectory()) {
       // Check if the folder contains any JSON files
-      const hasJsonFiles = fs.readdirSync(fullPath).some(file => file.endsWith('.json'));
+      const hasJsonFiles = fs.readdirSync(fullPath).some(file => file.endsWith('.json') && !file.endsWith('.layout.json'));
       if (hasJsonFiles) {
         folders.push({
           name: item,
@@ -37,7 +37,8 @@ function findJsonFilesInFolder(dir: string, folderName: string): Array<{ name: s
   const items = fs.readdirSync(folderPath);
   
   for (const item of items) {
-    if (item.endsWith('.json')) {
+    // Precomputed graph layouts live next to the saves; they aren't saves themselves
+    if (item.endsWith('.json') && !item.endsWith('.layout.json')) {
       files.push({
         name: item,
         path: `${folderName}/${item}`
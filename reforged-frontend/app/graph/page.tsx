@@ -1,6 +1,6 @@
 'use client';
 
-import { useEffect, useState } from 'react';
+import { useCallback, useEffect, useState } from 'react';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Choice, Situation, Arc } from '@/baml_client/types';
@@ -65,34 +65,8 @@ export default function GraphPage() {
       .catch(err => console.error('Error fetching save files:', err));
   }, [selectedFolder]);
 
-  useEffect(() => {
-    if (!selectedFile) {
-      console.log('No file selected, returning early');
-      return;
-    }
-
-    console.log('Fetching data for file:', selectedFile);
-
-    // Fetch the selected save file data
-    fetch(`/api/saves/${encodeURIComponent(selectedFile)}`)
-      .then(res => {
-        console.log('Response status:', res.status);
-        if (!res.ok) {
-          throw new Error(`HTTP error! status: ${res.status}`);
-        }
-        return res.json();
-      })
-      .then((data) => {
-        console.log('Successfully fetched data:', data);
-        processDataIntoGraph(data);
-      })
-      .catch(err => {
-        console.error('Error fetching save file data:', err);
-      });
-  }, [selectedFile]);
-
   // eslint-disable-next-line @typescript-eslint/no-explicit-any
-  const processDataIntoGraph = (data: any) => {
+  const processDataIntoGraph = useCallback((data: any) => {
     const arcSituationsFlattened = data.arcs.map((arc: Arc) => Object.values(arc.situations)).flat() as Situation[];
     const nodes: GraphData['nodes'] = [];
     const edges: GraphData['edges'] = [];
@@ -115,7 +89,52 @@ export default function GraphPage() {
     console.log(nodes);
     console.log(edges);
     setGraphData({ nodes, edges });
-  };
+  }, []);
+
+  const fetchSaveAndProcess = useCallback(() => {
+    // Fetch the selected save file data
+    fetch(`/api/saves/${encodeURIComponent(selectedFile)}`)
+      .then(res => {
+        console.log('Response status:', res.status);
+        if (!res.ok) {
+          throw new Error(`HTTP error! status: ${res.status}`);
+        }
+        return res.json();
+      })
+      .then((data) => {
+        console.log('Successfully fetched data:', data);
+        processDataIntoGraph(data);
+      })
+      .catch(err => {
+        console.error('Error fetching save file data:', err);
+      });
+  }, [selectedFile, processDataIntoGraph]);
+
+  useEffect(() => {
+    if (!selectedFile) {
+      console.log('No file selected, returning early');
+      return;
+    }
+
+    console.log('Fetching data for file:', selectedFile);
+
+    // Prefer the layout precomputed by the backend next to the save
+    const layoutFile = selectedFile.replace(/\.json$/, '.layout.json');
+    fetch(`/api/saves/${encodeURIComponent(layoutFile)}`)
+      .then(res => {
+        if (!res.ok) {
+          throw new Error(`No precomputed layout, status: ${res.status}`);
+        }
+        return res.json();
+      })
+      .then((layout: GraphData) => {
+        setGraphData({ nodes: layout.nodes, edges: layout.edges });
+      })
+      .catch(err => {
+        console.log('Falling back to client-side layout:', err.message);
+        fetchSaveAndProcess();
+      });
+  }, [selectedFile, fetchSaveAndProcess]);
 
   return (
     <div className="container mx-auto p-4">
@@ -160,7 +179,7 @@ export default function GraphPage() {
       <Card>
         {graphData.nodes.length > 0 ? (
           <CardContent className="h-[2000px] w-[2000px]">
-            <ReactFlow defaultNodes={graphData.nodes} defaultEdges={graphData.edges} />
+            <ReactFlow key={`${selectedFile}:${graphData.nodes.length}`} defaultNodes={graphData.nodes} defaultEdges={graphData.edges} />
           </CardContent>
         ) : (
           <CardContent>
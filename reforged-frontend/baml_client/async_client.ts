@@ -20,7 +20,7 @@ import { toBamlError, BamlStream, type HTTPRequest } from "@boundaryml/baml"
 import type { Checked, Check, RecursivePartialNull as MovedRecursivePartialNull } from "./types"
 import type { partial_types } from "./partial_types"
 import type * as types from "./types"
-import type {ActionAndReasoning, Arc, ArcOutcome, ArcSeed, Choice, CreateArc, CreateArcOutcome, CreateChoices, CreateFaction, CreateMultipleSituations, CreateNPC, CreateSituation, CreateTechnology, District, DownOneLevel, Event, Faction, FindMissingSituations, GetSituationById, GoToArcRoot, GoToSituation, GoToWorldRoot, IdentifyNarrativeGaps, Item, JoinSituationOutput, Location, NPC, PlayerAttribute, PlayerProfile, PlayerState, PlayerStats, Quest, Resume, ShortActionAndReasoning, Situation, StatDescriptors, StatRequirement, Technology, UpOneLevel, WorldContext, WorldSeed} from "./types"
+import type {ActionAndReasoning, Arc, ArcOutcome, ArcSeed, BridgePair, Choice, CreateArc, CreateArcOutcome, CreateChoices, CreateFaction, CreateMultipleSituations, CreateNPC, CreateSituation, CreateTechnology, District, DownOneLevel, Event, Faction, FindMissingSituations, GetSituationById, GoToArcRoot, GoToSituation, GoToWorldRoot, IdentifyNarrativeGaps, Item, JoinSituationOutput, Location, NPC, PlayerAttribute, PlayerProfile, PlayerState, PlayerStats, Quest, Resume, ShortActionAndReasoning, Situation, SituationChoices, StatDescriptors, StatRequirement, Technology, UpOneLevel, WorldContext, WorldSeed} from "./types"
 import type TypeBuilder from "./type_builder"
 import { AsyncHttpRequest, AsyncHttpStreamRequest } from "./async_request"
 import { LlmResponseParser, LlmStreamParser } from "./parser"
@@ -109,6 +109,31 @@ export class BamlAsyncClient {
     }
   }
   
+  async AugmentSituationsChoices(
+      world_context: WorldContext,player_state: PlayerState,arc: Arc,situations: Situation[],
+      __baml_options__?: BamlCallOptions
+  ): Promise<SituationChoices[]> {
+    try {
+      const options = { ...this.bamlOptions, ...(__baml_options__ || {}) }
+      const collector = options.collector ? (Array.isArray(options.collector) ? options.collector : [options.collector]) : [];
+      const env = options.env ? { ...process.env, ...options.env } : { ...process.env };
+      const raw = await this.runtime.callFunction(
+        "AugmentSituationsChoices",
+        {
+          "world_context": world_context,"player_state": player_state,"arc": arc,"situations": situations
+        },
+        this.ctxManager.cloneContext(),
+        options.tb?.__tb(),
+        options.clientRegistry,
+        collector,
+        env,
+      )
+      return raw.parsed(false) as SituationChoices[]
+    } catch (error) {
+      throw toBamlError(error);
+    }
+  }
+  
   async CheckChoiceAttributeNeeds(
       choice: Choice,world_context: WorldContext,
       __baml_options__?: BamlCallOptions
@@ -460,7 +485,7 @@ export class BamlAsyncClient {
   }
   
   async GenerateJoinChoices(
-      world_context: WorldContext,arcs: Arc[],
+      world_context: WorldContext,arcs: Arc[],pairs: BridgePair[],
       __baml_options__?: BamlCallOptions
   ): Promise<JoinSituationOutput[]> {
     try {
@@ -470,7 +495,7 @@ export class BamlAsyncClient {
       const raw = await this.runtime.callFunction(
         "GenerateJoinChoices",
         {
-          "world_context": world_context,"arcs": arcs
+          "world_context": world_context,"arcs": arcs,"pairs": pairs
         },
         this.ctxManager.cloneContext(),
         options.tb?.__tb(),
@@ -879,6 +904,37 @@ class BamlStreamClient {
     }
   }
   
+  AugmentSituationsChoices(
+      world_context: WorldContext,player_state: PlayerState,arc: Arc,situations: Situation[],
+      __baml_options__?: { tb?: TypeBuilder, clientRegistry?: ClientRegistry, collector?: Collector | Collector[], env?: Record<string, string | undefined> }
+  ): BamlStream<(partial_types.SituationChoices | null)[], SituationChoices[]> {
+    try {
+      const options = { ...this.bamlOptions, ...(__baml_options__ || {}) }
+      const collector = options.collector ? (Array.isArray(options.collector) ? options.collector : [options.collector]) : [];
+      const env = options.env ? { ...process.env, ...options.env } : { ...process.env };
+      const raw = this.runtime.streamFunction(
+        "AugmentSituationsChoices",
+        {
+          "world_context": world_context,"player_state": player_state,"arc": arc,"situations": situations
+        },
+        undefined,
+        this.ctxManager.cloneContext(),
+        options.tb?.__tb(),
+        options.clientRegistry,
+        collector,
+        env,
+      )
+      return new BamlStream<(partial_types.SituationChoices | null)[], SituationChoices[]>(
+        raw,
+        (a): (partial_types.SituationChoices | null)[] => a,
+        (a): SituationChoices[] => a,
+        this.ctxManager.cloneContext(),
+      )
+    } catch (error) {
+      throw toBamlError(error);
+    }
+  }
+  
   CheckChoiceAttributeNeeds(
       choice: Choice,world_context: WorldContext,
       __baml_options__?: { tb?: TypeBuilder, clientRegistry?: ClientRegistry, collector?: Collector | Collector[], env?: Record<string, string | undefined> }
@@ -1314,7 +1370,7 @@ class BamlStreamClient {
   }
   
   GenerateJoinChoices(
-      world_context: WorldContext,arcs: Arc[],
+      world_context: WorldContext,arcs: Arc[],pairs: BridgePair[],
       __baml_options__?: { tb?: TypeBuilder, clientRegistry?: ClientRegistry, collector?: Collector | Collector[], env?: Record<string, string | undefined> }
   ): BamlStream<(partial_types.JoinSituationOutput | null)[], JoinSituationOutput[]> {
     try {
@@ -1324,7 +1380,7 @@ class BamlStreamClient {
       const raw = this.runtime.streamFunction(
         "GenerateJoinChoices",
         {
-          "world_context": world_context,"arcs": arcs
+          "world_context": world_context,"arcs": arcs,"pairs": pairs
         },
         undefined,
         this.ctxManager.cloneContext(),
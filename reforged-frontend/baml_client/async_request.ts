@@ -19,7 +19,7 @@ import type { BamlRuntime, BamlCtxManager, ClientRegistry, Image, Audio } from "
 import { toBamlError, HTTPRequest } from "@boundaryml/baml"
 import type { Checked, Check } from "./types"
 import type * as types from "./types"
-import type {ActionAndReasoning, Arc, ArcOutcome, ArcSeed, Choice, CreateArc, CreateArcOutcome, CreateChoices, CreateFaction, CreateMultipleSituations, CreateNPC, CreateSituation, CreateTechnology, District, DownOneLevel, Event, Faction, FindMissingSituations, GetSituationById, GoToArcRoot, GoToSituation, GoToWorldRoot, IdentifyNarrativeGaps, Item, JoinSituationOutput, Location, NPC, PlayerAttribute, PlayerProfile, PlayerState, PlayerStats, Quest, Resume, ShortActionAndReasoning, Situation, StatDescriptors, StatRequirement, Technology, UpOneLevel, WorldContext, WorldSeed} from "./types"
+import type {ActionAndReasoning, Arc, ArcOutcome, ArcSeed, BridgePair, Choice, CreateArc, CreateArcOutcome, CreateChoices, CreateFaction, CreateMultipleSituations, CreateNPC, CreateSituation, CreateTechnology, District, DownOneLevel, Event, Faction, FindMissingSituations, GetSituationById, GoToArcRoot, GoToSituation, GoToWorldRoot, IdentifyNarrativeGaps, Item, JoinSituationOutput, Location, NPC, PlayerAttribute, PlayerProfile, PlayerState, PlayerStats, Quest, Resume, ShortActionAndReasoning, Situation, SituationChoices, StatDescriptors, StatRequirement, Technology, UpOneLevel, WorldContext, WorldSeed} from "./types"
 import type TypeBuilder from "./type_builder"
 
 type BamlCallOptions = {
@@ -54,6 +54,28 @@ export class AsyncHttpRequest {
     }
   }
   
+  async AugmentSituationsChoices(
+      world_context: WorldContext,player_state: PlayerState,arc: Arc,situations: Situation[],
+      __baml_options__?: BamlCallOptions
+  ): Promise<HTTPRequest> {
+    try {
+      const env = __baml_options__?.env ? { ...process.env, ...__baml_options__.env } : { ...process.env };
+      return await this.runtime.buildRequest(
+        "AugmentSituationsChoices",
+        {
+          "world_context": world_context,"player_state": player_state,"arc": arc,"situations": situations
+        },
+        this.ctxManager.cloneContext(),
+        __baml_options__?.tb?.__tb(),
+        __baml_options__?.clientRegistry,
+        false,
+        env
+      )
+    } catch (error) {
+      throw toBamlError(error);
+    }
+  }
+  
   async CheckChoiceAttributeNeeds(
       choice: Choice,world_context: WorldContext,
       __baml_options__?: BamlCallOptions
@@ -363,7 +385,7 @@ export class AsyncHttpRequest {
   }
   
   async GenerateJoinChoices(
-      world_context: WorldContext,arcs: Arc[],
+      world_context: WorldContext,arcs: Arc[],pairs: BridgePair[],
       __baml_options__?: BamlCallOptions
   ): Promise<HTTPRequest> {
     try {
@@ -371,7 +393,7 @@ export class AsyncHttpRequest {
       return await this.runtime.buildRequest(
         "GenerateJoinChoices",
         {
-          "world_context": world_context,"arcs": arcs
+          "world_context": world_context,"arcs": arcs,"pairs": pairs
         },
         this.ctxManager.cloneContext(),
         __baml_options__?.tb?.__tb(),
@@ -720,6 +742,28 @@ export class AsyncHttpStreamRequest {
     }
   }
   
+  async AugmentSituationsChoices(
+      world_context: WorldContext,player_state: PlayerState,arc: Arc,situations: Situation[],
+      __baml_options__?: BamlCallOptions
+  ): Promise<HTTPRequest> {
+    try {
+      const env = __baml_options__?.env ? { ...process.env, ...__baml_options__.env } : { ...process.env };
+      return await this.runtime.buildRequest(
+        "AugmentSituationsChoices",
+        {
+          "world_context": world_context,"player_state": player_state,"arc": arc,"situations": situations
+        },
+        this.ctxManager.cloneContext(),
+        __baml_options__?.tb?.__tb(),
+        __baml_options__?.clientRegistry,
+        true,
+        env
+      )
+    } catch (error) {
+      throw toBamlError(error);
+    }
+  }
+  
   async CheckChoiceAttributeNeeds(
       choice: Choice,world_context: WorldContext,
       __baml_options__?: BamlCallOptions
@@ -1029,7 +1073,7 @@ export class AsyncHttpStreamRequest {
   }
   
   async GenerateJoinChoices(
-      world_context: WorldContext,arcs: Arc[],
+      world_context: WorldContext,arcs: Arc[],pairs: BridgePair[],
       __baml_options__?: BamlCallOptions
   ): Promise<HTTPRequest> {
     try {
@@ -1037,7 +1081,7 @@ export class AsyncHttpStreamRequest {
       return await this.runtime.buildRequest(
         "GenerateJoinChoices",
         {
-          "world_context": world_context,"arcs": arcs
+          "world_context": world_context,"arcs": arcs,"pairs": pairs
         },
         this.ctxManager.cloneContext(),
         __baml_options__?.tb?.__tb(),
@@ -17,7 +17,7 @@ $ pnpm add @boundaryml/baml
 // biome-ignore format: autogenerated code
 import type { Image, Audio } from "@boundaryml/baml"
 import type { Checked, Check } from "./types"
-import type {  ActionAndReasoning,  Arc,  ArcOutcome,  ArcSeed,  Choice,  CreateArc,  CreateArcOutcome,  CreateChoices,  CreateFaction,  CreateMultipleSituations,  CreateNPC,  CreateSituation,  CreateTechnology,  District,  DownOneLevel,  Event,  Faction,  FindMissingSituations,  GetSituationById,  GoToArcRoot,  GoToSituation,  GoToWorldRoot,  IdentifyNarrativeGaps,  Item,  JoinSituationOutput,  Location,  NPC,  PlayerAttribute,  PlayerProfile,  PlayerState,  PlayerStats,  Quest,  Resume,  ShortActionAndReasoning,  Situation,  StatDescriptors,  StatRequirement,  Technology,  UpOneLevel,  WorldContext,  WorldSeed } from "./types"
+import type {  ActionAndReasoning,  Arc,  ArcOutcome,  ArcSeed,  BridgePair,  Choice,  CreateArc,  CreateArcOutcome,  CreateChoices,  CreateFaction,  CreateMultipleSituations,  CreateNPC,  CreateSituation,  CreateTechnology,  District,  DownOneLevel,  Event,  Faction,  FindMissingSituations,  GetSituationById,  GoToArcRoot,  GoToSituation,  GoToWorldRoot,  IdentifyNarrativeGaps,  Item,  JoinSituationOutput,  Location,  NPC,  PlayerAttribute,  PlayerProfile,  PlayerState,  PlayerStats,  Quest,  Resume,  ShortActionAndReasoning,  Situation,  SituationChoices,  StatDescriptors,  StatRequirement,  Technology,  UpOneLevel,  WorldContext,  WorldSeed } from "./types"
 import type * as types from "./types"
 
 /******************************************************************************
@@ -65,6 +65,11 @@ export namespace partial_types {
         internal_justification?: (string | null)
     }
     
+    export interface BridgePair {
+        from_situation_id?: (string | null)
+        to_situation_id?: (string | null)
+    }
+    
     export interface Choice {
         id?: (string | null)
         text?: (string | null)
@@ -327,6 +332,11 @@ export namespace partial_types {
         internal_justification?: (string | null)
     }
     
+    export interface SituationChoices {
+        situation_id?: (string | null)
+        choices?: (partial_types.Choice | null)[]
+    }
+    
     export interface StatDescriptors {
         might_descriptors?: (Record<string, (string | null)> | null)
         insight_descriptors?: (Record<string, (string | null)> | null)
@@ -367,12 +377,12 @@ export namespace partial_types {
     
     export interface WorldContext {
         seed?: (partial_types.WorldSeed | null)
+        world_root?: (partial_types.Situation | null)
+        tension_sliders?: (Record<string, (number | null)> | null)
+        districts?: (partial_types.District | null)[]
         technologies?: (partial_types.Technology | null)[]
         factions?: (partial_types.Faction | null)[]
-        districts?: (partial_types.District | null)[]
         npcs?: (partial_types.NPC | null)[]
-        tension_sliders?: (Record<string, (number | null)> | null)
-        world_root?: (partial_types.Situation | null)
     }
     
     export interface WorldSeed {
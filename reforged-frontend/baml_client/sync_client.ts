@@ -19,7 +19,7 @@ import type { BamlRuntime, FunctionResult, BamlCtxManager, Image, Audio, ClientR
 import { toBamlError, type HTTPRequest } from "@boundaryml/baml"
 import type { Checked, Check, RecursivePartialNull as MovedRecursivePartialNull } from "./types"
 import type * as types from "./types"
-import type {ActionAndReasoning, Arc, ArcOutcome, ArcSeed, Choice, CreateArc, CreateArcOutcome, CreateChoices, CreateFaction, CreateMultipleSituations, CreateNPC, CreateSituation, CreateTechnology, District, DownOneLevel, Event, Faction, FindMissingSituations, GetSituationById, GoToArcRoot, GoToSituation, GoToWorldRoot, IdentifyNarrativeGaps, Item, JoinSituationOutput, Location, NPC, PlayerAttribute, PlayerProfile, PlayerState, PlayerStats, Quest, Resume, ShortActionAndReasoning, Situation, StatDescriptors, StatRequirement, Technology, UpOneLevel, WorldContext, WorldSeed} from "./types"
+import type {ActionAndReasoning, Arc, ArcOutcome, ArcSeed, BridgePair, Choice, CreateArc, CreateArcOutcome, CreateChoices, CreateFaction, CreateMultipleSituations, CreateNPC, CreateSituation, CreateTechnology, District, DownOneLevel, Event, Faction, FindMissingSituations, GetSituationById, GoToArcRoot, GoToSituation, GoToWorldRoot, IdentifyNarrativeGaps, Item, JoinSituationOutput, Location, NPC, PlayerAttribute, PlayerProfile, PlayerState, PlayerStats, Quest, Resume, ShortActionAndReasoning, Situation, SituationChoices, StatDescriptors, StatRequirement, Technology, UpOneLevel, WorldContext, WorldSeed} from "./types"
 import type TypeBuilder from "./type_builder"
 import { HttpRequest, HttpStreamRequest } from "./sync_request"
 import { LlmResponseParser, LlmStreamParser } from "./parser"
@@ -111,6 +111,31 @@ export class BamlSyncClient {
     }
   }
   
+  AugmentSituationsChoices(
+      world_context: WorldContext,player_state: PlayerState,arc: Arc,situations: Situation[],
+      __baml_options__?: BamlCallOptions
+  ): SituationChoices[] {
+    try {
+      const options = { ...this.bamlOptions, ...(__baml_options__ || {}) }
+      const collector = options.collector ? (Array.isArray(options.collector) ? options.collector : [options.collector]) : [];
+      const env = options.env ? { ...process.env, ...options.env } : { ...process.env };
+      const raw = this.runtime.callFunctionSync(
+        "AugmentSituationsChoices",
+        {
+          "world_context": world_context,"player_state": player_state,"arc": arc,"situations": situations
+        },
+        this.ctxManager.cloneContext(),
+        options.tb?.__tb(),
+        options.clientRegistry,
+        collector,
+        env,
+      )
+      return raw.parsed(false) as SituationChoices[]
+    } catch (error: any) {
+      throw toBamlError(error);
+    }
+  }
+  
   CheckChoiceAttributeNeeds(
       choice: Choice,world_context: WorldContext,
       __baml_options__?: BamlCallOptions
@@ -462,7 +487,7 @@ export class BamlSyncClient {
   }
   
   GenerateJoinChoices(
-      world_context: WorldContext,arcs: Arc[],
+      world_context: WorldContext,arcs: Arc[],pairs: BridgePair[],
       __baml_options__?: BamlCallOptions
   ): JoinSituationOutput[] {
     try {
@@ -472,7 +497,7 @@ export class BamlSyncClient {
       const raw = this.runtime.callFunctionSync(
         "GenerateJoinChoices",
         {
-          "world_context": world_context,"arcs": arcs
+          "world_context": world_context,"arcs": arcs,"pairs": pairs
         },
         this.ctxManager.cloneContext(),
         options.tb?.__tb(),
@@ -30,6 +30,8 @@ export default class TypeBuilder {
     
     ArcSeed: ClassViewer<'ArcSeed', "title" | "core_conflict" | "theme_tags" | "tone" | "factions_involved" | "internal_hint" | "internal_justification">;
     
+    BridgePair: ClassViewer<'BridgePair', "from_situation_id" | "to_situation_id">;
+    
     Choice: ClassViewer<'Choice', "id" | "text" | "dialogue_response" | "choice_type" | "emotional_tone" | "body_language" | "requirements" | "attributes_gained" | "attributes_lost" | "stat_changes" | "next_situation_id" | "internal_hint" | "internal_justification" | "new_npcs" | "new_factions" | "new_technologies">;
     
     CreateArc: ClassViewer<'CreateArc', "tool_name" | "reason" | "generated_arc">;
@@ -92,6 +94,8 @@ export default class TypeBuilder {
     
     Situation: ClassViewer<'Situation', "id" | "description" | "player_perspective_description" | "choices" | "stat_requirements" | "bridgeable" | "context_tags" | "internal_hint" | "internal_justification">;
     
+    SituationChoices: ClassViewer<'SituationChoices', "situation_id" | "choices">;
+    
     StatDescriptors: ClassViewer<'StatDescriptors', "might_descriptors" | "insight_descriptors" | "nimbleness_descriptors" | "destiny_descriptors" | "savvy_descriptors" | "expertise_descriptors" | "tenacity_descriptors" | "station_descriptors" | "opulence_descriptors" | "celebrity_descriptors" | "integrity_descriptors" | "allure_descriptors" | "lineage_descriptors">;
     
     StatRequirement: ClassViewer<'StatRequirement', "attribute_name" | "min_value">;
@@ -100,7 +104,7 @@ export default class TypeBuilder {
     
     UpOneLevel: ClassViewer<'UpOneLevel', "tool_name" | "reason">;
     
-    WorldContext: ClassViewer<'WorldContext', "seed" | "technologies" | "factions" | "districts" | "npcs" | "tension_sliders" | "world_root">;
+    WorldContext: ClassViewer<'WorldContext', "seed" | "world_root" | "tension_sliders" | "districts" | "technologies" | "factions" | "npcs">;
     
     WorldSeed: ClassViewer<'WorldSeed', "name" | "themes" | "high_concept" | "internal_hint" | "internal_justification">;
     
@@ -109,7 +113,7 @@ export default class TypeBuilder {
     constructor() {
         this.tb = new _TypeBuilder({
           classes: new Set([
-            "ActionAndReasoning","Arc","ArcOutcome","ArcSeed","Choice","CreateArc","CreateArcOutcome","CreateChoices","CreateFaction","CreateMultipleSituations","CreateNPC","CreateSituation","CreateTechnology","District","DownOneLevel","Event","Faction","FindMissingSituations","GetSituationById","GoToArcRoot","GoToSituation","GoToWorldRoot","IdentifyNarrativeGaps","Item","JoinSituationOutput","Location","NPC","PlayerAttribute","PlayerProfile","PlayerState","PlayerStats","Quest","Resume","ShortActionAndReasoning","Situation","StatDescriptors","StatRequirement","Technology","UpOneLevel","WorldContext","WorldSeed",
+            "ActionAndReasoning","Arc","ArcOutcome","ArcSeed","BridgePair","Choice","CreateArc","CreateArcOutcome","CreateChoices","CreateFaction","CreateMultipleSituations","CreateNPC","CreateSituation","CreateTechnology","District","DownOneLevel","Event","Faction","FindMissingSituations","GetSituationById","GoToArcRoot","GoToSituation","GoToWorldRoot","IdentifyNarrativeGaps","Item","JoinSituationOutput","Location","NPC","PlayerAttribute","PlayerProfile","PlayerState","PlayerStats","Quest","Resume","ShortActionAndReasoning","Situation","SituationChoices","StatDescriptors","StatRequirement","Technology","UpOneLevel","WorldContext","WorldSeed",
           ]),
           enums: new Set([
             
@@ -133,6 +137,10 @@ export default class TypeBuilder {
           "title","core_conflict","theme_tags","tone","factions_involved","internal_hint","internal_justification",
         ]);
         
+        this.BridgePair = this.tb.classViewer("BridgePair", [
+          "from_situation_id","to_situation_id",
+        ]);
+        
         this.Choice = this.tb.classViewer("Choice", [
           "id","text","dialogue_response","choice_type","emotional_tone","body_language","requirements","attributes_gained","attributes_lost","stat_changes","next_situation_id","internal_hint","internal_justification","new_npcs","new_factions","new_technologies",
         ]);
@@ -257,6 +265,10 @@ export default class TypeBuilder {
           "id","description","player_perspective_description","choices","stat_requirements","bridgeable","context_tags","internal_hint","internal_justification",
         ]);
         
+        this.SituationChoices = this.tb.classViewer("SituationChoices", [
+          "situation_id","choices",
+        ]);
+        
         this.StatDescriptors = this.tb.classViewer("StatDescriptors", [
           "might_descriptors","insight_descriptors","nimbleness_descriptors","destiny_descriptors","savvy_descriptors","expertise_descriptors","tenacity_descriptors","station_descriptors","opulence_descriptors","celebrity_descriptors","integrity_descriptors","allure_descriptors","lineage_descriptors",
         ]);
@@ -274,7 +286,7 @@ export default class TypeBuilder {
         ]);
         
         this.WorldContext = this.tb.classViewer("WorldContext", [
-          "seed","technologies","factions","districts","npcs","tension_sliders","world_root",
+          "seed","world_root","tension_sliders","districts","technologies","factions","npcs",
         ]);
         
         this.WorldSeed = this.tb.classViewer("WorldSeed", [
@@ -81,6 +81,12 @@ export interface ArcSeed {
   
 }
 
+export interface BridgePair {
+  from_situation_id: string
+  to_situation_id: string
+  
+}
+
 export interface Choice {
   id: string
   text: string
@@ -374,6 +380,12 @@ export interface Situation {
   
 }
 
+export interface SituationChoices {
+  situation_id: string
+  choices: Choice[]
+  
+}
+
 export interface StatDescriptors {
   might_descriptors: Record<string, string>
   insight_descriptors: Record<string, string>
@@ -418,12 +430,12 @@ export interface UpOneLevel {
 
 export interface WorldContext {
   seed: WorldSeed
+  world_root: Situation
+  tension_sliders: Record<string, number>
+  districts: District[]
   technologies: Technology[]
   factions: Faction[]
-  districts: District[]
   npcs: NPC[]
-  tension_sliders: Record<string, number>
-  world_root: Situation
   
 }
 
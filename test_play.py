@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for the play.py game server.
+
+Starts a GameServer on a local port over a small hand-built story and drives it
+with raw HTTP requests, well-formed and malformed.
+
+Run with pytest.
+"""
+import asyncio
+import json
+
+from play import GameServer, StoryGraph, STAT_MAX
+
+STORY = {
+    "player_state": {"stats": {"might": 1, "wits": 2}, "attributes": []},
+    "arcs": [{"situations": {
+        "gate": {"title": "Gate", "description": "A locked gate.", "choices": [
+            {"id": "force", "text": "Force it", "requirements": {"might": 3}, "stat_changes": {"might": -1},
+             "next_situation_id": "yard"},
+            {"id": "study", "text": "Study it", "stat_changes": {"wits": STAT_MAX, "might": 1},
+             "attributes_gained": [{"id": "patient", "description": "Waits things out"}],
+             "next_situation_id": "yard"},
+        ]},
+        "yard": {"title": "Yard", "description": "An empty yard.", "choices": []},
+    }}],
+}
+
+
+async def exchange(port, raw):
+    """Send raw request bytes and return (status, payload) of the response, or None if there was none."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(raw)
+        await writer.drain()
+        status_line = await reader.readline()
+        if not status_line:
+            return None
+        headers = {}
+        while (line := await reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        body = await reader.readexactly(int(headers["content-length"]))
+        return int(status_line.split()[1]), json.loads(body)
+    finally:
+        writer.close()
+
+
+def request(method, path, body=None):
+    raw_body = json.dumps(body).encode() if body is not None else b""
+    return (f"{method} {path} HTTP/1.1\r\nContent-Length: {len(raw_body)}\r\n"
+            f"Connection: close\r\n\r\n").encode() + raw_body
+
+
+def run_server(scenario):
+    """Run scenario(server, port) against a live server."""
+    async def main():
+        server = GameServer(StoryGraph(STORY))
+        listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            return await scenario(server, port)
+    return asyncio.run(main())
+
+
+def test_play_through():
+    async def scenario(server, port):
+        status, created = await exchange(port, request("POST", "/sessions", {"stats": {"might": 5}}))
+        assert status == 201 and created["stats"] == {"might": 5, "wits": 0}
+        assert [choice["available"] for choice in created["choices"]] == [True, True]
+        status, chosen = await exchange(port, request("POST", f"/sessions/{created['session_id']}/choose", {"choice": 1}))
+        assert status == 200 and chosen["stats"]["might"] == 4 and chosen["situation"]["id"] == "yard"
+
+        status, weak = await exchange(port, request("POST", "/sessions", {}))
+        assert status == 201 and weak["stats"] == {"might": 1, "wits": 2}
+        status, _ = await exchange(port, request("POST", f"/sessions/{weak['session_id']}/choose", {"choice": 1}))
+        assert status == 403
+    run_server(scenario)
+
+
+def test_bad_stats_are_rejected():
+    async def scenario(server, port):
+        for stats in ({"might": 99999999999}, {"might": "5"}, {"might": 1.5}, [1, 2]):
+            status, payload = await exchange(port, request("POST", "/sessions", {"stats": stats}))
+            assert status == 400, stats
+        assert not server.sessions
+    run_server(scenario)
+
+
+def test_choice_overflow_clamps_every_stat():
+    async def scenario(server, port):
+        _, created = await exchange(port, request("POST", "/sessions", {"stats": {"wits": 10}}))
+        status, chosen = await exchange(port, request("POST", f"/sessions/{created['session_id']}/choose", {"choice": 2}))
+        assert status == 200
+        assert chosen["stats"] == {"might": 1, "wits": STAT_MAX}
+        assert list(chosen["attributes"]) == ["patient"]
+    run_server(scenario)
+
+
+def test_malformed_requests_get_an_answer():
+    async def scenario(server, port):
+        bad_requests = {
+            b"NONSENSE\r\n\r\n": 400,
+            b"POST /sessions HTTP/1.1\r\nContent-Length: abc\r\n\r\n": 400,
+            b"POST /sessions HTTP/1.1\r\nContent-Length: 2\r\n\r\n[]": 400,
+            b"POST /sessions HTTP/1.1\r\nContent-Length: 3\r\n\r\n{x}": 400,
+            f"POST /sessions HTTP/1.1\r\nContent-Length: {GameServer.max_body_bytes + 1}\r\n\r\n".encode(): 413,
+            b"GET /" + b"a" * 100_000 + b" HTTP/1.1\r\n\r\n": 400,
+            b"GET /stats HTTP/1.1\r\nX-Padding: " + b"a" * 100_000 + b"\r\n\r\n": 431,
+            request("GET", "/nowhere"): 404,
+        }
+        for raw, expected in bad_requests.items():
+            response = await exchange(port, raw)
+            assert response is not None and response[0] == expected, raw[:40]
+        status, stats = await exchange(port, request("GET", "/stats"))
+        assert status == 200 and stats["sessions"] == 0
+    run_server(scenario)